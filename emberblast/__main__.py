@@ -1,10 +1,22 @@
-from colorama import Fore
+import argparse
 import atexit
+import json
+import math
+from typing import List
+
+from colorama import Fore
 
 from emberblast.communicator import communicator_injector
+from emberblast.conf import get_configuration
 from emberblast.game import GameFactory
 from emberblast.interface import IEmberblast
 from emberblast.save import save_game_state_on_exit
+from emberblast.simulation import run_headless_game, run_simulation_batch, format_batch_report, DEFAULT_MAX_TURNS
+from emberblast.utils import GAME_SECTION
+
+# The flags that only configure headless games, with their defaults. None is left to the headless game to decide.
+HEADLESS_DEFAULTS = {'bots': 4, 'map_size': None, 'max_turns': DEFAULT_MAX_TURNS, 'games': 1, 'workers': None,
+                     'seed': None}
 
 
 def exit_handler(orchestrator):
@@ -30,10 +42,80 @@ class Emberblast(IEmberblast):
     __call__ = run
 
 
-if __name__ == '__main__':
-    Emberblast().run()
+def get_minimum_map_size(bots_number: int) -> int:
+    """
+    Get the smallest map size for a number of bots. The walkable tiles of a map are random, so the map must have, on
+    average, twice the walkable tiles needed to place all of them.
+
+    :param int bots_number: The number of bots of the game.
+    :rtype: int
+    """
+    density = get_configuration(GAME_SECTION).get('walkable_density', 0.75)
+    return math.ceil(math.sqrt(2 * bots_number / density))
+
+
+def parse_arguments(arguments: List[str] = None) -> argparse.Namespace:
+    """
+    Parse the command line arguments, by default the game is interactive, and the headless flag runs a bot-only
+    game, printing its result as JSON. The other flags only configure headless games, so they are rejected
+    without it.
+
+    :param List[str] arguments: The arguments to parse, by default the ones from the command line.
+    :rtype: argparse.Namespace
+    """
+    parser = argparse.ArgumentParser(prog='emberblast', description='Emberblast - Python CLI RPG Game')
+    parser.add_argument('--headless', action='store_true', help='run a bot-only game without any interaction')
+    parser.add_argument('--bots', type=int, help='number of bots of a headless game, 4 by default')
+    parser.add_argument('--map-size', type=int, help='size of the map of a headless game')
+    parser.add_argument('--max-turns', type=int,
+                        help='turns after which a headless game ends without a winner, {turns} by default'.format(
+                            turns=DEFAULT_MAX_TURNS))
+    parser.add_argument('--games', type=int,
+                        help='number of headless games, more than one prints a summary of all of them')
+    parser.add_argument('--workers', type=int, help='processes running the headless games')
+    parser.add_argument('--seed', type=int,
+                        help='seed of a headless game, or of the first game of a batch, which by default is 0')
+    parsed_arguments = parser.parse_args(arguments)
+
+    given_flags = ['--{flag}'.format(flag=name.replace('_', '-')) for name in HEADLESS_DEFAULTS
+                   if getattr(parsed_arguments, name) is not None]
+    if given_flags and not parsed_arguments.headless:
+        parser.error('{flags} can only be used with --headless'.format(flags=', '.join(given_flags)))
+    for name, default in HEADLESS_DEFAULTS.items():
+        if getattr(parsed_arguments, name) is None:
+            setattr(parsed_arguments, name, default)
+
+    if parsed_arguments.bots < 2:
+        parser.error('--bots must be at least 2')
+    if parsed_arguments.games < 1:
+        parser.error('--games must be at least 1')
+    if parsed_arguments.max_turns < 1:
+        parser.error('--max-turns must be at least 1')
+    if parsed_arguments.workers is not None and parsed_arguments.workers < 1:
+        parser.error('--workers must be at least 1')
+    map_size = parsed_arguments.map_size
+    if map_size is None:
+        map_size = get_configuration(GAME_SECTION).get('map_size', parsed_arguments.bots + 4)
+    minimum_map_size = get_minimum_map_size(parsed_arguments.bots)
+    if map_size < minimum_map_size:
+        parser.error('the map size must be at least {size} for {bots} bots, use --map-size'.format(
+            size=minimum_map_size, bots=parsed_arguments.bots))
+    return parsed_arguments
 
 
 # pip cmd initializer
 def run_project():
-    Emberblast().run()
+    arguments = parse_arguments()
+    if arguments.headless and arguments.games > 1:
+        result = run_simulation_batch(arguments.games, arguments.bots, arguments.map_size, arguments.max_turns,
+                                      arguments.workers, arguments.seed if arguments.seed is not None else 0)
+        print(format_batch_report(result))
+    elif arguments.headless:
+        result = run_headless_game(arguments.bots, arguments.map_size, arguments.max_turns, arguments.seed)
+        print(json.dumps(result, indent=2))
+    else:
+        Emberblast().run()
+
+
+if __name__ == '__main__':
+    run_project()
@@ -1,7 +1,6 @@
 import collections
 import functools
 import math
-import random
 from typing import List, Optional
 
 from emberblast.communicator import communicator_injector
@@ -141,7 +140,7 @@ class BotDecisioning(IBotDecisioning):
 
         self.communicator.informer.dice_result(self.current_bot.name, dice_result, prefix, self.game.dice_sides)
         dice_result_normalized = dice_result / self.game.dice_sides
-        skill.execute(self.current_bot, foes, dice_result_normalized)
+        skill.execute(self.current_bot, foes, dice_result_normalized, self.game.rng)
 
     def decide_best_defensive_action(self) -> None:
         recovery_choices = {}
@@ -301,11 +300,11 @@ class BotDecisioning(IBotDecisioning):
                     aggressive_possibilities = self.game.game_map.graph.get_available_nodes_in_range(
                         possible_foe.position,
                         attack_range)
-                    best_position = random.choice(aggressive_possibilities)
+                    best_position = self.game.rng.choice(aggressive_possibilities)
                     self.game.game_map.move_player(self.current_bot, best_position)
                 self.possible_foe = possible_foe
         if self.current_play_style == IPlayingMode.NEUTRAL:
-            random_position = random.choice(possibilities)
+            random_position = self.game.rng.choice(possibilities)
             self.game.game_map.move_player(self.current_bot, random_position)
         self.communicator.informer.event('move')
         self.communicator.informer.moved(self.current_bot.name)
@@ -1,6 +1,8 @@
 from .level_up import improve_attributes_automatically, \
     improve_attributes_randomly
 
-from .communicator import communicator_injector
+from .communicator import communicator_injector, get_communicator, set_communicator
+from .communicator_headless import CommunicatorHeadless
 
-__all__ = ['improve_attributes_automatically', 'improve_attributes_randomly', 'communicator_injector']
+__all__ = ['improve_attributes_automatically', 'improve_attributes_randomly', 'communicator_injector',
+           'get_communicator', 'set_communicator', 'CommunicatorHeadless']
@@ -1,14 +1,18 @@
 import sys
-from typing import Callable, Type
+from typing import Callable, Type, List
 
 from emberblast.interface.interface import ICommunicator
 from .communicator_cmd import CommunicatorCMD
 
+# The classes that received the communicator, so it can be replaced on all of them, like in headless games.
+injected_classes: List[Type] = []
+
 
 def communicator_injector() -> Callable:
     def decorator(cls) -> Type:
         attr_name = 'communicator'
         setattr(cls, attr_name, communicator)
+        injected_classes.append(cls)
         return cls
 
     return decorator
@@ -19,4 +23,27 @@ def communicator_factory() -> ICommunicator:
         return CommunicatorCMD()
 
 
+def get_communicator() -> ICommunicator:
+    """
+    Get the communicator that is currently injected in the classes.
+
+    :rtype: ICommunicator
+    """
+    return communicator
+
+
+def set_communicator(new_communicator: ICommunicator) -> None:
+    """
+    Replace the communicator of all the classes that were decorated with communicator_injector, and the ones that
+    will be decorated after it.
+
+    :param ICommunicator new_communicator: The communicator to be used.
+    :rtype: None
+    """
+    global communicator
+    communicator = new_communicator
+    for cls in injected_classes:
+        setattr(cls, 'communicator', new_communicator)
+
+
 communicator: ICommunicator = communicator_factory()
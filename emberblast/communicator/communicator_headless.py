@@ -0,0 +1,206 @@
+from pathlib import Path
+from typing import List, Union, Dict, Optional
+
+from emberblast.exception import HeadlessModeError
+from emberblast.interface.interface import ICommunicator, IInformingSystem, IQuestioningSystem, IPlayer, ISkill, \
+    ISideEffect, IItem, IEquipmentItem
+
+HEADLESS_QUESTION_MESSAGE = 'Headless games can not ask questions, but {question} was asked'
+
+
+class InformerHeadless(IInformingSystem):
+
+    def __init__(self) -> None:
+        """
+        Informer for games without a terminal, like bot-only simulations. Nothing is printed, and there are no loading
+        animations, instead it keeps the statistics of the game, so they can be reported when it ends.
+
+        :rtype: None
+        """
+        super().__init__()
+        self.turns = 0
+        self.winner: Optional[str] = None
+        self.damage_dealt: Dict[IPlayer, int] = {}
+        self.damage_taken: Dict[IPlayer, int] = {}
+        self.kills: Dict[IPlayer, int] = {}
+        self.errors: List[str] = []
+
+    def greetings(self) -> None:
+        pass
+
+    def new_turn(self, turn: int) -> None:
+        self.turns = turn
+
+    def player_turn(self, name: str) -> None:
+        pass
+
+    def player_earned_xp(self, player_name: str, xp: int) -> None:
+        pass
+
+    def moved(self, player_name: str) -> None:
+        pass
+
+    def player_killed_enemy_earned_xp(self, player_name: str, foe: str, xp: int) -> None:
+        pass
+
+    def player_level_up(self, player_name: str, level: int) -> None:
+        pass
+
+    def player_stats(self, player: IPlayer) -> None:
+        pass
+
+    def enemy_status(self, enemy: IPlayer) -> None:
+        pass
+
+    def plain_matrix(self, matrix: List[List[int]]) -> None:
+        pass
+
+    def plain_map(self, matrix: List[List[int]], size: int) -> None:
+        pass
+
+    def map_info(self, player: IPlayer, players: List[IPlayer], matrix: List[List[int]], size: int) -> None:
+        pass
+
+    def moving_possibilities(self, player_position: str, possibilities: List[str], matrix: List[List[int]],
+                             size: int) -> None:
+        pass
+
+    def found_item(self, player_name: str, found: bool = False, item_tier: str = None, item_name: str = None) -> None:
+        pass
+
+    def no_foes_attack(self, player: IPlayer) -> None:
+        pass
+
+    def no_foes_skill(self, skill_range: int, player_position: str) -> None:
+        pass
+
+    def area_damage(self, skill: ISkill, affected_players: List[IPlayer]) -> None:
+        pass
+
+    def spent_mana(self, name: str, amount: int, skill_name: str) -> None:
+        pass
+
+    def add_side_effect(self, name: str, side_effect: ISideEffect) -> None:
+        pass
+
+    def side_effect_ended(self, name: str, side_effect: ISideEffect) -> None:
+        pass
+
+    def iterated_side_effect_apply(self, name: str, side_effect: ISideEffect) -> None:
+        pass
+
+    def low_mana(self, player: IPlayer) -> None:
+        pass
+
+    def missed(self, player: IPlayer, foe: IPlayer) -> None:
+        pass
+
+    def trap_activated(self, player: IPlayer, side_effects: List[ISideEffect]) -> None:
+        pass
+
+    def suffer_damage(self, attacker: IPlayer, foe: IPlayer, damage: int) -> None:
+        self.damage_dealt[attacker] = self.damage_dealt.get(attacker, 0) + damage
+        self.damage_taken[foe] = self.damage_taken.get(foe, 0) + damage
+        if not foe.is_alive():
+            self.kills[attacker] = self.kills.get(attacker, 0) + 1
+
+    def dice_result(self, name: str, result: int, kind: str, max_sides: int) -> None:
+        pass
+
+    def use_item(self, player_name: str, item_name: str, target_name: str) -> None:
+        pass
+
+    def player_fail_stole_item(self, name: str, foe_name: str) -> None:
+        pass
+
+    def player_stole_item(self, name: str, foe_name: str, item_name: str, tier: str) -> None:
+        pass
+
+    def player_won(self, name: str) -> None:
+        self.winner = name
+
+    def create_new_character(self, number: int) -> None:
+        pass
+
+    def check_item(self, item: IItem) -> None:
+        pass
+
+    def event(self, event: str) -> None:
+        pass
+
+    def new_line(self) -> None:
+        pass
+
+    def line_separator(self) -> None:
+        pass
+
+    def force_loading(self, loading_time: int, prefix: str = '', prefix_attributes: List[str] = None) -> None:
+        pass
+
+    def clear(self) -> None:
+        pass
+
+    def died_from_side_effects(self, player: IPlayer, caster: Optional[IPlayer]) -> None:
+        if caster is not None:
+            self.kills[caster] = self.kills.get(caster, 0) + 1
+
+    def unexpected_error(self, error: Exception) -> None:
+        self.errors.append('{kind}: {error}'.format(kind=type(error).__name__, error=error))
+
+
+class QuestionerHeadless(IQuestioningSystem):
+    """
+    Headless games only have bots, which take their own decisions, so any question means that a controlled player
+    ended up in a headless game.
+    """
+
+    def ask_check_action(self, show_items: bool = False) -> Union[str, bool, list]:
+        raise HeadlessModeError(HEADLESS_QUESTION_MESSAGE.format(question='ask_check_action'))
+
+    def ask_actions_questions(self, actions_available: List[str]) -> Union[str, bool, list]:
+        raise HeadlessModeError(HEADLESS_QUESTION_MESSAGE.format(question='ask_actions_questions'))
+
+    def ask_enemy_to_check(self, enemies: List[IPlayer]) -> Union[str, bool, list, IPlayer]:
+        raise HeadlessModeError(HEADLESS_QUESTION_MESSAGE.format(question='ask_enemy_to_check'))
+
+    def ask_enemy_to_attack(self, enemies: List[IPlayer], skill_type: str = '') -> Union[str, bool, list, IPlayer]:
+        raise HeadlessModeError(HEADLESS_QUESTION_MESSAGE.format(question='ask_enemy_to_attack'))
+
+    def select_item(self, items: List[IItem]) -> Union[str, bool, list, IItem]:
+        raise HeadlessModeError(HEADLESS_QUESTION_MESSAGE.format(question='select_item'))
+
+    def confirm_item_selection(self) -> Union[str, bool, list]:
+        raise HeadlessModeError(HEADLESS_QUESTION_MESSAGE.format(question='confirm_item_selection'))
+
+    def confirm_use_item_on_you(self) -> Union[str, bool, list]:
+        raise HeadlessModeError(HEADLESS_QUESTION_MESSAGE.format(question='confirm_use_item_on_you'))
+
+    def display_equipment_choices(self, player: IPlayer) -> Union[str, bool, list, IEquipmentItem]:
+        raise HeadlessModeError(HEADLESS_QUESTION_MESSAGE.format(question='display_equipment_choices'))
+
+    def ask_attributes_to_improve(self) -> Union[str, bool, list, List]:
+        raise HeadlessModeError(HEADLESS_QUESTION_MESSAGE.format(question='ask_attributes_to_improve'))
+
+    def ask_where_to_move(self, possibilities: List[str]) -> Union[str, bool, list]:
+        raise HeadlessModeError(HEADLESS_QUESTION_MESSAGE.format(question='ask_where_to_move'))
+
+    def perform_first_question(self) -> Union[str, bool, list]:
+        raise HeadlessModeError(HEADLESS_QUESTION_MESSAGE.format(question='perform_first_question'))
+
+    def perform_game_create_questions(self) -> Union[str, bool, list, dict]:
+        raise HeadlessModeError(HEADLESS_QUESTION_MESSAGE.format(question='perform_game_create_questions'))
+
+    def select_skill(self, available_skills: List[ISkill]) -> Union[str, bool, list, ISkill]:
+        raise HeadlessModeError(HEADLESS_QUESTION_MESSAGE.format(question='select_skill'))
+
+    def get_saved_game(self, normalized_files: List[Dict]) -> Union[str, bool, list, Path]:
+        raise HeadlessModeError(HEADLESS_QUESTION_MESSAGE.format(question='get_saved_game'))
+
+    def perform_character_creation_questions(self, existing_names: List[str]) -> Union[str, bool, list, dict]:
+        raise HeadlessModeError(HEADLESS_QUESTION_MESSAGE.format(question='perform_character_creation_questions'))
+
+
+class CommunicatorHeadless(ICommunicator):
+    def __init__(self) -> None:
+        self.informer = InformerHeadless()
+        self.questioner = QuestionerHeadless()
@@ -1,16 +1,17 @@
-import multiprocessing
 import os
+import threading
 import time
-from typing import List
+from typing import List, Optional
 
 import timg
 from colorama import Fore
 from emojis import emojis
 from termcolor import colored
 
+from emberblast.conf import get_configuration
 from emberblast.interface import IInformingSystem, IPlayer, ISkill, ISideEffect, IItem, IEquipmentItem, IRecoveryItem, \
     IHealingItem
-from emberblast.utils import get_project_root, convert_number_to_letter
+from emberblast.utils import get_project_root, convert_number_to_letter, convert_coordinates_to_position, GAME_SECTION
 
 
 class InformerCMD(IInformingSystem):
@@ -35,6 +36,9 @@ class InformerCMD(IInformingSystem):
         print(emojis.encode(
             f':man: {name} Time! \n'))
 
+    def new_line(self) -> None:
+        print('\n')
+
     def line_separator(self) -> None:
         """
         Display that an user executed one of the available actions
@@ -150,7 +154,7 @@ class InformerCMD(IInformingSystem):
             for column in range(size):
                 color = 'white'
                 attrs = ['bold']
-                position = convert_number_to_letter(row) + str(column)
+                position = convert_coordinates_to_position(row, column)
 
                 if player.position == position:
                     color = 'green'
@@ -174,7 +178,7 @@ class InformerCMD(IInformingSystem):
             for column in range(size):
                 color = 'white'
                 attrs = ['bold']
-                position = convert_number_to_letter(row) + str(column)
+                position = convert_coordinates_to_position(row, column)
 
                 if position in possibilities:
                     color = 'green'
@@ -384,15 +388,27 @@ class InformerCMD(IInformingSystem):
     def force_loading(self, loading_time: int, prefix: str = '', prefix_attributes: List[str] = None) -> None:
         if prefix != '':
             print(colored(prefix, None, attrs=prefix_attributes))
-        p = multiprocessing.Process(target=print_loading)
-        p.start()
+        loading_time = loading_time * get_configuration(GAME_SECTION).get('turn_pacing', 1)
+        if loading_time <= 0:
+            return
+
+        stop_loading = threading.Event()
+        loading_thread = threading.Thread(target=print_loading, args=(stop_loading,), daemon=True)
+        loading_thread.start()
+        time.sleep(loading_time)
+        stop_loading.set()
+        loading_thread.join()
+        print(" " * len(animation[0]), end="\r")
 
-        p.join(loading_time)
+    def clear(self) -> None:
+        os.system('clear')
 
-        # If thread is still active
-        if p.is_alive():
-            p.kill()
-            print(" " * len(animation[0]), end="\r")
+    def died_from_side_effects(self, player: IPlayer, caster: Optional[IPlayer]) -> None:
+        print(colored('\t{name} died from side effects'.format(name=player.name), 'red'))
+
+    def unexpected_error(self, error: Exception) -> None:
+        print(error)
+        print(Fore.RED + 'System shutdown with unexpected error')
 
 
 animation = [
@@ -419,12 +435,10 @@ animation = [
 ]
 
 
-def print_loading() -> None:
-    notcomplete = True
-
+def print_loading(stop_loading: threading.Event) -> None:
     i = 0
 
-    while notcomplete:
+    while not stop_loading.is_set():
         print(animation[i % len(animation)], end='\r')
-        time.sleep(.05)
+        stop_loading.wait(.05)
         i += 1
@@ -1,3 +1,8 @@
+import hashlib
+import os
+import pickle
+from typing import Dict, List
+
 import yaml
 from yaml.scanner import ScannerError
 from cerberus import Validator, SchemaError
@@ -13,6 +18,16 @@ from emberblast.utils import get_project_root, deep_get
 from emberblast.exception import ConfigFileError
 from ..utils.constants import EXPERIENCE_EARNED_ACTION
 
+CONFIGURATION_FILES = ['conf.yaml', 'side_effects.yaml', 'items.yaml', 'skills.yaml']
+CONFIGURATION_SNAPSHOT_FILE = 'configuration_snapshot_{checkout}.pickle'
+# Increase it whenever the content of the snapshot changes, so old snapshots are rebuilt.
+CONFIGURATION_SNAPSHOT_VERSION = 1
+SNAPSHOT_ATTRIBUTES = ['parsed_yaml_file', 'game', 'jobs', 'races', 'level_up_attributes_increment',
+                       'experience_earned_action', 'side_effects', 'items', 'skills', 'item_probabilities']
+
+# The C loader is much faster, but it's only available when PyYAML was built with libyaml.
+YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
 
 class Configuration(object):
     def __init__(self, arg) -> None:
@@ -39,7 +54,9 @@ class Configuration(object):
         self.custom_races = {}
         self.item_probabilities = {}
         try:
-            self.parse_configuration_files()
+            if not self.load_configuration_snapshot():
+                self.parse_configuration_files()
+                self.save_configuration_snapshot()
         except OSError as err:
             self._logger.error(err)
             raise SystemExit('Could not open the game configuration file')
@@ -66,23 +83,63 @@ class Configuration(object):
 
         :rtype: None
         """
-        project_root = str(get_project_root())
-        config_yaml_file = open(str(get_project_root()) + '/conf/conf.yaml')
-        self.parsed_yaml_file = yaml.load(config_yaml_file, Loader=yaml.FullLoader)
+        self.parsed_yaml_file = load_yaml_file('conf.yaml')
         self.validate_config_file()
 
-        side_effects_yaml_file = open(str(get_project_root()) + '/conf/side_effects.yaml')
-        self.side_effects = yaml.load(side_effects_yaml_file, Loader=yaml.FullLoader)
+        self.side_effects = load_yaml_file('side_effects.yaml')
         self.validate_side_effects()
 
-        items_yaml_file = open(str(get_project_root()) + '/conf/items.yaml')
-        self.items = yaml.load(items_yaml_file, Loader=yaml.FullLoader)
+        self.items = load_yaml_file('items.yaml')
         self.validate_items()
 
-        skills_yaml_file = open(str(get_project_root()) + '/conf/skills.yaml')
-        self.skills = yaml.load(skills_yaml_file, Loader=yaml.FullLoader)
+        self.skills = load_yaml_file('skills.yaml')
         self.validate_skills()
 
+    def load_configuration_snapshot(self) -> bool:
+        """
+        Parsing and validating the yaml files is the slowest part of starting the game, so the validated
+        configuration is kept in a snapshot, which is loaded instead while none of the configuration files, or
+        the schemas, have changed. Returns True if the snapshot was loaded.
+
+        :rtype: bool
+        """
+        try:
+            with open(get_configuration_snapshot_path(), 'rb') as snapshot_file:
+                snapshot = pickle.load(snapshot_file)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+            return False
+
+        if not isinstance(snapshot, dict) or snapshot.get('version') != CONFIGURATION_SNAPSHOT_VERSION or \
+                not is_snapshot_fingerprint_valid(snapshot.get('fingerprint', {})):
+            return False
+
+        for attribute in SNAPSHOT_ATTRIBUTES:
+            setattr(self, attribute, snapshot.get('configuration').get(attribute))
+        return True
+
+    def save_configuration_snapshot(self) -> None:
+        """
+        Save the validated configuration as a snapshot, for the next launches. The game works normally without
+        it, so when it can't be written, like in a read-only installation, it's only logged.
+
+        :rtype: None
+        """
+        snapshot = {
+            'version': CONFIGURATION_SNAPSHOT_VERSION,
+            'fingerprint': get_configuration_fingerprint(),
+            'configuration': {attribute: getattr(self, attribute) for attribute in SNAPSHOT_ATTRIBUTES}
+        }
+        snapshot_path = get_configuration_snapshot_path()
+        temporary_path = '{path}.{pid}'.format(path=snapshot_path, pid=os.getpid())
+        try:
+            os.makedirs(os.path.dirname(snapshot_path), exist_ok=True)
+            with open(temporary_path, 'wb') as snapshot_file:
+                pickle.dump(snapshot, snapshot_file, protocol=pickle.HIGHEST_PROTOCOL)
+            # Replacing it at once, so another game starting at the same time never reads a partial snapshot.
+            os.replace(temporary_path, snapshot_path)
+        except (OSError, pickle.PicklingError) as err:
+            self._logger.warning('Could not save the configuration snapshot: {error}'.format(error=err))
+
     def validate_config_file(self) -> None:
         """
         There are many yaml configuration files, the conf.yaml, items.yaml, side_effects.yaml and
@@ -287,6 +344,90 @@ class Configuration(object):
                 'The sum of all the probabilities of the items_probabilities must be 1, which is 100%')
 
 
+def load_yaml_file(file_name: str) -> Dict:
+    """
+    Parse one of the yaml files from the conf directory.
+
+    :param str file_name: The name of the file.
+    :rtype: Dict
+    """
+    with open(get_configuration_file_paths([file_name])[0]) as yaml_file:
+        return yaml.load(yaml_file, Loader=YAML_LOADER)
+
+
+def get_configuration_file_paths(file_names: List[str] = None) -> List[str]:
+    """
+    Get the paths of the configuration files, by default all the ones that are parsed, plus the schemas used to
+    validate them and this module, which validates them, as changing any of them requires validating the
+    configuration again.
+
+    :param List[str] file_names: The names of the files in the conf directory.
+    :rtype: List[str]
+    """
+    if file_names is None:
+        file_names = CONFIGURATION_FILES + ['schema.py', 'conf.py']
+    return ['{root}/conf/{file}'.format(root=str(get_project_root()), file=file_name) for file_name in file_names]
+
+
+def get_configuration_snapshot_path() -> str:
+    """
+    Get the path of the snapshot of the validated configuration, in the user cache directory, as the package
+    directory may be read-only. Each installation of the game has its own snapshot, named after its directory.
+
+    :rtype: str
+    """
+    cache_directory = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    checkout = hashlib.sha256(str(get_project_root()).encode()).hexdigest()[:16]
+    return os.path.join(cache_directory, 'emberblast', CONFIGURATION_SNAPSHOT_FILE.format(checkout=checkout))
+
+
+def get_file_hash(path: str) -> str:
+    """
+    Get the sha256 hash of the content of a file.
+
+    :param str path: The path of the file.
+    :rtype: str
+    """
+    with open(path, 'rb') as hashed_file:
+        return hashlib.sha256(hashed_file.read()).hexdigest()
+
+
+def get_configuration_fingerprint() -> Dict[str, Dict]:
+    """
+    Get the modification time, size and hash of each one of the configuration files.
+
+    :rtype: Dict[str, Dict]
+    """
+    fingerprint = {}
+    for path in get_configuration_file_paths():
+        status = os.stat(path)
+        fingerprint[path] = {'mtime': status.st_mtime_ns, 'size': status.st_size, 'hash': get_file_hash(path)}
+    return fingerprint
+
+
+def is_snapshot_fingerprint_valid(fingerprint: Dict[str, Dict]) -> bool:
+    """
+    Check if the configuration files are still the same of when the snapshot was saved. Checking the modification
+    time and size is enough most of the times, the files are only hashed when they differ, so touching a file
+    without changing it doesn't invalidate the snapshot.
+
+    :param Dict[str, Dict] fingerprint: The fingerprint saved in the snapshot.
+    :rtype: bool
+    """
+    paths = get_configuration_file_paths()
+    if sorted(paths) != sorted(fingerprint.keys()):
+        return False
+
+    for path in paths:
+        saved = fingerprint.get(path)
+        status = os.stat(path)
+        if status.st_mtime_ns == saved.get('mtime') and status.st_size == saved.get('size'):
+            continue
+        if status.st_size != saved.get('size') or get_file_hash(path) != saved.get('hash'):
+            return False
+    return True
+
+
 @Configuration
 def get_configuration():
     pass
@@ -26,6 +26,33 @@ game_section_configuration_schema = {
         'min': 2,
         'max': 50
     },
+    'map_generation': {
+        'required': False,
+        'type': 'string',
+        'allowed': ['connected', 'rejection']
+    },
+    'map_size': {
+        'required': False,
+        'type': 'integer',
+        'min': 1,
+        'max': 500
+    },
+    'walkable_density': {
+        'required': False,
+        'type': 'float',
+        'min': 0.05,
+        'max': 1
+    },
+    'turn_pacing': {
+        'required': False,
+        'type': 'number',
+        'min': 0
+    },
+    'spawn_mode': {
+        'required': False,
+        'type': 'string',
+        'allowed': ['random', 'spread']
+    },
     "level_up_attributes_increment": {
         'required': True,
         'type': 'dict',
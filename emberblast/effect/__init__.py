@@ -1,3 +1,5 @@
-from .side_effects import SideEffect, instantiate_side_effects
+from .side_effects import SideEffectTemplate, SideEffect, SideEffectContainer, get_side_effect_template, \
+    instantiate_side_effects
 
-__all__ = ['SideEffect', 'instantiate_side_effects']
+__all__ = ['SideEffectTemplate', 'SideEffect', 'SideEffectContainer', 'get_side_effect_template',
+           'instantiate_side_effects']
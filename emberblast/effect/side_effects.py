@@ -1,10 +1,46 @@
-from typing import List
+import functools
+from typing import List, Dict, Optional, Iterator, Any, Tuple
 
 from emberblast.conf import get_configuration
-from emberblast.interface import ISideEffect
+from emberblast.interface import ISideEffectTemplate, ISideEffect, ISideEffectContainer, IPlayer
+from emberblast.utils import SIDE_EFFECTS_SECTION, intern_string
+
+
+class SideEffectTemplate(ISideEffectTemplate):
+    __slots__ = ('name', 'effect_type', 'attribute', 'base', 'duration', 'occurrence')
+
+    def __init__(self, name: str, effect_type: str, attribute: str, base: int, duration: int, occurrence: str) -> None:
+        """
+        Constructor of SideEffectTemplate, a side effect as written in side_effects.yaml. A SideEffect only keeps
+        its remaining duration, owner and caster on top of it, so the template itself is frozen. Its strings go
+        through intern_string.
+
+        :param str name: The name of the side-effect.
+        :param str effect_type: The type of it, if it's a debuff or buff.
+        :param str attribute: The attribute that the effect will change.
+        :param int base: The quantity of the attribute that will be changed.
+        :param int duration: The number of turns that this effect stays.
+        :param str occurrence: If it applies one single time, or every turn.
+
+        :rtype: None.
+        """
+        object.__setattr__(self, 'name', intern_string(name))
+        object.__setattr__(self, 'effect_type', intern_string(effect_type))
+        object.__setattr__(self, 'attribute', intern_string(attribute))
+        object.__setattr__(self, 'base', base)
+        object.__setattr__(self, 'duration', duration)
+        object.__setattr__(self, 'occurrence', intern_string(occurrence))
+
+    def __setattr__(self, key: str, value: Any) -> None:
+        raise AttributeError(f'Side effect template {self.name} can\'t be changed')
+
+    def __reduce__(self) -> Tuple:
+        return SideEffectTemplate, (self.name, self.effect_type, self.attribute, self.base, self.duration,
+                                    self.occurrence)
 
 
 class SideEffect(ISideEffect):
+    __slots__ = ('template', 'owner', 'caster', '_duration')
 
     def __init__(self, name: str, effect_type: str, attribute: str, base: int, duration: int, occurrence: str) -> None:
         """
@@ -19,34 +55,269 @@ class SideEffect(ISideEffect):
 
         :rtype: None.
         """
-        self.name = name
-        self.effect_type = effect_type
-        self.attribute = attribute
-        self.base = base
-        self.duration = duration
-        self.occurrence = occurrence
+        self.template: ISideEffectTemplate = SideEffectTemplate(name, effect_type, attribute, base, duration,
+                                                                occurrence)
+        self.owner: Optional[ISideEffectContainer] = None
+        # The player that cast the side effect, who gets the kill if the side effect kills someone.
+        self.caster: Optional[IPlayer] = None
+        self._duration = duration
+
+    @classmethod
+    def from_template(cls, template: ISideEffectTemplate) -> 'SideEffect':
+        """
+        Instantiate a side effect from its template, with the full duration, only the duration and the owner are
+        kept by each side effect.
+
+        :param ISideEffectTemplate template: The template of the side effect.
+        :rtype: SideEffect
+        """
+        side_effect = cls.__new__(cls)
+        side_effect.template = template
+        side_effect.owner = None
+        side_effect.caster = None
+        side_effect._duration = template.duration
+        return side_effect
+
+    def new_instance(self, caster: Optional[IPlayer] = None) -> ISideEffect:
+        """
+        Instantiate a new side effect from the same template, so each player that gets it counts its own duration.
+
+        :param Optional[IPlayer] caster: The player that cast the side effect.
+        :rtype: ISideEffect
+        """
+        side_effect = SideEffect.from_template(self.template)
+        side_effect.caster = caster
+        return side_effect
+
+    @property
+    def name(self) -> str:
+        return self.template.name
+
+    @property
+    def effect_type(self) -> str:
+        return self.template.effect_type
+
+    @property
+    def attribute(self) -> str:
+        return self.template.attribute
+
+    @property
+    def base(self) -> int:
+        return self.template.base
+
+    @property
+    def occurrence(self) -> str:
+        return self.template.occurrence
+
+    @property
+    def duration(self) -> int:
+        """
+        The remaining turns of the side effect. While it's in a container, the container is the one counting them.
+
+        :rtype: int
+        """
+        if self.owner is not None:
+            return self.owner.get_remaining_duration(self)
+        return self._duration
+
+    @duration.setter
+    def duration(self, duration: int) -> None:
+        if self.owner is not None:
+            self.owner.set_remaining_duration(self, duration)
+        else:
+            self._duration = duration
+
+    def __getstate__(self) -> Tuple[None, Dict]:
+        # The container sets itself as the owner again when it's loaded, with the remaining duration.
+        return None, {'template': self.template, 'owner': None, 'caster': self.caster,
+                      '_duration': self._duration}
+
+
+class SideEffectContainer(ISideEffectContainer):
+
+    def __init__(self) -> None:
+        """
+        Constructor of SideEffectContainer, that keeps the side effects of a player indexed in a few ways, so each
+        operation only touches the side effects it's about: by name, for replacing or recovering from a status, by
+        occurrence, as only the iterated ones are applied every turn, and by the turn they expire, like a timing wheel,
+        so ticking a turn only goes through the side effects that end in it.
+
+        The side effects are identified by their instance, as the same side effect can be added more than once, like
+        from two equipments.
+
+        :rtype: None
+        """
+        self.turn = 0
+        # Increased every time a side effect is added or removed.
+        self.version = 0
+        self.side_effects: Dict[int, ISideEffect] = {}
+        self.names: Dict[str, Dict[int, ISideEffect]] = {}
+        self.occurrences: Dict[str, Dict[int, ISideEffect]] = {'constant': {}, 'iterated': {}}
+        self.expiry_turns: Dict[int, int] = {}
+        self.expiring: Dict[int, Dict[int, ISideEffect]] = {}
+
+    def __getstate__(self) -> Dict:
+        side_effects = [(side_effect, self.expiry_turns[key]) for key, side_effect in self.side_effects.items()]
+        return {'turn': self.turn, 'version': self.version, 'side_effects': side_effects}
+
+    def __setstate__(self, state: Dict) -> None:
+        # The side effects are indexed by their instances, which change when a saved game is loaded, so the indexes
+        # are built again from the saved side effects.
+        self.__init__()
+        self.turn = state['turn']
+        for side_effect, expiry_turn in state['side_effects']:
+            self.append(side_effect)
+            self.set_remaining_duration(side_effect, expiry_turn - self.turn)
+        self.version = state['version']
+
+    def __iter__(self) -> Iterator[ISideEffect]:
+        return iter(list(self.side_effects.values()))
+
+    def __len__(self) -> int:
+        return len(self.side_effects)
+
+    def __contains__(self, side_effect: ISideEffect) -> bool:
+        return id(side_effect) in self.side_effects
+
+    def add(self, side_effect: ISideEffect) -> None:
+        """
+        Add a side effect, replacing the one with the same name, if there is one, so casting the same side effect
+        again restarts it.
+
+        :param ISideEffect side_effect: The side effect to be added.
+        :rtype: None
+        """
+        existing_side_effect = self.get(side_effect.name)
+        if existing_side_effect is not None:
+            self.remove(existing_side_effect)
+        self.append(side_effect)
+
+    def append(self, side_effect: ISideEffect) -> None:
+        """
+        Add a side effect, even if there is another one with the same name.
+
+        :param ISideEffect side_effect: The side effect to be added.
+        :rtype: None
+        """
+        if side_effect in self:
+            return
+        duration = side_effect.duration
+        key = id(side_effect)
+        self.side_effects[key] = side_effect
+        self.names.setdefault(side_effect.name, {})[key] = side_effect
+        self.occurrences.setdefault(side_effect.occurrence, {})[key] = side_effect
+        side_effect.owner = self
+        self.set_remaining_duration(side_effect, duration)
+        self.version = self.version + 1
+
+    def remove(self, side_effect: ISideEffect) -> None:
+        """
+        Remove a side effect, if it's in the container, keeping its remaining duration in the side effect.
+
+        :param ISideEffect side_effect: The side effect to be removed.
+        :rtype: None
+        """
+        key = id(side_effect)
+        if key not in self.side_effects:
+            return
+        duration = self.get_remaining_duration(side_effect)
+        del self.side_effects[key]
+        del self.names[side_effect.name][key]
+        if len(self.names[side_effect.name]) == 0:
+            del self.names[side_effect.name]
+        del self.occurrences[side_effect.occurrence][key]
+        self.expiring.get(self.expiry_turns.pop(key), {}).pop(key, None)
+        if side_effect.owner is self:
+            side_effect.owner = None
+            side_effect.duration = duration
+        self.version = self.version + 1
+
+    def get(self, name: str) -> Optional[ISideEffect]:
+        """
+        Get the first side effect added with a name.
+
+        :param str name: The name of the side effect.
+        :rtype: Optional[ISideEffect]
+        """
+        side_effects = self.names.get(name)
+        if not side_effects:
+            return None
+        return next(iter(side_effects.values()))
+
+    def get_by_occurrence(self, occurrence: str) -> List[ISideEffect]:
+        """
+        Get the side effects that are applied one single time(constant), or every turn(iterated).
+
+        :param str occurrence: The occurrence of the side effects.
+        :rtype: List[ISideEffect]
+        """
+        return list(self.occurrences.get(occurrence, {}).values())
+
+    def get_remaining_duration(self, side_effect: ISideEffect) -> int:
+        """
+        Get how many turns a side effect of the container still lasts.
+
+        :param ISideEffect side_effect: The side effect.
+        :rtype: int
+        """
+        return self.expiry_turns[id(side_effect)] - self.turn
+
+    def set_remaining_duration(self, side_effect: ISideEffect, duration: int) -> None:
+        """
+        Change how many turns a side effect of the container still lasts, moving it to the bucket of its new expiry
+        turn. A side effect always lasts at least until the next turn.
+
+        :param ISideEffect side_effect: The side effect.
+        :param int duration: The remaining turns.
+        :rtype: None
+        """
+        key = id(side_effect)
+        if key in self.expiry_turns:
+            self.expiring.get(self.expiry_turns[key], {}).pop(key, None)
+        expiry_turn = self.turn + max(duration, 1)
+        self.expiry_turns[key] = expiry_turn
+        self.expiring.setdefault(expiry_turn, {})[key] = side_effect
+
+    def tick(self) -> List[ISideEffect]:
+        """
+        Advance one turn, removing and returning the side effects that ended on it.
+
+        :rtype: List[ISideEffect]
+        """
+        self.turn = self.turn + 1
+        ended_side_effects = list(self.expiring.pop(self.turn, {}).values())
+        for side_effect in ended_side_effects:
+            self.remove(side_effect)
+        return ended_side_effects
+
+
+@functools.lru_cache(maxsize=None)
+def get_side_effect_template(name: str) -> ISideEffectTemplate:
+    """
+    Get the template of a side effect by its name in the side_effects.yaml file. Cached by name, so the skills,
+    traps and equipments that cast the same side effect share its template.
+
+    :param str name: The name of the side effect.
+    :rtype: ISideEffectTemplate
+    """
+    side_effect_dict = get_configuration(SIDE_EFFECTS_SECTION).get(name)
+    return SideEffectTemplate(name=name,
+                              effect_type=side_effect_dict.get('type'),
+                              attribute=side_effect_dict.get('attribute'),
+                              base=side_effect_dict.get('base'),
+                              duration=side_effect_dict.get('duration'),
+                              occurrence=side_effect_dict.get('occurrence'))
 
 
 def instantiate_side_effects(side_effects_strings: List[str]) -> List[ISideEffect]:
     """
     This class will receive a list of strings that represents the names of each side-effects, those names of
-    side-effects will be queried from the configuration, and instantiated to be ready to use.
+    side-effects will be queried from the configuration, and instantiated to be ready to use. All the side effects
+    with the same name share their template.
 
     :param List[str] side_effects_strings: List with the name os the effects.
 
     :rtype: List[ISideEffect].
     """
-    side_effects_library_dict = get_configuration('side_effects')
-    side_effects: List[SideEffect] = []
-
-    for side_effect_string in side_effects_strings:
-        side_effect_dict = side_effects_library_dict.get(side_effect_string)
-        side_effect = SideEffect(name=side_effect_string,
-                                 effect_type=side_effect_dict.get('type'),
-                                 attribute=side_effect_dict.get('attribute'),
-                                 base=side_effect_dict.get('base'),
-                                 duration=side_effect_dict.get('duration'),
-                                 occurrence=side_effect_dict.get('occurrence'))
-        side_effects.append(side_effect)
-
-    return side_effects
+    return [SideEffect.from_template(get_side_effect_template(side_effect_string))
+            for side_effect_string in side_effects_strings]
@@ -1,3 +1,3 @@
-from .exception import ConfigFileError
+from .exception import ConfigFileError, HeadlessModeError
 
-__all__ = ['ConfigFileError']
+__all__ = ['ConfigFileError', 'HeadlessModeError']
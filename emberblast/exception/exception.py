@@ -3,3 +3,8 @@
 class ConfigFileError(Exception):
     """Base class for other exceptions"""
     pass
+
+
+class HeadlessModeError(Exception):
+    """Raised when a headless game needs an answer that only a human player could give"""
+    pass
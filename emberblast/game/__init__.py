@@ -1,4 +1,5 @@
 from .game import Game, DeathMatch
+from .player_state import PlayerStateStore
 from .game_factory import GameFactory, bot_factory
 
-__all__ = ['Game', 'DeathMatch', 'GameFactory', 'bot_factory']
+__all__ = ['Game', 'DeathMatch', 'PlayerStateStore', 'GameFactory', 'bot_factory']
@@ -1,27 +1,31 @@
 import functools
 import random
-from typing import List
-
-from numpy.random import choice
+from typing import List, Tuple
 
 from emberblast.conf import get_configuration
 from emberblast.utils import GAME_SECTION
-from emberblast.interface import IPlayer, IMap, IGame
+from emberblast.interface import IPlayer, IMap, IGame, ISideEffect
+from .player_state import PlayerStateStore
 
 
 class Game(IGame):
 
-    def __init__(self, players: List[IPlayer], game_map: IMap) -> None:
+    def __init__(self, players: List[IPlayer], game_map: IMap, rng: random.Random = None) -> None:
         """
         Base constructor of this class, for creating the game, remember that the constructor arguments of this class
         are instantiated by the Game Factory.
 
+        All the randomness of a game comes from its own random generator, so a game created from the same seed is
+        always played the same way, regardless of another games running in the same process.
+
         :param List[IPlayer] players: The list of players that will play.
         :param IMap game_map: Generated map of the game.
+        :param random.Random rng: The random generator of the game, by default the one of the map.
         :rtype: None
         """
         self.players = players
         self.game_map = game_map
+        self.rng = rng if rng is not None else game_map.rng
         self.turns = {}
         self.dice_sides = get_configuration(GAME_SECTION).get('dice_sides', 6)
 
@@ -64,7 +68,7 @@ class Game(IGame):
 
         :rtype: int: Result of the dice.
         """
-        return random.randrange(self.dice_sides)
+        return self.rng.randrange(self.dice_sides)
 
     def chose_probability(self, additional: List[float] = None) -> bool:
         """
@@ -80,10 +84,28 @@ class Game(IGame):
             additional = [0]
         dice_result = self.roll_the_dice()
         positive_percentage = ((1 / self.dice_sides) * dice_result) + functools.reduce(lambda a, b: a + b, additional)
-        negative_percentage = max(0, 1 - positive_percentage)
-        return \
-            choice([True, False], 1, p=[positive_percentage if positive_percentage <= 1 else 1, negative_percentage])[
-                0]
+        return self.weighted_boolean(positive_percentage)
+
+    def weighted_boolean(self, probability: float) -> bool:
+        """
+        Flip a weighted coin, resulting True with the given probability. Probabilities above 1 are always True, and
+        below 0 always False.
+
+        :param float probability: The probability of resulting True.
+        :rtype: bool.
+        """
+        return self.rng.random() < probability
+
+    def weighted_booleans(self, probabilities: List[float]) -> List[bool]:
+        """
+        Flip many weighted coins at once, one for each probability, with the same distribution of weighted_boolean,
+        for simulations that need a lot of outcomes.
+
+        :param List[float] probabilities: The probability of resulting True of each coin.
+        :rtype: List[bool].
+        """
+        draw = self.rng.random
+        return [draw() < probability for probability in probabilities]
 
     def check_another_players_in_position(self, current_player: IPlayer) -> List[IPlayer]:
         """
@@ -136,16 +158,30 @@ class Game(IGame):
                                                , players)]
         return remaining_players
 
+    def compute_side_effects_in_bulk(self) -> List[Tuple[IPlayer, ISideEffect]]:
+        """
+        Compute a whole turn of side effects for all the alive players at once, in the columnar PlayerStateStore:
+        the iterated side effects are applied, the players without life die, and the durations are ticked. Returns
+        the side effects that ended, with their players.
+
+        :rtype: List[Tuple[IPlayer, ISideEffect]]
+        """
+        store = PlayerStateStore(self.get_all_alive_players())
+        ended_side_effects = store.step()
+        store.sync()
+        return [(store.players[row], side_effect) for row, side_effect in ended_side_effects]
+
 
 class DeathMatch(Game):
 
-    def __init__(self, players: List[IPlayer], game_map: IMap) -> None:
+    def __init__(self, players: List[IPlayer], game_map: IMap, rng: random.Random = None) -> None:
         """
         There must be many kinds of game, DeathMatch it's basically all vs all,
         and this class represents the implementation of Game.
 
         :param List[IPlayer] players: The list of players that will play.
         :param IMap game_map: Generated map of the game.
+        :param random.Random rng: The random generator of the game.
         :rtype: None.
         """
-        super(DeathMatch, self).__init__(players, game_map)
+        super(DeathMatch, self).__init__(players, game_map, rng)
@@ -1,4 +1,4 @@
-from random import randrange
+import random
 from typing import List
 
 from emberblast.conf import get_configuration
@@ -8,10 +8,10 @@ from emberblast.orchestrator import DeathMatchOrchestrator
 from emberblast.player import ControlledPlayer, dynamic_jobs_classes, dynamic_races_classes, BotPlayer
 from emberblast.save import get_normalized_saved_files_dict, recover_saved_game_orchestrator
 from emberblast.item import Bag
-from emberblast.utils import JOBS_SECTION, RACES_SECTION
+from emberblast.utils import JOBS_SECTION, RACES_SECTION, GAME_SECTION
 from emberblast.utils.name_generator import generate_name
 from emberblast.item import Equipment
-from emberblast.interface import IMap, IControlledPlayer, IBotPlayer, IGameOrchestrator, IGameFactory
+from emberblast.interface import IMap, IControlledPlayer, IBotPlayer, IGameOrchestrator, IGameFactory, IPlayer
 from emberblast.communicator import communicator_injector
 
 
@@ -59,24 +59,41 @@ class GameFactory(IGameFactory):
         bots = self.init_bots()
         players.extend(bots)
 
-        game_map = self.init_map(len(bots) + 4)
+        map_size = get_configuration(GAME_SECTION).get('map_size', len(bots) + 4)
 
         if self.begin_question_results.get('game') == 'Deathmatch':
-            game = DeathMatch(players, game_map)
-            game.calculate_turn_order()
-            game.game_map.define_player_initial_position_random(game.get_all_players())
-            game.game_map.distribute_random_items()
-            orchestrator = DeathMatchOrchestrator(game)
-            return orchestrator
-
-    def init_map(self, map_size: int) -> IMap:
+            return self.create_deathmatch(players, map_size)
+
+    def create_deathmatch(self, players: List[IPlayer], map_size: int,
+                          rng: random.Random = None) -> IGameOrchestrator:
+        """
+        Creates the map and a Deathmatch game for the players, placing them and the items randomly in the map. With
+        spawn_mode set to spread in the configuration, the players start as far as possible from each other.
+
+        :param List[IPlayer] players: The players of the game.
+        :param int map_size: The size of the map.
+        :param random.Random rng: The random generator of the game.
+        :rtype: IGameOrchestrator.
+        """
+        game_map = self.init_map(map_size, rng)
+        game = DeathMatch(players, game_map)
+        game.calculate_turn_order()
+        spread = get_configuration(GAME_SECTION).get('spawn_mode', 'random') == 'spread'
+        game.game_map.define_player_initial_position_random(game.get_all_players(), spread)
+        game.game_map.distribute_random_items()
+        orchestrator = DeathMatchOrchestrator(game)
+        return orchestrator
+
+    def init_map(self, map_size: int, rng: random.Random = None) -> IMap:
         """
         Calls MapFactory to create a new map, depending on the number of players, that will be proportional to map size.
+        The size can also be fixed with map_size in the game section of the configuration, for bigger arenas.
 
         :param int map_size: The size of the map, may change depending the number of players.
+        :param random.Random rng: The random generator of the game.
         :rtype: IMap.
         """
-        return MapFactory().create_map(map_size)
+        return MapFactory().create_map(map_size, rng)
 
     def init_players(self) -> List[IControlledPlayer]:
         """
@@ -113,21 +130,24 @@ class GameFactory(IGameFactory):
         return bot_factory(self.begin_question_results.get('bots_number'))
 
 
-def bot_factory(number_of_bots: int) -> List[IBotPlayer]:
+def bot_factory(number_of_bots: int, rng: random.Random = None) -> List[IBotPlayer]:
     """
     Function that will generated all the bots, depending of the number that was informed as the argument,
     each bot race and job, will be picked randomly.
 
     :param int number_of_bots: Number of bots to create.
+    :param random.Random rng: The random generator to use.
     :rtype: List[IBotPlayer].
     """
+    if rng is None:
+        rng = random.Random()
     bots = []
     jobs = list(get_configuration(JOBS_SECTION).keys())
     races = list(get_configuration(RACES_SECTION).keys())
     for n in range(int(number_of_bots)):
-        name = generate_name()
-        chosen_job = jobs[randrange(len(jobs))]
-        chosen_race = races[randrange(len(races))]
+        name = generate_name(rng)
+        chosen_job = jobs[rng.randrange(len(jobs))]
+        chosen_race = races[rng.randrange(len(races))]
         job = dynamic_jobs_classes[chosen_job]()
         race = dynamic_races_classes[chosen_race]()
         bag = Bag()
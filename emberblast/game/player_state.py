@@ -0,0 +1,170 @@
+from typing import List, Tuple, TYPE_CHECKING
+
+from emberblast.interface import IPlayer, ISideEffect, IPlayerStateStore
+
+if TYPE_CHECKING:
+    import numpy as np
+
+# Iterated side effects only change the remaining life or mana, those are the columns of the resources array.
+RESOURCE_ATTRIBUTES = ['health_points', 'magic_points']
+
+
+class PlayerStateStore(IPlayerStateStore):
+
+    def __init__(self, players: List[IPlayer]) -> None:
+        """
+        Constructor of PlayerStateStore, a columnar copy of the state of the players of a game, where each player is
+        a row of NumPy arrays, so the changes that happen to all the players at once, like applying the iterated side
+        effects, ticking their durations and checking who died, are computed for all of them at once, instead of
+        going player by player.
+
+        The player objects are still the source of truth, so the state is loaded from them, and written back with
+        sync once the bulk changes are computed.
+
+        :param List[IPlayer] players: The players of the game.
+        :rtype: None
+        """
+        self.players = players
+        self.side_effects: List[Tuple[int, ISideEffect]] = []
+        self.resources: 'np.ndarray' = None
+        self.maximum_resources: 'np.ndarray' = None
+        self.alive: 'np.ndarray' = None
+        self.damaged_to_death: 'np.ndarray' = None
+        self.effect_owners: 'np.ndarray' = None
+        self.effect_resources: 'np.ndarray' = None
+        self.effect_amounts: 'np.ndarray' = None
+        self.effect_durations: 'np.ndarray' = None
+        self.effect_iterated: 'np.ndarray' = None
+        self.effect_buffs: 'np.ndarray' = None
+        self.effect_slots: 'np.ndarray' = None
+        self.load()
+
+    def load(self) -> None:
+        """
+        Load the state of the players into the arrays, only the life and mana, the only columns changed in bulk. Side
+        effects are flattened into arrays with one entry for each one of them, with its owner row, and its slot, the
+        order in which the iterated ones are applied to the player.
+
+        :rtype: None
+        """
+        import numpy as np
+
+        self.resources = np.array([[player.life, player.mana] for player in self.players],
+                                  dtype=np.int64).reshape(-1, len(RESOURCE_ATTRIBUTES))
+        self.maximum_resources = np.array([[player.health_points, player.magic_points] for player in self.players],
+                                          dtype=np.int64).reshape(-1, len(RESOURCE_ATTRIBUTES))
+        self.alive = np.array([player.is_alive() for player in self.players], dtype=bool)
+        self.damaged_to_death = np.zeros_like(self.alive)
+
+        self.side_effects = [(row, side_effect) for row, player in enumerate(self.players)
+                             for side_effect in player.side_effects]
+        self.effect_owners = np.array([row for row, _ in self.side_effects], dtype=np.int64)
+        self.effect_resources = np.array([RESOURCE_ATTRIBUTES.index(side_effect.attribute)
+                                          if side_effect.attribute in RESOURCE_ATTRIBUTES else -1
+                                          for _, side_effect in self.side_effects], dtype=np.int64)
+        self.effect_amounts = np.array([side_effect.base if side_effect.effect_type == 'buff' else -side_effect.base
+                                        for _, side_effect in self.side_effects], dtype=np.int64)
+        self.effect_durations = np.array([side_effect.duration for _, side_effect in self.side_effects],
+                                         dtype=np.int64)
+        self.effect_iterated = np.array([side_effect.occurrence == 'iterated' for _, side_effect in self.side_effects],
+                                        dtype=bool)
+        self.effect_buffs = np.array([side_effect.effect_type == 'buff' for _, side_effect in self.side_effects],
+                                     dtype=bool)
+        # The container keeps the side effects in the order they were added, and so does get_by_occurrence.
+        slots = [0] * len(self.players)
+        self.effect_slots = np.zeros(len(self.side_effects), dtype=np.int64)
+        for index, (row, side_effect) in enumerate(self.side_effects):
+            if side_effect.occurrence == 'iterated':
+                self.effect_slots[index] = slots[row]
+                slots[row] = slots[row] + 1
+
+    def apply_iterated_side_effects(self) -> None:
+        """
+        Apply the iterated side effects of all the alive players, the same way as
+        Player.compute_iterated_side_effects, one side effect after the other, so a heal is capped at the maximum
+        before the next damage, and a damage that leaves no life kills the player even if a later heal would make up
+        for it. Each player has at most one side effect in each slot, so a slot is applied to all the players at once.
+
+        :rtype: None
+        """
+        import numpy as np
+
+        applied = self.effect_iterated & (self.effect_resources >= 0) & self.alive[self.effect_owners]
+        owners = self.effect_owners[applied]
+        resources = self.effect_resources[applied]
+        amounts = self.effect_amounts[applied]
+        buffs = self.effect_buffs[applied]
+        slots = self.effect_slots[applied]
+
+        for slot in range(int(slots.max()) + 1 if len(slots) > 0 else 0):
+            in_slot = slots == slot
+            slot_owners, slot_resources = owners[in_slot], resources[in_slot]
+            slot_buffs = buffs[in_slot]
+            values = self.resources[slot_owners, slot_resources] + amounts[in_slot]
+            values[slot_buffs] = np.minimum(values[slot_buffs],
+                                            self.maximum_resources[slot_owners[slot_buffs], slot_resources[slot_buffs]])
+            self.resources[slot_owners, slot_resources] = values
+
+            damaged = ~slot_buffs & (slot_resources == RESOURCE_ATTRIBUTES.index('health_points'))
+            self.damaged_to_death[slot_owners[damaged & (values <= 0)]] = True
+
+    def tick_side_effect_durations(self) -> List[Tuple[int, ISideEffect]]:
+        """
+        Decrease the duration of all the side effects by one turn, returning the ones that ended, with the rows of
+        their owners.
+
+        :rtype: List[Tuple[int, ISideEffect]]
+        """
+        self.effect_durations -= 1
+        return [self.side_effects[index] for index in (self.effect_durations <= 0).nonzero()[0]]
+
+    def check_deaths(self) -> List[int]:
+        """
+        Mark the players that were left without life by a damage as dead, returning the rows of the ones that died
+        now.
+
+        :rtype: List[int]
+        """
+        dead = self.alive & self.damaged_to_death
+        self.alive &= ~dead
+        return dead.nonzero()[0].tolist()
+
+    def step(self) -> List[Tuple[int, ISideEffect]]:
+        """
+        Compute a whole turn of side effects for all the players: apply the iterated ones, check who died, and tick
+        the durations, returning the side effects that ended.
+
+        :rtype: List[Tuple[int, ISideEffect]]
+        """
+        self.apply_iterated_side_effects()
+        self.check_deaths()
+        return self.tick_side_effect_durations()
+
+    def sync(self) -> None:
+        """
+        Write the state computed in bulk back to the players, the remaining life and mana, who died, the durations of
+        the side effects, and remove the ones that ended.
+
+        :rtype: None
+        """
+        durations = self.effect_durations.tolist()
+        ended_side_effects = {}
+        for (row, side_effect), duration in zip(self.side_effects, durations):
+            if duration <= 0:
+                ended_side_effects.setdefault(row, []).append(side_effect)
+
+        resources = self.resources.tolist()
+        alive_players = self.alive.tolist()
+        for row, (player, (life, mana), alive) in enumerate(zip(self.players, resources, alive_players)):
+            player.life = life
+            player.mana = mana
+            if not alive and player.is_alive():
+                player.die()
+            if row in ended_side_effects:
+                player.remove_side_effects(ended_side_effects[row])
+                for side_effect in ended_side_effects[row]:
+                    player.equipment.remove_side_effect(side_effect)
+
+        # Only after removing the ended side effects, so their durations are kept in themselves, not in the players.
+        for (row, side_effect), duration in zip(self.side_effects, durations):
+            side_effect.duration = duration
@@ -1,9 +1,11 @@
-from .interface import IPlayer, IJob, IItem, IHealingItem, IRecoveryItem, IEquipmentItem, IBag, IRace, IEquipment, \
-    ISideEffect, ISkill, IMap, IGraph, IVertex, IEdge, IGame, IControlledPlayer, IBotPlayer, IAction, \
-    IGameOrchestrator, IBotDecisioning, IPlayingMode, IGameFactory, IInformingSystem,\
-    ICommunicator, IEmberblast
+from .interface import IPlayer, IJob, IItemTemplate, IItem, IHealingItem, IRecoveryItem, IEquipmentItem, IBag, IRace, \
+    IEquipment, ISideEffectTemplate, ISideEffect, ISideEffectContainer, ISkill, IMap, IGraph, IVertex, IEdge, IGame, \
+    IControlledPlayer, IBotPlayer, IAction, IGameOrchestrator, IBotDecisioning, IPlayingMode, IGameFactory, \
+    IInformingSystem, ICommunicator, IEmberblast, IPlayerStatistics, IGameResult, IGroupStatistics, IBatchResult, \
+    IPlayerStateStore
 
-__all__ = ['IPlayer', 'IJob', 'IItem', 'IHealingItem', 'IRecoveryItem', 'IEquipmentItem', 'IBag',
-           'IRace', 'IEquipment', 'ISideEffect', 'ISkill', 'IMap', 'IGraph', 'IVertex', 'IEdge', 'IGame',
-           'IControlledPlayer', 'IBotPlayer', 'IAction', 'IGameOrchestrator', 'IBotDecisioning', 'IPlayingMode',
-           'IGameFactory', 'IInformingSystem', 'ICommunicator', 'IEmberblast']
+__all__ = ['IPlayer', 'IJob', 'IItemTemplate', 'IItem', 'IHealingItem', 'IRecoveryItem', 'IEquipmentItem', 'IBag',
+           'IRace', 'IEquipment', 'ISideEffectTemplate', 'ISideEffect', 'ISideEffectContainer', 'ISkill', 'IMap',
+           'IGraph', 'IVertex', 'IEdge', 'IGame', 'IControlledPlayer', 'IBotPlayer', 'IAction', 'IGameOrchestrator',
+           'IBotDecisioning', 'IPlayingMode', 'IGameFactory', 'IInformingSystem', 'ICommunicator', 'IEmberblast',
+           'IPlayerStatistics', 'IGameResult', 'IGroupStatistics', 'IBatchResult', 'IPlayerStateStore']
@@ -1,16 +1,84 @@
+import random
 from abc import abstractmethod, ABC
 from enum import Enum
 from pathlib import Path
-from typing import List, Union, Dict, Optional, Set, Callable, TypedDict
+from typing import List, Union, Dict, Optional, Callable, TypedDict, Any, Tuple, Iterator
+
+
+class ISideEffectTemplate(ABC):
+    __slots__ = ()
+    name: str
+    effect_type: str
+    attribute: str
+    base: int
+    duration: int
+    occurrence: str
 
 
 class ISideEffect(ABC):
+    __slots__ = ()
+    template: ISideEffectTemplate
     name: str
     effect_type: str
     attribute: str
     base: int
     duration: int
     occurrence: str
+    owner: Optional['ISideEffectContainer']
+    caster: Optional['IPlayer']
+
+    @abstractmethod
+    def new_instance(self, caster: Optional['IPlayer'] = None) -> 'ISideEffect':
+        pass
+
+
+class ISideEffectContainer(ABC):
+    turn: int
+    version: int
+
+    @abstractmethod
+    def __iter__(self) -> Iterator[ISideEffect]:
+        pass
+
+    @abstractmethod
+    def __len__(self) -> int:
+        pass
+
+    @abstractmethod
+    def __contains__(self, side_effect: ISideEffect) -> bool:
+        pass
+
+    @abstractmethod
+    def add(self, side_effect: ISideEffect) -> None:
+        pass
+
+    @abstractmethod
+    def append(self, side_effect: ISideEffect) -> None:
+        pass
+
+    @abstractmethod
+    def remove(self, side_effect: ISideEffect) -> None:
+        pass
+
+    @abstractmethod
+    def get(self, name: str) -> Optional[ISideEffect]:
+        pass
+
+    @abstractmethod
+    def get_by_occurrence(self, occurrence: str) -> List[ISideEffect]:
+        pass
+
+    @abstractmethod
+    def get_remaining_duration(self, side_effect: ISideEffect) -> int:
+        pass
+
+    @abstractmethod
+    def set_remaining_duration(self, side_effect: ISideEffect, duration: int) -> None:
+        pass
+
+    @abstractmethod
+    def tick(self) -> List[ISideEffect]:
+        pass
 
 
 class ISkill:
@@ -29,11 +97,29 @@ class ISkill:
     punishment_side_effect: List[ISideEffect]
     communicator: 'ICommunicator'
 
-    def execute(self, player: 'IPlayer', foes: List['IPlayer'], dice_norm_result: float) -> None:
+    def execute(self, player: 'IPlayer', foes: List['IPlayer'], dice_norm_result: float,
+                rng: random.Random = None) -> None:
         pass
 
 
+class IItemTemplate(ABC):
+    __slots__ = ()
+    name: str
+    tier: str
+    description: str
+    weight: float
+    attribute: Optional[str]
+    base: Optional[int]
+    status: Optional[str]
+    side_effects: Tuple[ISideEffectTemplate, ...]
+    category: Optional[str]
+    usage: Optional[str]
+    wielding: int
+
+
 class IItem(ABC):
+    __slots__ = ()
+    template: IItemTemplate
     name: str
     tier: str
     description: str
@@ -41,15 +127,18 @@ class IItem(ABC):
 
 
 class IHealingItem(IItem):
+    __slots__ = ()
     attribute: str
     base: int
 
 
 class IRecoveryItem(IItem):
+    __slots__ = ()
     status: str
 
 
 class IEquipmentItem(IItem):
+    __slots__ = ()
     attribute: str
     base: int
     side_effects: List[ISideEffect]
@@ -60,6 +149,7 @@ class IEquipmentItem(IItem):
 
 class IBag(ABC):
     items: List[IItem]
+    item_types: Dict[str, List[IItem]]
     weight: int
 
     @abstractmethod
@@ -88,11 +178,16 @@ class IEquipment(ABC):
     armour: Union[None, IEquipmentItem] = None
     boots: Union[None, IEquipmentItem] = None
     accessory: Union[None, IEquipmentItem] = None
+    version: int = 0
 
     @abstractmethod
     def equip(self, equipment: IEquipmentItem):
         pass
 
+    @abstractmethod
+    def get_equipped_items(self) -> List[Union[None, IEquipmentItem]]:
+        pass
+
     @abstractmethod
     def get_attribute_addition(self, attribute: str, usage: str = 'all') -> int:
         pass
@@ -167,7 +262,7 @@ class IPlayer(ABC):
     will: int
     level: int
     experience: int
-    side_effects: List[ISideEffect]
+    side_effects: ISideEffectContainer
     skills: List[ISkill]
     _alive: bool
     position: str
@@ -258,6 +353,14 @@ class IPlayer(ABC):
     def remove_side_effects(self, side_effects: List[ISideEffect]) -> None:
         pass
 
+    @abstractmethod
+    def add_side_effects(self, side_effects: List[ISideEffect]) -> None:
+        pass
+
+    @abstractmethod
+    def get_attribute_bonus(self, attribute: str, usage: str = 'all') -> int:
+        pass
+
     @abstractmethod
     def compute_iterated_side_effects(self) -> None:
         pass
@@ -284,19 +387,26 @@ class IBotPlayer(IPlayer):
 
 
 class IEdge(ABC):
+    __slots__ = ()
     source: str
     destination: str
     weight: float
 
 
 class IVertex(ABC):
+    __slots__ = ()
     vertex_id: str
-    position: Dict
-    edges: List[IEdge]
+    index: int
     value: int
 
+    @property
     @abstractmethod
-    def add_edge(self, edge: IEdge) -> None:
+    def position(self) -> Dict:
+        pass
+
+    @property
+    @abstractmethod
+    def edges(self) -> List[IEdge]:
         pass
 
 
@@ -310,49 +420,47 @@ class IGraph(ABC):
         pass
 
     @abstractmethod
-    def _create_matrix_dfs_traverse(self, matrix: List[List[int]], row: int, column: int,
-                                    visited: List[List[bool]]) -> None:
+    def get_edges(self, index: int) -> List[IEdge]:
         pass
 
     @abstractmethod
-    def _compute_vertical_edges(self, vertex: IVertex, row: int, column: int, matrix: List[List[int]]) -> None:
+    def get_list_of_nodes(self) -> List[str]:
         pass
 
     @abstractmethod
-    def _compute_horizontal_edges(self, vertex: IVertex, row: int, column: int, matrix: List[List[int]]) -> None:
+    def is_vertex_valid(self, row: int, column: int) -> bool:
         pass
 
     @abstractmethod
-    def _compute_diagonal_edges(self, vertex: IVertex, row: int, column: int, matrix: List[List[int]]) -> None:
+    def compute_range_distances(self, position: str, reach: float) -> Dict[str, float]:
         pass
 
     @abstractmethod
-    def get_list_of_nodes(self) -> List[str]:
+    def get_available_nodes_in_range(self, position: str, radius: int) -> List[str]:
         pass
 
     @abstractmethod
-    def is_vertex_valid(self, row: int, column: int) -> bool:
+    def is_target_in_range(self, position: str, radius: int, target_position: str) -> bool:
         pass
 
     @abstractmethod
-    def compute_recursive_range_edges(self, vertex: IVertex, reach: float, available_nodes: Set[str],
-                                      origin_node: str) -> None:
+    def get_number_of_walkable_nodes(self) -> int:
         pass
 
     @abstractmethod
-    def get_available_nodes_in_range(self, position: str, radius: int) -> List[str]:
+    def is_graph_defective(self) -> bool:
         pass
 
     @abstractmethod
-    def is_target_in_range(self, position: str, radius: int, target_position: str) -> bool:
+    def get_connected_components(self) -> Dict[str, int]:
         pass
 
     @abstractmethod
-    def get_number_of_walkable_nodes(self) -> int:
+    def get_number_of_islands(self) -> int:
         pass
 
     @abstractmethod
-    def is_graph_defective(self) -> bool:
+    def get_largest_component(self) -> List[str]:
         pass
 
     @abstractmethod
@@ -363,12 +471,20 @@ class IGraph(ABC):
     def fill_infinite_distance_dict(self, distances: Dict[str, float]) -> None:
         pass
 
+    @abstractmethod
+    def get_vertex_index(self) -> Dict[str, int]:
+        pass
+
+    @abstractmethod
+    def get_distance_row(self, source: str) -> Any:
+        pass
+
     @abstractmethod
     def get_shortest_distance_between_positions(self, s1: str, s2: str) -> float:
         pass
 
     @abstractmethod
-    def get_shortest_path(self, source_position: str) -> Dict[str, float]:
+    def get_shortest_path(self, source_position: str, target_position: str = None) -> Dict[str, float]:
         pass
 
     @abstractmethod
@@ -386,14 +502,15 @@ class IMap(ABC):
     type: str
     size: int
     graph: IGraph
+    rng: random.Random
     items: Dict[str, List[IItem]]
 
     @abstractmethod
-    def define_player_initial_position_random(self, players: List[IPlayer]) -> None:
+    def define_player_initial_position_random(self, players: List[IPlayer], spread: bool = False) -> None:
         pass
 
     @abstractmethod
-    def pick_available_position(self, selected_positions: List[str]) -> str:
+    def pick_spread_positions(self, walkable_positions: List[str], number_of_positions: int) -> List[str]:
         pass
 
     @abstractmethod
@@ -409,7 +526,7 @@ class IMap(ABC):
         pass
 
     @abstractmethod
-    def add_trap_to_map(self, position: str, side_effects: List[ISideEffect]) -> None:
+    def add_trap_to_map(self, position: str, side_effects: List[ISideEffect], caster: Optional[IPlayer] = None) -> None:
         pass
 
     @abstractmethod
@@ -443,6 +560,7 @@ class IGame(ABC):
     game_map: IMap
     turns: Dict[int, List[IPlayer]]
     dice_sides: int
+    rng: random.Random
 
     @abstractmethod
     def calculate_turn_key(self, player: IPlayer) -> float:
@@ -460,6 +578,14 @@ class IGame(ABC):
     def chose_probability(self, additional: List[float] = None) -> bool:
         pass
 
+    @abstractmethod
+    def weighted_boolean(self, probability: float) -> bool:
+        pass
+
+    @abstractmethod
+    def weighted_booleans(self, probabilities: List[float]) -> List[bool]:
+        pass
+
     @abstractmethod
     def check_another_players_in_position(self, current_player: IPlayer) -> List[IPlayer]:
         pass
@@ -476,6 +602,39 @@ class IGame(ABC):
     def get_remaining_players(self, player: IPlayer, include_hidden: bool = False) -> List[IPlayer]:
         pass
 
+    @abstractmethod
+    def compute_side_effects_in_bulk(self) -> List[Tuple[IPlayer, ISideEffect]]:
+        pass
+
+
+class IPlayerStateStore(ABC):
+    players: List[IPlayer]
+    side_effects: List[Tuple[int, ISideEffect]]
+
+    @abstractmethod
+    def load(self) -> None:
+        pass
+
+    @abstractmethod
+    def apply_iterated_side_effects(self) -> None:
+        pass
+
+    @abstractmethod
+    def tick_side_effect_durations(self) -> List[Tuple[int, ISideEffect]]:
+        pass
+
+    @abstractmethod
+    def check_deaths(self) -> List[int]:
+        pass
+
+    @abstractmethod
+    def step(self) -> List[Tuple[int, ISideEffect]]:
+        pass
+
+    @abstractmethod
+    def sync(self) -> None:
+        pass
+
 
 class IAction(TypedDict):
     independent: bool
@@ -483,6 +642,42 @@ class IAction(TypedDict):
     function: Callable
 
 
+class IPlayerStatistics(TypedDict):
+    name: str
+    job: str
+    race: str
+    alive: bool
+    level: int
+    life: int
+    damage_dealt: int
+    damage_taken: int
+    kills: int
+
+
+class IGameResult(TypedDict):
+    winner: Optional[str]
+    turns: int
+    players: List[IPlayerStatistics]
+    errors: List[str]
+
+
+class IGroupStatistics(TypedDict):
+    games: int
+    wins: int
+    kills: int
+    win_rate: float
+    average_kills: float
+
+
+class IBatchResult(TypedDict):
+    games: int
+    draws: int
+    errors: int
+    average_turns: float
+    jobs: Dict[str, IGroupStatistics]
+    races: Dict[str, IGroupStatistics]
+
+
 class IPlayingMode(Enum):
     NEUTRAL = 0
     AGGRESSIVE = 1
@@ -1015,6 +1210,15 @@ class IInformingSystem(ABC):
         """
         pass
 
+    @abstractmethod
+    def new_line(self) -> None:
+        """
+        Leave a blank line between the messages of an action.
+
+        :rtype: None
+        """
+        pass
+
     @abstractmethod
     def line_separator(self) -> None:
         """
@@ -1034,6 +1238,36 @@ class IInformingSystem(ABC):
         """
         pass
 
+    @abstractmethod
+    def clear(self) -> None:
+        """
+        Clear the screen, between the turns of the game.
+
+        :rtype: None
+        """
+        pass
+
+    @abstractmethod
+    def died_from_side_effects(self, player: IPlayer, caster: Optional[IPlayer]) -> None:
+        """
+        Print that a player died from the damage of iterated side effects, like poison.
+
+        :param IPlayer player: The player that died.
+        :param Optional[IPlayer] caster: The player that cast the side effect, if there is one.
+        :rtype: None
+        """
+        pass
+
+    @abstractmethod
+    def unexpected_error(self, error: Exception) -> None:
+        """
+        Print an unexpected error that happened along the game.
+
+        :param Exception error: The error.
+        :rtype: None
+        """
+        pass
+
 
 class ICommunicator(ABC):
     questioner: IQuestioningSystem
@@ -1048,8 +1282,9 @@ class IBotDecisioning(ABC):
 
 
 class IGameOrchestrator:
-    clear: Callable
     game: IGame
+    max_turns: Optional[int]
+    bulk_side_effects: bool
     actions: Dict[str, IAction]
     actions_left: List[str]
     turn_remaining_players: List[IPlayer]
@@ -1075,6 +1310,14 @@ class IGameOrchestrator:
     def check_side_effect_duration(self, player: IPlayer) -> None:
         pass
 
+    @abstractmethod
+    def check_side_effects_in_bulk(self) -> None:
+        pass
+
+    @abstractmethod
+    def get_side_effects_killer(self, player: IPlayer) -> Optional[IPlayer]:
+        pass
+
 
 class IGameFactory:
     begin_question_results: Union[Union[str, bool, list, dict], None]
@@ -1089,7 +1332,12 @@ class IGameFactory:
         pass
 
     @abstractmethod
-    def init_map(self, map_size: int) -> IMap:
+    def create_deathmatch(self, players: List[IPlayer], map_size: int,
+                          rng: random.Random = None) -> IGameOrchestrator:
+        pass
+
+    @abstractmethod
+    def init_map(self, map_size: int, rng: random.Random = None) -> IMap:
         pass
 
     @abstractmethod
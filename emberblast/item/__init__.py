@@ -1,5 +1,7 @@
 from .bag import Bag
-from .items import Item, EquipmentItem, RecoveryItem, HealingItem, get_random_item
+from .items import ItemTemplate, Item, EquipmentItem, RecoveryItem, HealingItem, ItemCatalog, get_item_template, \
+    get_random_item, get_item_catalog
 from .equipment import Equipment
 
-__all__ = ['Bag', 'get_random_item', 'Item', 'EquipmentItem', 'RecoveryItem', 'HealingItem', 'Equipment']
+__all__ = ['Bag', 'get_item_template', 'get_random_item', 'get_item_catalog', 'ItemCatalog', 'ItemTemplate', 'Item',
+           'EquipmentItem', 'RecoveryItem', 'HealingItem', 'Equipment']
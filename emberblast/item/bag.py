@@ -1,31 +1,57 @@
 from functools import wraps
-from typing import List, cast
+from typing import List, Dict, cast
 from emberblast.interface import IBag, IItem, IEquipmentItem, IRecoveryItem, IHealingItem
 
+BAG_ITEM_TYPES = ['usable', 'equipment', 'other']
 
-def weight_compute(func):
-    @wraps(func)
-    def wrapper(self, *args, **kwargs):
-        item: IItem = args[0]
-        if 'add_item' in repr(func):
-            self.weight = self.weight + item.weight
-        elif 'remove_item' in repr(func):
-            self.weight = self.weight - item.weight
-        return func(self, *args, **kwargs)
 
-    return wrapper
+def weight_compute(direction: int):
+    """
+    Decorator for the methods that add or remove items from the bag, so the weight of the bag follows the items
+    that are in it.
+
+    :param int direction: 1 when the item is added to the bag, -1 when it's removed.
+    """
+    def decorator(func):
+        @wraps(func)
+        def wrapper(self, *args, **kwargs):
+            item: IItem = args[0]
+            result = func(self, *args, **kwargs)
+            self.weight = self.weight + direction * item.weight
+            return result
+
+        return wrapper
+
+    return decorator
+
+
+def get_item_bag_type(item: IItem) -> str:
+    """
+    Get the type of an item in the bag, if it can be used(healing or recovery), equipped, or none of them.
+
+    :param IItem item: The item.
+    :rtype: str
+    """
+    if isinstance(item, IEquipmentItem):
+        return 'equipment'
+    elif isinstance(item, IHealingItem) or isinstance(item, IRecoveryItem):
+        return 'usable'
+    return 'other'
 
 
 class Bag(IBag):
     def __init__(self) -> None:
         """
-        Constructor
+        Constructor. Besides all the items, the bag keeps them split by type, so checking or listing the items of
+        a type doesn't need to go through all of them.
+
         :rtype: None
         """
         self.items: List[IItem] = []
+        self.item_types: Dict[str, List[IItem]] = {item_type: [] for item_type in BAG_ITEM_TYPES}
         self.weight = 0
 
-    @weight_compute
+    @weight_compute(1)
     def add_item(self, item: IItem) -> None:
         """
         Adds an item into the bag
@@ -34,8 +60,9 @@ class Bag(IBag):
         :rtype: None
         """
         self.items.append(item)
+        self.item_types[get_item_bag_type(item)].append(item)
 
-    @weight_compute
+    @weight_compute(-1)
     def remove_item(self, item: IItem) -> None:
         """
         It remove one item from the bag
@@ -44,6 +71,7 @@ class Bag(IBag):
         :rtype: None
         """
         self.items.remove(item)
+        self.item_types[get_item_bag_type(item)].remove(item)
 
     def get_equipments(self) -> List[IEquipmentItem]:
         """
@@ -51,8 +79,7 @@ class Bag(IBag):
 
         :rtype List[IEquipmentItem]
         """
-        return cast(List[IEquipmentItem], [x for x in filter(
-            lambda item: isinstance(item, IEquipmentItem), self.items)])
+        return cast(List[IEquipmentItem], list(self.item_types['equipment']))
 
     def get_usable_items(self) -> List[IItem]:
         """
@@ -60,8 +87,7 @@ class Bag(IBag):
 
         :rtype: List[IItem]
         """
-        return [x for x in filter(
-            lambda item: isinstance(item, IHealingItem) or isinstance(item, IRecoveryItem), self.items)]
+        return list(self.item_types['usable'])
 
     def has_item_type(self, is_usable: bool = False, is_equipment: bool = False) -> bool:
         """
@@ -72,13 +98,8 @@ class Bag(IBag):
         :param bool is_equipment: It will look for equipment items in the bag.
         :rtype: bool
         """
-        exists = False
-
-        for item in self.items:
-            if is_usable:
-                if isinstance(item, IHealingItem) or isinstance(item, IRecoveryItem):
-                    return True
-            elif is_equipment:
-                if isinstance(item, IEquipmentItem):
-                    return True
-        return exists
+        if is_usable:
+            return len(self.item_types['usable']) > 0
+        elif is_equipment:
+            return len(self.item_types['equipment']) > 0
+        return False
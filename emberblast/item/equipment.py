@@ -1,6 +1,8 @@
-from typing import Union
+from typing import Union, List, Dict
 from emberblast.interface import IEquipment, IEquipmentItem, IItem, ISideEffect
 
+EQUIPMENT_CATEGORIES = ['weapon', 'shield', 'armour', 'boots', 'accessory']
+
 
 class Equipment(IEquipment):
 
@@ -15,6 +17,21 @@ class Equipment(IEquipment):
         self.armour: Union[None, IEquipmentItem] = None
         self.boots: Union[None, IEquipmentItem] = None
         self.accessory: Union[None, IEquipmentItem] = None
+        # Increased every time an equipment changes, so players know when to compute their attributes again.
+        self.version = 0
+        # The equipped item of each side effect, by the side effect instance, to remove it when its duration has gone.
+        self.side_effect_items: Dict[int, IEquipmentItem] = {}
+
+    def __getstate__(self) -> Dict:
+        state = self.__dict__.copy()
+        del state['side_effect_items']
+        return state
+
+    def __setstate__(self, state: Dict) -> None:
+        # Rebuilt for the same reason as the indexes of SideEffectContainer.
+        self.__dict__.update(state)
+        self.side_effect_items = {id(side_effect): item for item in self.get_equipped_items() if item is not None
+                                  for side_effect in item.side_effects}
 
     def equip(self, equipment: IEquipmentItem):
         """
@@ -27,7 +44,11 @@ class Equipment(IEquipment):
         # This if clause it's handling 2 handed weapons, in the case it's 2 handed, it will remove shields.
         if equipment.category == 'weapon' and equipment.wielding == 2:
             self.remove_equipment('shield')
+        self.remove_equipment(equipment.category)
         self.__setattr__(equipment.category, equipment)
+        for side_effect in equipment.side_effects:
+            self.side_effect_items[id(side_effect)] = equipment
+        self.version = self.version + 1
 
     def get_attribute_addition(self, attribute: str, usage: str = 'all') -> int:
         """
@@ -40,7 +61,7 @@ class Equipment(IEquipment):
         :rtype: int
         """
         result = 0
-        for item in list(self.__dict__.values()):
+        for item in self.get_equipped_items():
             if item is not None:
                 if item.attribute == attribute and item.usage == usage:
                     result = result + item.base
@@ -54,7 +75,20 @@ class Equipment(IEquipment):
         :param category: str: The string of the category of equipment to remove.
         :rtype: None
         """
+        item = self.__getattribute__(category)
+        if item is not None:
+            for side_effect in item.side_effects:
+                self.side_effect_items.pop(id(side_effect), None)
         self.__setattr__(category, None)
+        self.version = self.version + 1
+
+    def get_equipped_items(self) -> List[Union[None, IEquipmentItem]]:
+        """
+        Get the equipment of each one of the categories, None for the empty ones.
+
+        :rtype: List[Union[None, IEquipmentItem]]
+        """
+        return [self.__getattribute__(category) for category in EQUIPMENT_CATEGORIES]
 
     def get_previous_equipped_item(self, category: str) -> Union[None, IEquipmentItem]:
         """
@@ -85,7 +119,7 @@ class Equipment(IEquipment):
         :rtype: None
         """
         if isinstance(selected_item, IEquipmentItem):
-            for item in list(self.__dict__.values()):
+            for item in self.get_equipped_items():
                 if item == selected_item:
                     self.remove_equipment(selected_item.category)
 
@@ -96,8 +130,6 @@ class Equipment(IEquipment):
         :param ISideEffect side_effect: Side effect to be removed.
         :rtype: None
         """
-        for item in list(self.__dict__.values()):
-            if item is not None:
-                for item_side_effect in item.side_effects:
-                    if item_side_effect == side_effect:
-                        item.side_effects.remove(side_effect)
+        item = self.side_effect_items.pop(id(side_effect), None)
+        if item is not None and side_effect in item.side_effects:
+            item.side_effects.remove(side_effect)
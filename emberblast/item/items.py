@@ -1,12 +1,63 @@
+import functools
 import random
-from typing import List
+from typing import List, Dict, Tuple, Callable, Optional, Any
 from emberblast.conf import get_configuration
-from emberblast.utils import ITEMS_SECTION
-from emberblast.effect import SideEffect, instantiate_side_effects
-from emberblast.interface import IItem, IHealingItem, IRecoveryItem, IEquipmentItem, ISideEffect
+from emberblast.utils import ITEMS_SECTION, intern_string
+from emberblast.effect import SideEffect, get_side_effect_template
+from emberblast.interface import IItemTemplate, IItem, IHealingItem, IRecoveryItem, IEquipmentItem, ISideEffect, \
+    ISideEffectTemplate
+
+
+class ItemTemplate(IItemTemplate):
+    __slots__ = ('name', 'tier', 'description', 'weight', 'attribute', 'base', 'status', 'side_effects', 'category',
+                 'usage', 'wielding')
+
+    def __init__(self, name: str, tier: str, description: str, weight: float, attribute: Optional[str] = None,
+                 base: Optional[int] = None, status: Optional[str] = None,
+                 side_effects: Tuple[ISideEffectTemplate, ...] = (), category: Optional[str] = None,
+                 usage: Optional[str] = None, wielding: int = 1) -> None:
+        """
+        Constructor of ItemTemplate, the part of an item definition from items.yaml that never changes. Every item
+        dropped in a map with this name points to it, so any change raises an error. Its strings go through
+        intern_string.
+
+        :param str name: Name of the item.
+        :param str tier: The tier of the item(common, uncommon, rare, legendary),
+        :param str description: Description of the item.
+        :param float weight: Weight of the item.
+        :param Optional[str] attribute: Attribute that the item heals or improves.
+        :param Optional[int] base: How much the attribute is healed or improved.
+        :param Optional[str] status: The status(side-effect) that a recovery item recovers.
+        :param Tuple[ISideEffectTemplate, ...] side_effects: The templates of the side effects of an equipment.
+        :param Optional[str] category: The category of an equipment.
+        :param Optional[str] usage: If the equipment attributes apply to all the cases, to melee attack only or
+        ranged only.
+        :param int wielding: If a weapon is wielded with one or two hands.
+
+        :rtype: None
+        """
+        object.__setattr__(self, 'name', intern_string(name))
+        object.__setattr__(self, 'tier', intern_string(tier))
+        object.__setattr__(self, 'description', intern_string(description))
+        object.__setattr__(self, 'weight', weight)
+        object.__setattr__(self, 'attribute', intern_string(attribute))
+        object.__setattr__(self, 'base', base)
+        object.__setattr__(self, 'status', intern_string(status))
+        object.__setattr__(self, 'side_effects', tuple(side_effects))
+        object.__setattr__(self, 'category', intern_string(category))
+        object.__setattr__(self, 'usage', intern_string(usage))
+        object.__setattr__(self, 'wielding', wielding)
+
+    def __setattr__(self, key: str, value: Any) -> None:
+        raise AttributeError(f'Item template {self.name} can\'t be changed')
+
+    def __reduce__(self) -> Tuple:
+        return ItemTemplate, (self.name, self.tier, self.description, self.weight, self.attribute, self.base,
+                              self.status, self.side_effects, self.category, self.usage, self.wielding)
 
 
 class Item(IItem):
+    __slots__ = ('template',)
 
     def __init__(self, name: str, tier: str, description: str, weight: float) -> None:
         """
@@ -19,13 +70,40 @@ class Item(IItem):
 
         :rtype: None
         """
-        self.name = name
-        self.tier = tier
-        self.description = description
-        self.weight = weight
+        self.template: IItemTemplate = ItemTemplate(name, tier, description, weight)
+
+    @classmethod
+    def from_template(cls, template: IItemTemplate) -> 'Item':
+        """
+        Instantiate an item from its template, which keeps everything about the item, so many items of the map share
+        the same one.
+
+        :param IItemTemplate template: The template of the item.
+        :rtype: Item
+        """
+        item = cls.__new__(cls)
+        item.template = template
+        return item
+
+    @property
+    def name(self) -> str:
+        return self.template.name
+
+    @property
+    def tier(self) -> str:
+        return self.template.tier
+
+    @property
+    def description(self) -> str:
+        return self.template.description
+
+    @property
+    def weight(self) -> float:
+        return self.template.weight
 
 
 class HealingItem(IHealingItem, Item):
+    __slots__ = ()
 
     def __init__(self, name: str, tier: str, description: str, weight: float, attribute: str, base: int) -> None:
         """
@@ -40,12 +118,19 @@ class HealingItem(IHealingItem, Item):
 
         :rtype: None
         """
-        self.attribute = attribute
-        self.base = base
-        super().__init__(name, tier, description, weight)
+        self.template = ItemTemplate(name, tier, description, weight, attribute=attribute, base=base)
+
+    @property
+    def attribute(self) -> str:
+        return self.template.attribute
+
+    @property
+    def base(self) -> int:
+        return self.template.base
 
 
 class RecoveryItem(IRecoveryItem, Item):
+    __slots__ = ()
 
     def __init__(self, name: str, tier: str, description: str, weight: float, status: str) -> None:
         """
@@ -58,11 +143,15 @@ class RecoveryItem(IRecoveryItem, Item):
         :param str status: The status(side-effect) to be recovered.
         :rtype: None
         """
-        self.status = status
-        super().__init__(name, tier, description, weight)
+        self.template = ItemTemplate(name, tier, description, weight, status=status)
+
+    @property
+    def status(self) -> str:
+        return self.template.status
 
 
 class EquipmentItem(IEquipmentItem, Item):
+    __slots__ = ('side_effects',)
 
     def __init__(self, name: str, tier: str, description: str, weight: float, attribute: str, base: int,
                  side_effects: List[ISideEffect], category: str, usage: str, wielding: int = 1) -> None:
@@ -81,59 +170,133 @@ class EquipmentItem(IEquipmentItem, Item):
 
         :rtype: None
         """
-        self.attribute = attribute
-        self.base = base
+        self.template = ItemTemplate(name, tier, description, weight, attribute=attribute, base=base,
+                                     side_effects=tuple(side_effect.template for side_effect in side_effects),
+                                     category=category, usage=usage, wielding=wielding)
         self.side_effects = side_effects
-        self.category = category
-        self.usage = usage
-        self.wielding = wielding
-        super().__init__(name, tier, description, weight)
+
+    @classmethod
+    def from_template(cls, template: IItemTemplate) -> 'EquipmentItem':
+        """
+        Instantiate an equipment from its template. The side effects are the only state of each equipment, because
+        when the user equips it, they are added to the user's side effects, counting their duration, and are removed
+        from the equipment when it ends.
+
+        :param IItemTemplate template: The template of the equipment.
+        :rtype: EquipmentItem
+        """
+        item = super().from_template(template)
+        item.side_effects = [SideEffect.from_template(side_effect) for side_effect in template.side_effects]
+        return item
+
+    @property
+    def attribute(self) -> str:
+        return self.template.attribute
+
+    @property
+    def base(self) -> int:
+        return self.template.base
+
+    @property
+    def category(self) -> str:
+        return self.template.category
+
+    @property
+    def usage(self) -> str:
+        return self.template.usage
+
+    @property
+    def wielding(self) -> int:
+        return self.template.wielding
+
+
+class ItemCatalog:
+
+    def __init__(self, items_dicts: Dict[str, Dict]) -> None:
+        """
+        Constructor of ItemCatalog, indexing all the item definitions by tier and type, with a constructor ready
+        for each one of them, so picking a random item doesn't need to go through all the items.
+
+        :param Dict[str, Dict] items_dicts: The items from the items.yaml file.
+        :rtype: None
+        """
+        self.constructors: Dict[Tuple[str, str], List[Callable[[], Item]]] = {}
+        for item_dict in items_dicts.values():
+            constructor = get_item_constructor(item_dict)
+            if constructor is not None:
+                self.constructors.setdefault((item_dict.get('tier'), item_dict.get('type')), []).append(constructor)
+
+    def get_random_item(self, tier: str, item_type: str, rng: random.Random = None) -> Item:
+        """
+        Get a new random item, of a specific tier and type.
+
+        :param str tier: The tier of the item.
+        :param str item_type: The type of the item(healing, recovery, equipment)
+        :param random.Random rng: The random generator to use.
+        :rtype: Item
+        """
+        if rng is None:
+            rng = random.Random()
+        return rng.choice(self.constructors.get((tier, item_type), []))()
+
+
+ITEM_CLASSES = {'healing': HealingItem, 'recovery': RecoveryItem, 'equipment': EquipmentItem}
+
+
+def get_item_template(item_dict: Dict) -> IItemTemplate:
+    """
+    Build the template of an item definition from items.yaml.
+
+    :param Dict item_dict: The definition of the item.
+    :rtype: IItemTemplate
+    """
+    return ItemTemplate(name=item_dict.get('name'),
+                        tier=item_dict.get('tier'),
+                        description=item_dict.get('description'),
+                        weight=item_dict.get('weight'),
+                        attribute=item_dict.get('attribute'),
+                        base=item_dict.get('base'),
+                        status=item_dict.get('status'),
+                        side_effects=tuple(get_side_effect_template(side_effect)
+                                           for side_effect in item_dict.get('side_effects', [])),
+                        category=item_dict.get('category'),
+                        usage=item_dict.get('usage'),
+                        wielding=item_dict.get('wielding', 0))
+
+
+def get_item_constructor(item_dict: Dict) -> Optional[Callable[[], Item]]:
+    """
+    Build the constructor of an item definition from items.yaml, that creates a new instance of that item
+    each time it's called. The template of the item is built once, and shared by all of them.
+
+    :param Dict item_dict: The definition of the item.
+    :rtype: Optional[Callable[[], Item]]: None for an unknown type of item.
+    """
+    item_class = ITEM_CLASSES.get(item_dict.get('type'))
+    if item_class is None:
+        return None
+    return functools.partial(item_class.from_template, get_item_template(item_dict))
+
+
+@functools.lru_cache(maxsize=None)
+def get_item_catalog() -> ItemCatalog:
+    """
+    Get the ItemCatalog of the items.yaml file. The configuration doesn't change while the game runs, so every
+    map picks its random items from the same cached catalog.
+
+    :rtype: ItemCatalog
+    """
+    return ItemCatalog(get_configuration(ITEMS_SECTION))
 
 
-def get_random_item(tier: str, item_type: str) -> Item:
+def get_random_item(tier: str, item_type: str, rng: random.Random = None) -> Item:
     """
     Function to get a random item along all the items from the items.yaml file,
     considering a specific tier and type.
 
     :param str tier: The tier of the item.
     :param str item_type: The type of the item(healing, recovery, equipment)
+    :param random.Random rng: The random generator to use.
     :rtype: Item
     """
-    items_dicts = get_configuration(ITEMS_SECTION)
-    item_key = random.choice(
-        list({k: v for (k, v) in items_dicts.items() if v.get('tier') == tier and v.get('type') == item_type}.keys()))
-    item_dict = items_dicts.get(item_key)
-
-    if item_dict.get('type') == 'healing':
-        return HealingItem(name=item_dict.get('name'),
-                           tier=item_dict.get('tier'),
-                           description=item_dict.get('description'),
-                           weight=item_dict.get('weight'),
-                           attribute=item_dict.get('attribute'),
-                           base=item_dict.get('base'))
-    elif item_dict.get('type') == 'recovery':
-        return RecoveryItem(name=item_dict.get('name'),
-                            tier=item_dict.get('tier'),
-                            description=item_dict.get('description'),
-                            weight=item_dict.get('weight'),
-                            status=item_dict.get('status'))
-    elif item_dict.get('type') == 'equipment':
-        '''
-        Side-effects are instantiated here, because when the user equips the item, the side-effect it's 
-        already instantiated and it will be appended into the user's side-effect list, passing the same instance,
-        which makes the changes to duration attribute, each time a new turn comes, reflects both in the list of side
-        effects and also in the bag. 
-        
-        '''
-        side_effects = instantiate_side_effects(item_dict.get('side_effects'))
-
-        return EquipmentItem(name=item_dict.get('name'),
-                             tier=item_dict.get('tier'),
-                             description=item_dict.get('description'),
-                             weight=item_dict.get('weight'),
-                             attribute=item_dict.get('attribute'),
-                             base=item_dict.get('base'),
-                             side_effects=side_effects,
-                             category=item_dict.get('category'),
-                             usage=item_dict.get('usage'),
-                             wielding=item_dict.get('wielding', 0))
+    return get_item_catalog().get_random_item(tier, item_type, rng)
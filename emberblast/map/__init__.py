@@ -1,3 +1,4 @@
 from .map import MapFactory, Map, Graph
+from .generator import generate_connected_matrix
 
-__all__ = ['MapFactory', 'Map', 'Graph']
+__all__ = ['MapFactory', 'Map', 'Graph', 'generate_connected_matrix']
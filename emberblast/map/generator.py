@@ -0,0 +1,107 @@
+import random
+from collections import deque
+from typing import List, Tuple, Dict, Optional
+
+from emberblast.utils import generate_random_adjacent_matrix
+
+# The 8 neighbours of a tile, as players can walk horizontally, vertically and diagonally.
+NEIGHBOURS_OFFSETS = [(-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1, 1)]
+
+
+def get_matrix_islands(matrix: List[List[int]]) -> List[List[Tuple[int, int]]]:
+    """
+    Find the islands of walkable tiles of a matrix, where an island is a group of tiles that can reach each other
+    walking through its 8 neighbours. Each tile is visited only once.
+
+    :param List[List[int]] matrix: The squared matrix of the map.
+    :rtype: List[List[Tuple[int, int]]]
+    """
+    size = len(matrix)
+    visited = [[False] * size for _ in range(size)]
+    islands = []
+
+    for row in range(size):
+        for column in range(size):
+            if matrix[row][column] != 1 or visited[row][column]:
+                continue
+            visited[row][column] = True
+            island = [(row, column)]
+            queue = deque(island)
+            while queue:
+                current_row, current_column = queue.popleft()
+                for row_offset, column_offset in NEIGHBOURS_OFFSETS:
+                    next_row, next_column = current_row + row_offset, current_column + column_offset
+                    if 0 <= next_row < size and 0 <= next_column < size and not visited[next_row][next_column] \
+                            and matrix[next_row][next_column] == 1:
+                        visited[next_row][next_column] = True
+                        island.append((next_row, next_column))
+                        queue.append((next_row, next_column))
+            islands.append(island)
+    return islands
+
+
+def connect_matrix_islands(matrix: List[List[int]]) -> None:
+    """
+    Connect all the islands of walkable tiles of a matrix into a single one, carving corridors through the
+    non-walkable tiles.
+
+    Starting from the largest island, a BFS grows through all the tiles of the matrix, walkable or not, and whenever
+    it reaches a tile of an island that isn't connected yet, the path it took from the connected area is carved, and
+    the whole island joins the connected area. This way each tile is visited only once, and each island is connected
+    through a short corridor.
+
+    :param List[List[int]] matrix: The squared matrix of the map, it's changed in place.
+    :rtype: None
+    """
+    islands = get_matrix_islands(matrix)
+    if len(islands) < 2:
+        return
+
+    size = len(matrix)
+    island_of_tile: Dict[Tuple[int, int], int] = {}
+    for index, island in enumerate(islands):
+        for tile in island:
+            island_of_tile[tile] = index
+
+    main_island = max(islands, key=len)
+    parents: Dict[Tuple[int, int], Optional[Tuple[int, int]]] = {tile: None for tile in main_island}
+    queue = deque(main_island)
+
+    while queue:
+        current_tile = queue.popleft()
+        for row_offset, column_offset in NEIGHBOURS_OFFSETS:
+            next_tile = (current_tile[0] + row_offset, current_tile[1] + column_offset)
+            if not (0 <= next_tile[0] < size and 0 <= next_tile[1] < size) or next_tile in parents:
+                continue
+            parents[next_tile] = current_tile
+            if matrix[next_tile[0]][next_tile[1]] == 1:
+                # Reached a new island, carving the corridor back to the connected area.
+                corridor_tile = current_tile
+                while matrix[corridor_tile[0]][corridor_tile[1]] == 0:
+                    matrix[corridor_tile[0]][corridor_tile[1]] = 1
+                    corridor_tile = parents[corridor_tile]
+                for tile in islands[island_of_tile[next_tile]]:
+                    if tile not in parents:
+                        parents[tile] = current_tile
+                    queue.append(tile)
+            else:
+                queue.append(next_tile)
+
+
+def generate_connected_matrix(size: int, density: float = 0.75, rng: random.Random = None) -> List[List[int]]:
+    """
+    Generate a random squared matrix for a map, that is guaranteed to have all the walkable tiles connected, in a
+    single pass, instead of generating random matrices until one of them happens to be connected.
+
+    :param int size: The size of the matrix, for example 4, will generate a 4x4 matrix.
+    :param float density: The proportion of walkable tiles, before the islands are connected.
+    :param random.Random rng: The random generator to use.
+    :rtype: List[List[int]]
+    """
+    if rng is None:
+        rng = random.Random()
+    matrix = generate_random_adjacent_matrix(size, density, rng)
+    if size > 0 and not any(1 in row for row in matrix):
+        matrix[rng.randrange(size)][rng.randrange(size)] = 1
+    connect_matrix_islands(matrix)
+    return matrix
@@ -1,12 +1,28 @@
+import heapq
 import math
-from typing import List, Set, Dict, Tuple, Union
+from collections import Counter, deque
+from itertools import repeat
+from typing import List, Dict, Tuple, Optional, TYPE_CHECKING
 
-from emberblast.utils import generate_random_adjacent_matrix, generate_visited_default_matrix, convert_number_to_letter, \
-    convert_letter_to_number, is_square_matrix
+from emberblast.utils import generate_random_adjacent_matrix, convert_number_to_letter, is_square_matrix, LRUCache
 from emberblast.interface import IGraph, IVertex, IEdge
 
+if TYPE_CHECKING:
+    import numpy as np
+
+# Number of distances (4 bytes each) kept in the distance rows cache of each graph, so the number of rows cached
+# depends on the number of walkable nodes, 64MB at most.
+DISTANCE_CACHE_MAX_CELLS = 16 * 1024 * 1024
+# Number of (position, radius) range queries kept in the cache of each graph.
+RANGE_CACHE_MAX_SIZE = 2048
+# The (row offset, column offset, weight) of the 8 edges a node can have.
+EDGE_DIRECTIONS = [(-1, 0, 1), (1, 0, 1), (0, -1, 1), (0, 1, 1),
+                   (-1, -1, 1.414), (1, 1, 1.414), (1, -1, 1.414), (-1, 1, 1.414)]
+
 
 class Edge(IEdge):
+    __slots__ = ('source', 'destination', 'weight')
+
     def __init__(self, source: str, destination: str, weight: float) -> None:
         """
         Constructor of Edge
@@ -23,22 +39,37 @@ class Edge(IEdge):
 
 
 class Vertex(IVertex):
-    def __init__(self, vertex_id: str, value: int, position: dict) -> None:
+    __slots__ = ('vertex_id', 'index', 'value', 'graph')
+
+    def __init__(self, vertex_id: str, index: int, value: int, graph: 'Graph') -> None:
         """
         Constructor of Vertex
 
+        The vertex doesn't hold its position and edges, they are derived from the integer index and the adjacency
+        arrays of the graph, so the only string kept for each node is its ID.
+
         :param str vertex_id: The vertex ID, for example "A2" or "F3".
+        :param int index: The integer id of the vertex, which is row * size + column.
         :param int value: 1 for being a valid tile, or 0 to be a tile that players can not walk on.
-        :param dict position: dict representing the row and column.
+        :param Graph graph: The graph that owns this vertex.
         :rtype: None.
         """
         self.vertex_id = vertex_id
-        self.position = position
-        self.edges: List[IEdge] = []
+        self.index = index
         self.value = value
+        self.graph = graph
 
-    def add_edge(self, edge: Edge) -> None:
-        self.edges.append(edge)
+    @property
+    def position(self) -> Dict:
+        row, column = divmod(self.index, self.graph.size)
+        return {
+            'row': convert_number_to_letter(row),
+            'column': column
+        }
+
+    @property
+    def edges(self) -> List[IEdge]:
+        return self.graph.get_edges(self.index)
 
 
 class Graph(IGraph):
@@ -50,7 +81,8 @@ class Graph(IGraph):
         are randomly picked, nodes with value 1, are valid nodes are players can walk, and 0 they can't.
 
         The representation of the map, for the sake of clearness, will have the rows represented by alphabet letters,
-        and columns by numbers, like a chess board.
+        and columns by numbers, like a chess board. After the row Z, rows are represented by two or more letters, like
+        AA, AB, etc.
 
         So a map of size 3, will look like this one:
             1   2   3
@@ -58,6 +90,12 @@ class Graph(IGraph):
         B   *   *   *
         C   *   0   *
 
+        Internally, each node has an integer id (row * size + column), and the edges are kept in CSR arrays, where
+        the neighbours of the node i are adjacency_targets[adjacency_offsets[i]:adjacency_offsets[i + 1]], and their
+        distances are in adjacency_weights at the same positions. They are flat lists rather than the array module, as
+        indexing an array boxes a new number at each access, which is slower on the hot loops of the searches. The
+        string ids are only used at the boundaries.
+
         :param dict graph_dict: The already mounted graph, it's none, or it can be a created one, in the case player,
         is continuing a saved game.
         :param int size: base size of the matrix, for example, if size = 4, matrix will be based on 4 x 4.
@@ -68,6 +106,15 @@ class Graph(IGraph):
         self.size = size
         self.graph_dict: Dict[str, Vertex] = graph_dict
         self.matrix = [[]]
+        self.adjacency_offsets: List[int] = [0]
+        self.adjacency_targets: List[int] = []
+        self.adjacency_weights: List[float] = []
+        self._string_ids: List[str] = []
+        self._walkable_ids: List[int] = []
+        self._vertex_index: Dict[str, int] = {}
+        self.distance_rows_cache = LRUCache(1)
+        self.range_cache = LRUCache(RANGE_CACHE_MAX_SIZE)
+        self._component_labels: Optional[Dict[str, int]] = None
 
     def init_graph(self, fixed_matrix: List[List[int]] = None) -> None:
         """
@@ -76,6 +123,9 @@ class Graph(IGraph):
 
         :rtype: None.
         """
+        # NumPy is only needed once a map is built, so it's imported here to keep it out of the startup time.
+        import numpy as np
+
         if fixed_matrix is not None:
             if is_square_matrix(fixed_matrix):
                 self.matrix = fixed_matrix
@@ -83,126 +133,72 @@ class Graph(IGraph):
         else:
             self.matrix = generate_random_adjacent_matrix(self.size)
 
-        visited = generate_visited_default_matrix(self.size)
-        self._create_matrix_dfs_traverse(self.matrix, 0, 0, visited)
+        self._vertex_index = {}
+        self.range_cache.clear()
+        self._component_labels = None
+        walkable_mask = np.asarray(self.matrix, dtype=np.int8).reshape(self.size, self.size) == 1
+        self._create_matrix_vertexes(self.matrix)
+        self._compute_edges(walkable_mask)
+        self._walkable_ids = np.flatnonzero(walkable_mask).tolist()
+        self.distance_rows_cache = LRUCache(max(1, DISTANCE_CACHE_MAX_CELLS // max(1, len(self._walkable_ids))))
 
-    def _create_matrix_dfs_traverse(self, matrix: List[List[int]], row: int, column: int,
-                                    visited: List[List[bool]]) -> None:
+    def _create_matrix_vertexes(self, matrix: List[List[int]]) -> None:
         """
-        Private recursive method to create a matrix, using DFS preorder algorithm for traversing the matrix,
-        and building each of the positions of it.
-
-        It's a squared adjacent matrix, that will be converted into a graph, that represents the map. 0 vertexes means
-        invalid nodes, where players can not walk on, and 1 are the valid ones.
-
-        Also, it computes the edges between two valid nodes(vertexes), adopting a square logic, horizontal/vertical
-        edges have a weight(distance) of 1, and diagonal is weighted based in sqrt(2) * 1, which is the square diagonal
-        formula.
+        Private method to build each of the positions of the matrix, in row-major order, so the integer id of each
+        vertex is row * size + column. It's a squared adjacent matrix, that will be converted into a graph, that
+        represents the map. 0 vertexes means invalid nodes, where players can not walk on, and 1 are the valid ones.
 
         :param List[List[int]] matrix: The squared list, that represents the matrix.
-        :param int row: The current row that is being visited by the traversal recursive function.
-        :param int column: The current column that is being visited by the traversal recursive function.
-        :param List[List[int]] matrix: The squared array, that represents the matrix.
-        :param List[List[bool]]: squared list that represents the nodes that have already been visited.
         :rtype: None.
         """
-        if row >= self.size or column >= self.size or visited[row][column]:
-            return
-        visited[row][column] = True
-        letter_row = convert_number_to_letter(row)
-        vertex_id = letter_row + str(column)
-        position = {
-            'row': letter_row,
-            'column': column
-        }
-        vertex = Vertex(vertex_id, matrix[row][column], position)
-        if vertex.value == 1:
-            self._compute_vertical_edges(vertex, row, column, matrix)
-            self._compute_horizontal_edges(vertex, row, column, matrix)
-            self._compute_diagonal_edges(vertex, row, column, matrix)
-        self.graph_dict[vertex_id] = vertex
+        rows = [convert_number_to_letter(row) for row in range(self.size)]
+        columns = [str(column) for column in range(self.size)]
+        self._string_ids = [row + column for row in rows for column in columns]
+        values = [value for row in matrix for value in row]
+        self.graph_dict = dict(zip(self._string_ids, map(Vertex, self._string_ids, range(len(values)), values,
+                                                         repeat(self))))
 
-        self._create_matrix_dfs_traverse(matrix, row + 1, column, visited)
-        self._create_matrix_dfs_traverse(matrix, row, column + 1, visited)
-
-    def _compute_vertical_edges(self, vertex: IVertex, row: int, column: int, matrix: List[List[int]]) -> None:
+    def _compute_edges(self, walkable_mask: 'np.ndarray') -> None:
         """
-        Function that receives a vertex(node), and compute all the neighbour vertical edges, looking for valid
-        edges.
-
+        Compute the edges between valid nodes(vertexes) for the whole matrix at once, and pack them into the CSR
+        arrays. For each one of the 8 directions, the walkable mask is shifted, and a node has an edge in that
+        direction when both itself and the shifted neighbour are walkable. Horizontal/vertical edges have a
+        weight(distance) of 1, and diagonal is weighted based in sqrt(2) * 1, which is the square diagonal formula.
 
-        :param IVertex vertex: Current vertex to be analysed.
-        :param int row: Current row where vertex is.
-        :param int column: Current column where vertex is.
-        :param List[List[int]] matrix: The entire matrix.
+        :param np.ndarray walkable_mask: Boolean matrix, True for the walkable nodes.
         :rtype: None.
         """
-        # upper edge
-        if row - 1 >= 0:
-            if matrix[row - 1][column] == 1:
-                edge = Edge(vertex.vertex_id, convert_number_to_letter(row - 1) + str(column), 1)
-                vertex.add_edge(edge)
-        # lower
-        if row + 1 < self.size:
-            if matrix[row + 1][column] == 1:
-                edge = Edge(vertex.vertex_id, convert_number_to_letter(row + 1) + str(column), 1)
-                vertex.add_edge(edge)
+        import numpy as np
 
-    def _compute_horizontal_edges(self, vertex: IVertex, row: int, column: int, matrix: List[List[int]]) -> None:
-        """
-        Function that receives a vertex(node), and compute all the neighbour horizontal edges, looking for valid
-        edges.
+        padded_mask = np.pad(walkable_mask, 1)
+        has_edge = np.empty((self.size * self.size, len(EDGE_DIRECTIONS)), dtype=bool)
+        for direction, (row_offset, column_offset, _) in enumerate(EDGE_DIRECTIONS):
+            shifted_mask = padded_mask[1 + row_offset:1 + row_offset + self.size,
+                                       1 + column_offset:1 + column_offset + self.size]
+            has_edge[:, direction] = (walkable_mask & shifted_mask).ravel()
 
+        # nonzero walks the rows in order, so the edges come grouped by source, as the CSR layout expects.
+        sources, directions = np.nonzero(has_edge)
+        index_offsets = np.array([row * self.size + column for row, column, _ in EDGE_DIRECTIONS])
+        weights = np.array([weight for _, _, weight in EDGE_DIRECTIONS])
+        offsets = np.zeros(self.size * self.size + 1, dtype=np.int64)
+        np.cumsum(has_edge.sum(axis=1), out=offsets[1:])
 
-        :param IVertex vertex: Current vertex to be analysed.
-        :param int row: Current row where vertex is.
-        :param int column: Current column where vertex is.
-        :param List[List[int]] matrix: The entire matrix.
-        :rtype: None.
-        """
-        # left edge
-        if column - 1 >= 0:
-            if matrix[row][column - 1] == 1:
-                edge = Edge(vertex.vertex_id, convert_number_to_letter(row) + str(column - 1), 1)
-                vertex.add_edge(edge)
-        # right edge
-        if column + 1 < self.size:
-            if matrix[row][column + 1] == 1:
-                edge = Edge(vertex.vertex_id, convert_number_to_letter(row) + str(column + 1), 1)
-                vertex.add_edge(edge)
+        self.adjacency_offsets = offsets.tolist()
+        self.adjacency_targets = (sources + index_offsets[directions]).tolist()
+        self.adjacency_weights = weights[directions].tolist()
 
-    def _compute_diagonal_edges(self, vertex: IVertex, row: int, column: int, matrix: List[List[int]]) -> None:
+    def get_edges(self, index: int) -> List[IEdge]:
         """
-        Function that receives a vertex(node), and compute all the neighbour diagonal edges, looking for valid
-        edges.
-
-        Remember that diagonal edges, are weighted as sqrt(2) * 1.
-
+        Build the edges of a node from the adjacency arrays, with the string ids of both ends.
 
-        :param IVertex vertex: Current vertex to be analysed.
-        :param int row: Current row where vertex is.
-        :param int column: Current column where vertex is.
-        :param List[List[int]] matrix: The entire matrix.
-        :rtype: None.
+        :param int index: The integer id of the node.
+        :rtype: List[IEdge]
         """
-        if column - 1 >= 0 and row - 1 >= 0:
-            if matrix[row - 1][column - 1] == 1:
-                edge = Edge(vertex.vertex_id, convert_number_to_letter(row - 1) + str(column - 1), 1.414)
-                vertex.add_edge(edge)
-        if column + 1 < self.size and row + 1 < self.size:
-            if matrix[row + 1][column + 1] == 1:
-                edge = Edge(vertex.vertex_id, convert_number_to_letter(row + 1) + str(column + 1), 1.414)
-                vertex.add_edge(edge)
-
-        if column - 1 >= 0 and row + 1 < self.size:
-            if matrix[row + 1][column - 1] == 1:
-                edge = Edge(vertex.vertex_id, convert_number_to_letter(row + 1) + str(column - 1), 1.414)
-                vertex.add_edge(edge)
-
-        if row - 1 >= 0 and column + 1 < self.size:
-            if matrix[row - 1][column + 1] == 1:
-                edge = Edge(vertex.vertex_id, convert_number_to_letter(row - 1) + str(column + 1), 1.414)
-                vertex.add_edge(edge)
+        source = self._string_ids[index]
+        start, end = self.adjacency_offsets[index], self.adjacency_offsets[index + 1]
+        return [Edge(source, self._string_ids[self.adjacency_targets[i]], self.adjacency_weights[i])
+                for i in range(start, end)]
 
     def get_list_of_nodes(self) -> List[str]:
         """
@@ -220,63 +216,79 @@ class Graph(IGraph):
         :param int column: Column of the vertex.
         :rtype:  List[str]
         """
-        letter = convert_number_to_letter(row)
-        vertex = self.graph_dict.get(letter + str(column))
-        return True if vertex.value == 1 else False
+        return self.matrix[row][column] == 1
 
-    def compute_recursive_range_edges(self, vertex: IVertex, reach: float, available_nodes: Set[str],
-                                      origin_node: str) -> None:
+    def compute_range_distances(self, position: str, reach: float) -> Dict[str, float]:
         """
-        This function traverses the map using a dijkstra logic, trying to find all the possibilities of paths to
-        walk on, within a determined reach(distance).
+        This function traverses the map using a bounded Dijkstra, finding all the nodes that can be reached within
+        a determined reach(distance), and the shortest distance to each one of them.
 
-        This function is recursive, because it checks all the possibilities of movement starting from one vertex
-        considering a base distance. For example, starting from "A1" with a distance of 3, it will recursively find
-        possibilities, and for each new recursive call, the distance will be decreased by 1 (horizontal/vertical)
-        possibilities, and sqrt(2) * 1 (diagonal).
+        Each vertex is settled only once, with the best remaining reach to it, and paths are only expanded while they
+        are inside the reach, so the cost depends on the number of nodes within the range, and not on the number of
+        possible paths to them. Horizontal/vertical edges decrease the reach by 1, and diagonal by sqrt(2) * 1.
 
-        :param IVertex vertex: The current vertex to be analysed.
+        :param str position: The origin node. For example, "A1".
         :param float reach: The distance to look for possibilities.
-        :param Set[str] available_nodes: The list that will be recursively incremented will be found possibilities.
-        :param str origin_node: The origin node. For example, "A1".
-        :rtype: None
-        """
-        for edge in vertex.edges:
-            if reach >= edge.weight:
-                if edge.destination == origin_node:
-                    continue
-                remaining_reach = reach - edge.weight
-                reached_vertex = self.graph_dict.get(edge.destination)
-                available_nodes.add(reached_vertex.vertex_id)
-                if remaining_reach >= 1:
-                    self.compute_recursive_range_edges(reached_vertex, remaining_reach,
-                                                       available_nodes, vertex.vertex_id)
-        return
+        :rtype: Dict[str, float]
+        """
+        source = self.graph_dict.get(position).index
+        offsets, targets, weights = self.adjacency_offsets, self.adjacency_targets, self.adjacency_weights
+        distances = {source: 0}
+        unsettled_nodes: List[Tuple[float, int]] = [(0, source)]
+        settled_nodes = set()
+
+        while unsettled_nodes:
+            current_distance, current = heapq.heappop(unsettled_nodes)
+            if current in settled_nodes:
+                continue
+            settled_nodes.add(current)
+
+            for i in range(offsets[current], offsets[current + 1]):
+                destination = targets[i]
+                computed_distance = current_distance + weights[i]
+                if computed_distance <= reach and computed_distance < distances.get(destination, math.inf):
+                    distances[destination] = computed_distance
+                    heapq.heappush(unsettled_nodes, (computed_distance, destination))
+        string_ids = self._string_ids
+        return {string_ids[index]: distance for index, distance in distances.items()}
 
     def get_available_nodes_in_range(self, position: str, radius: int) -> List[str]:
         """
         Get all the possibilities of nodes to walk, starting from one.
-        It will get the help of compute_recursive_range_edges function, to look for
+        It will get the help of compute_range_distances function, to look for
         all the possibilities.
 
         This function is called whenever a player wants to walk within the map, where the
         radius can be represented as the character's move speed.
 
+        The same positions and radius are queried many times along a game, so the results are kept in the range
+        cache, and a fresh list is returned each time, as callers may change it.
+
         :param str position: The starting position, for example "A1".
         :param int radius: The radius(max distance) to look for possibilities.
         :rtype: List[str]
         """
-        start_vertex = self.graph_dict.get(position)
-        available_nodes_set = set()
-        self.compute_recursive_range_edges(start_vertex, radius, available_nodes_set, position)
-        available_nodes_list = list(available_nodes_set)
+        return list(self._get_cached_nodes_in_range(position, radius))
+
+    def _get_cached_nodes_in_range(self, position: str, radius: int) -> Tuple[str, ...]:
+        """
+        Get the nodes within the range from the range cache, computing and caching them in the case of a miss.
 
-        if position in available_nodes_list:
-            available_nodes_list.remove(position)
-        return available_nodes_list
+        :param str position: The starting position, for example "A1".
+        :param int radius: The radius(max distance) to look for possibilities.
+        :rtype: Tuple[str, ...]
+        """
+        key = (position, radius)
+        available_nodes = self.range_cache.get(key)
+        if available_nodes is None:
+            distances = self.compute_range_distances(position, radius)
+            distances.pop(position, None)
+            available_nodes = tuple(distances.keys())
+            self.range_cache.put(key, available_nodes)
+        return available_nodes
 
     def is_target_in_range(self, position: str, radius: int, target_position: str) -> bool:
-        available_nodes = self.get_available_nodes_in_range(position, radius)
+        available_nodes = self._get_cached_nodes_in_range(position, radius)
         if target_position in available_nodes:
             return True
         return False
@@ -287,7 +299,7 @@ class Graph(IGraph):
 
         :rtype: int
         """
-        return len([x for x in filter(lambda vertex: vertex.value == 1, list(self.graph_dict.values()))])
+        return len(self._walkable_ids)
 
     def is_graph_defective(self) -> bool:
         """
@@ -296,15 +308,59 @@ class Graph(IGraph):
         regardless the distance, is can say that there are "islands" on the map, where players could not access another
         areas of the map.
 
-        :rtype: Dict[str, IVertex]
+        The islands are found by a single traversal of the graph, see get_connected_components.
+
+        :rtype: bool
         """
-        walkable_nodes = self.get_walkable_nodes()
-        for key in walkable_nodes.keys():
-            distances = self.get_shortest_path(key)
-            for value in distances.values():
-                if value == math.inf:
-                    return True
-        return False
+        return self.get_number_of_islands() > 1
+
+    def get_connected_components(self) -> Dict[str, int]:
+        """
+        Label each walkable node with the component(island) it belongs to, where all the nodes of a component can
+        reach each other. The labels are found with a BFS starting from each node that hasn't been labeled yet, so
+        each node and edge is visited only once, and they are kept until init_graph is called again.
+
+        :rtype: Dict[str, int]
+        """
+        if self._component_labels is None:
+            offsets, targets = self.adjacency_offsets, self.adjacency_targets
+            labels = [-1] * len(self._string_ids)
+            current_label = 0
+            for index in self._walkable_ids:
+                if labels[index] != -1:
+                    continue
+                labels[index] = current_label
+                queue = deque([index])
+                while queue:
+                    current = queue.popleft()
+                    for destination in targets[offsets[current]:offsets[current + 1]]:
+                        if labels[destination] == -1:
+                            labels[destination] = current_label
+                            queue.append(destination)
+                current_label += 1
+            self._component_labels = {self._string_ids[index]: labels[index] for index in self._walkable_ids}
+        return self._component_labels
+
+    def get_number_of_islands(self) -> int:
+        """
+        Get the number of components(islands) of walkable nodes, that can't reach each other.
+
+        :rtype: int
+        """
+        labels = self.get_connected_components()
+        return len(set(labels.values()))
+
+    def get_largest_component(self) -> List[str]:
+        """
+        Get the nodes of the biggest component(island) of the map.
+
+        :rtype: List[str]
+        """
+        labels = self.get_connected_components()
+        if not labels:
+            return []
+        largest_label = Counter(labels.values()).most_common(1)[0][0]
+        return [key for key, label in labels.items() if label == largest_label]
 
     def get_walkable_nodes(self) -> Dict[str, IVertex]:
         """
@@ -312,7 +368,7 @@ class Graph(IGraph):
 
         :rtype: Dict[str, IVertex]
         """
-        return {k: v for (k, v) in self.graph_dict.items() if v.value == 1}
+        return {self._string_ids[index]: self.graph_dict[self._string_ids[index]] for index in self._walkable_ids}
 
     def fill_infinite_distance_dict(self, distances: Dict[str, float]) -> None:
         """
@@ -322,8 +378,40 @@ class Graph(IGraph):
         :param  Dict[str, float] distances: The dictionary of the distances between source vertex and another vertexes.
         :rtype: None
         """
-        for key in self.get_walkable_nodes().keys():
-            distances[key] = math.inf
+        for index in self._walkable_ids:
+            distances[self._string_ids[index]] = math.inf
+
+    def get_vertex_index(self) -> Dict[str, int]:
+        """
+        Get the indexes of the walkable nodes in the distance rows, from get_distance_row.
+
+        :rtype: Dict[str, int]
+        """
+        if not self._vertex_index:
+            self._vertex_index = {self._string_ids[index]: position for position, index in
+                                  enumerate(self._walkable_ids)}
+        return self._vertex_index
+
+    def get_distance_row(self, source: str) -> 'np.ndarray':
+        """
+        Get the shortest distances from a walkable node to all the walkable nodes, indexed by the ids of
+        get_vertex_index. Unreachable nodes have an infinite distance.
+
+        The map topology never changes after the graph is initialized, so the rows are kept in a cache, by source,
+        until init_graph is called again. Only the rows of the sources that are queried are computed, running
+        Dijkstra from each one of them, as computing all the pairs upfront would take too long on big maps.
+
+        :param str source: The source position, for example "A1".
+        :rtype: np.ndarray
+        """
+        distance_row = self.distance_rows_cache.get(source)
+        if distance_row is None:
+            import numpy as np
+
+            distances = self._compute_distances(self.graph_dict[source].index)
+            distance_row = np.array([distances[index] for index in self._walkable_ids], dtype=np.float32)
+            self.distance_rows_cache.put(source, distance_row)
+        return distance_row
 
     def get_average_distances_sources_destinations_map(self, sources: List[str],
                                                        positions: List[str]) -> Dict[str, float]:
@@ -336,6 +424,13 @@ class Graph(IGraph):
         return averages_map
 
     def get_average_distance_source_destinations(self, source: str, positions: List[str]) -> float:
+        vertex_index = self.get_vertex_index()
+        if source in vertex_index:
+            distances = self.get_distance_row(source)
+            total_distance = sum(float(distances[vertex_index[position]]) for position in positions
+                                 if position in vertex_index)
+            return total_distance / len(positions)
+
         distances = self.get_shortest_path(source)
         total_distance = 0
 
@@ -345,52 +440,73 @@ class Graph(IGraph):
         return total_distance / len(positions)
 
     def get_shortest_distance_between_positions(self, s1: str, s2: str) -> float:
-        distances = self.get_shortest_path(s1)
+        """
+        Get the shortest distance between two positions, it's a lookup on the distance row of the source, which is
+        computed once and cached.
+
+        :param str s1: The source position, for example "A1".
+        :param str s2: The destination position, for example "C3".
+        :rtype: float
+        """
+        vertex_index = self.get_vertex_index()
+        if s1 in vertex_index:
+            if s2 not in vertex_index:
+                return 0
+            return float(self.get_distance_row(s1)[vertex_index[s2]])
+
+        distances = self.get_shortest_path(s1, s2)
         return distances.get(s2, 0)
 
-    def get_shortest_path(self, source_position: str) -> Dict[str, float]:
+    def get_shortest_path(self, source_position: str, target_position: str = None) -> Dict[str, float]:
         """
         Core method for Dijkstra algorithm, for getting each of the distances, and finding the shortest path to all
         the another available vertex in the map, starting from a source vertex.
 
-        Dijkstra strategy works on presuming that you don't know all the distances to all the possible destinations,
-        setting them to infinite, and start filling up them, and adding only the ones are lesser than the existing
-        one.
+        When a target position is informed, the algorithm stops as soon as the target is settled, so the distances of
+        the nodes that weren't reached yet, may not be the final ones.
 
-        :param  str source_position: The source vertex to start it.
-        :rtype: None
+        :param str source_position: The source vertex to start it.
+        :param str target_position: Optional destination, to stop the search as soon as it's reached.
+        :rtype: Dict[str, float]
         """
-        distances = {source_position: 0}
-        self.fill_infinite_distance_dict(distances)
-        distances[source_position] = 0
-        starting_node = self.graph_dict.get(source_position)
-        unsettled_nodes: List[IVertex] = [starting_node]
-        settled_nodes: List[IVertex] = []
-
-        while len(unsettled_nodes) != 0:
-            current = unsettled_nodes.pop(0)
-
-            for edge in current.edges:
-                neighbour_vertex = self.graph_dict.get(edge.destination)
-                self.compute_distance(current, neighbour_vertex, edge.weight, distances)
-                if neighbour_vertex not in settled_nodes:
-                    unsettled_nodes.append(neighbour_vertex)
-            settled_nodes.append(current)
-        return distances
+        target_vertex = self.graph_dict.get(target_position) if target_position is not None else None
+        distances = self._compute_distances(self.graph_dict.get(source_position).index,
+                                            target_vertex.index if target_vertex is not None else None)
+        return {self._string_ids[index]: distances[index] for index in self._walkable_ids}
 
-    @staticmethod
-    def compute_distance(source_vertex: IVertex, destination_vertex: IVertex, edge_weight: float,
-                         distances: Dict[str, float]) -> None:
+    def _compute_distances(self, source: int, target: int = None) -> List[float]:
         """
-        Check if the current measured edge weight it's lesser that the distance that already exists in the distances
-        dictionary to the destination vertex. In the case it's smaller, it will replace the existing value.
+        Dijkstra over the integer ids, returning the distances to all the nodes, indexed by their integer ids.
 
-        :param  IVertex source_vertex: The source vertex to start it.
-        :param  IVertex destination_vertex: Destination vertex.
-        :param  float edge_weight: The edge weight.
-        :param  Dict[str, float] distances: The dictionaries of distances.
-        :rtype: None
-        """
-        computed_distance = distances.get(source_vertex.vertex_id) + edge_weight
-        if computed_distance < distances[destination_vertex.vertex_id]:
-            distances[destination_vertex.vertex_id] = computed_distance
+        Dijkstra strategy works on presuming that you don't know all the distances to all the possible destinations,
+        setting them to infinite, and start filling up them, and adding only the ones are lesser than the existing
+        one. The unsettled nodes are kept in a binary heap, so the closest one is always the next to be settled, and
+        each node is settled only once.
+
+        :param int source: The integer id of the source node.
+        :param int target: Optional integer id of the destination, to stop the search as soon as it's reached.
+        :rtype: List[float]
+        """
+        offsets, targets, weights = self.adjacency_offsets, self.adjacency_targets, self.adjacency_weights
+        distances = [math.inf] * len(self._string_ids)
+        distances[source] = 0
+        settled_nodes = bytearray(len(self._string_ids))
+        unsettled_nodes: List[Tuple[float, int]] = [(0, source)]
+
+        while unsettled_nodes:
+            current_distance, current = heapq.heappop(unsettled_nodes)
+            if settled_nodes[current]:
+                continue
+            settled_nodes[current] = 1
+            if current == target:
+                break
+
+            for i in range(offsets[current], offsets[current + 1]):
+                destination = targets[i]
+                if settled_nodes[destination]:
+                    continue
+                computed_distance = current_distance + weights[i]
+                if computed_distance < distances[destination]:
+                    distances[destination] = computed_distance
+                    heapq.heappush(unsettled_nodes, (computed_distance, destination))
+        return distances
@@ -3,60 +3,83 @@ from math import floor
 from typing import List, Dict, Optional
 
 from .graph import Graph
-from emberblast.utils import convert_number_to_letter
+from .generator import generate_connected_matrix
+from emberblast.utils import generate_random_adjacent_matrix, GAME_SECTION
 from emberblast.conf import get_configuration
-from emberblast.item import get_random_item
+from emberblast.item import get_item_catalog
 from emberblast.interface import IPlayer, IItem, IMap, ISideEffect
 
 
 class Map(IMap):
 
-    def __init__(self, name: str, map_type: str, size: int) -> None:
+    def __init__(self, name: str, map_type: str, size: int, rng: random.Random = None) -> None:
         """
         Pick a random postion for a player in the game start.
 
         :param str name: The name of the map.
         :param str map_type: The type of the terrain of the map.
         :param int size: The size of the map, used to construct the graph.
+        :param random.Random rng: The random generator of the game, for placing players and items.
         :rtype: None.
         """
         self.name = name
         self.type = map_type
         self.size = size
+        self.rng = rng if rng is not None else random.Random()
         self.graph = Graph(size=size)
         self.items: Dict[str, List[IItem]] = {}
         self.traps: Dict[str, List[ISideEffect]] = {}
 
-    def define_player_initial_position_random(self, players: List[IPlayer]) -> None:
+    def define_player_initial_position_random(self, players: List[IPlayer], spread: bool = False) -> None:
         """
-        Pick a random postion for a player in the game start.
+        Pick a random position for each player in the game start, sampling the walkable nodes without replacement,
+        so no two players start in the same tile.
 
-        :param List[IPlayer] players: The available positions to scan.
-        :rtype: str.
+        :param List[IPlayer] players: The players to be placed.
+        :param bool spread: Place the players as far as possible from each other, instead of randomly.
+        :rtype: None.
         """
-        selected_positions = []
+        walkable_positions = list(self.graph.get_walkable_nodes().keys())
+        if len(players) > len(walkable_positions):
+            raise ValueError('The map has {tiles} walkable tiles, which are not enough for {players} players'.format(
+                tiles=len(walkable_positions), players=len(players)))
 
-        for player in players:
-            position = self.pick_available_position(selected_positions)
+        if spread:
+            positions = self.pick_spread_positions(walkable_positions, len(players))
+        else:
+            positions = self.rng.sample(walkable_positions, len(players))
+        for player, position in zip(players, positions):
             player.set_position(position)
-            selected_positions.append(position)
 
-    def pick_available_position(self, selected_positions: List[str]) -> str:
+    def pick_spread_positions(self, walkable_positions: List[str], number_of_positions: int) -> List[str]:
         """
-        Function that will be called on game construction, to place players randomly in the map,
-        considering that player can't start in a tile that there is already another player.
+        Pick positions far from each other, with the farthest-point strategy: starting from a random position, each
+        next one is the position with the largest distance to its nearest already picked position, so the minimum
+        distance between any two players is as large as possible. Only the positions reachable from the first one
+        are considered, so players never start in separated islands.
 
-        :param List[str] selected_positions: The available positions to scan.
-        :rtype: str.
+        :param List[str] walkable_positions: The positions that can be picked.
+        :param int number_of_positions: How many positions to pick.
+        :rtype: List[str].
         """
-        while True:
-            row = random.randint(0, self.size - 1)
-            column = random.randint(0, self.size - 1)
-            vertex_valid = self.graph.is_vertex_valid(row, column)
+        import numpy as np
 
-            position = convert_number_to_letter(row) + str(column)
-            if vertex_valid and position not in selected_positions:
-                return position
+        vertex_index = self.graph.get_vertex_index()
+        first_position = self.rng.choice(walkable_positions)
+        nearest_distances = self.graph.get_distance_row(first_position).copy()
+        candidates = [position for position, index in vertex_index.items() if np.isfinite(nearest_distances[index])]
+        if len(candidates) < number_of_positions:
+            return self.rng.sample(walkable_positions, number_of_positions)
+
+        positions = [first_position]
+        # Shuffling the candidates, so ties between equally distant positions are broken randomly.
+        self.rng.shuffle(candidates)
+        candidates_indexes = np.array([vertex_index[position] for position in candidates], dtype=np.int64)
+        while len(positions) < number_of_positions:
+            position = candidates[int(np.argmax(nearest_distances[candidates_indexes]))]
+            positions.append(position)
+            np.minimum(nearest_distances, self.graph.get_distance_row(position), out=nearest_distances)
+        return positions
 
     def get_traps_from_position(self, position: str) -> List[ISideEffect]:
         """
@@ -112,27 +135,16 @@ class Map(IMap):
                                   'uncommon': ['healing'] * 50 + ['equipment'] * 50,
                                   'rare': ['healing'] * 20 + ['equipment'] * 80,
                                   'legendary': ['equipment'] * 80}
+        item_catalog = get_item_catalog()
+        tiers = ['common'] * common_items_number + ['uncommon'] * uncommon_items_number + \
+                ['rare'] * rare_items_number + ['legendary'] * legendary_items_number
 
-        for i in range(common_items_number + uncommon_items_number + rare_items_number + legendary_items_number):
-            key = random.choice(list(walkable_nodes.keys()))
-            walkable_nodes.pop(key)
-            tier = ''
-            if common_items_number > 0:
-                tier = 'common'
-                common_items_number = common_items_number - 1
-            elif uncommon_items_number > 0:
-                tier = 'uncommon'
-                uncommon_items_number = uncommon_items_number - 1
-            elif rare_items_number > 0:
-                tier = 'rare'
-                rare_items_number = rare_items_number - 1
-            elif legendary_items_number > 0:
-                tier = 'legendary'
-                legendary_items_number = legendary_items_number - 1
-
-            item_type = random.choice(item_type_distribution.get(tier))
-            item = get_random_item(tier, item_type)
-            self.add_item_to_map(key, item)
+        # Sampling all the positions at once, as picking them one by one from the remaining nodes is quadratic.
+        positions = self.rng.sample(list(walkable_nodes.keys()), len(tiers))
+        for position, tier in zip(positions, tiers):
+            item_type = self.rng.choice(item_type_distribution.get(tier))
+            item = item_catalog.get_random_item(tier, item_type, self.rng)
+            self.add_item_to_map(position, item)
 
     def check_item_in_position(self, position: str) -> Optional[List[IItem]]:
         """
@@ -161,36 +173,47 @@ class Map(IMap):
         else:
             self.items[position] = [item]
 
-    def add_trap_to_map(self, position: str, side_effects: List[ISideEffect]) -> None:
+    def add_trap_to_map(self, position: str, side_effects: List[ISideEffect], caster: Optional[IPlayer] = None) -> None:
         """
         Add a trap to map, usually thieves are the ones that are specialized on that kind of job.
 
         :param str position: The position of the map, like "A2" or "C4" where the trap will be added.
-        :param List[ISideEffect] side_effects: Side effects list.
+        :param List[ISideEffect] side_effects: Side effects list, each trap gets its own instances of them.
+        :param Optional[IPlayer] caster: The player that placed the trap.
 
         :rtype: None.
         """
-        if self.traps.get(position, None):
-            self.traps.get(position).extend(side_effects)
-        else:
-            self.traps[position] = side_effects
+        self.traps.setdefault(position, []).extend(side_effect.new_instance(caster) for side_effect in side_effects)
 
 
 class MapFactory:
-    def create_map(self, map_size: int) -> IMap:
+    def create_map(self, map_size: int, rng: random.Random = None) -> IMap:
         """
         Factory design pattern to create a new map.
 
         :param int map_size: The size of the map, it will be expressed as the number of tiles of a matrix,
         For example, size = 5, the map will be based on a 5 x 5 matrix.
 
+        The way maps are generated can be configured in the game section of the configuration file, with the
+        walkable density being the proportion of tiles that players can walk on:
+            - connected: the islands of a random matrix are connected into a single one, in a single pass.
+            - rejection: random matrices are generated until one of them has a single island, which is checked with a
+            single traversal of the graph.
+
+        :param random.Random rng: The random generator of the game, that will be kept by the map.
         :rtype: Map.
         """
-        game_map = Map('test', 'wind', map_size)
-        invalid_map = True
+        game_configuration = get_configuration(GAME_SECTION)
+        density = game_configuration.get('walkable_density', 0.75)
+        game_map = Map('test', 'wind', map_size, rng)
 
+        if game_configuration.get('map_generation', 'connected') == 'connected':
+            game_map.graph.init_graph(generate_connected_matrix(map_size, density, game_map.rng))
+            return game_map
+
+        invalid_map = True
         while invalid_map:
-            game_map.graph.init_graph()
-            invalid_map = game_map.graph.is_graph_defective()
+            game_map.graph.init_graph(generate_random_adjacent_matrix(map_size, density, game_map.rng))
+            invalid_map = game_map.graph.get_number_of_islands() != 1
 
         return game_map
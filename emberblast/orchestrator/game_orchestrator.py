@@ -1,10 +1,6 @@
 import math
-import random
-from os import system
 from typing import List, Optional
 
-from colorama import Fore
-
 from emberblast.conf import get_configuration
 from emberblast.communicator import improve_attributes_automatically, communicator_injector
 from emberblast.skill import get_player_available_skills
@@ -16,6 +12,10 @@ from emberblast.utils.constants import EXPERIENCE_EARNED_ACTION
 
 @communicator_injector()
 class GameOrchestrator(IGameOrchestrator):
+    # Optional limit of turns, so games where nobody can finish the remaining players, like in simulations, still end.
+    max_turns: Optional[int] = None
+    # Compute the side effects of all the players at once, at the end of each turn, instead of in each player's play.
+    bulk_side_effects: bool = False
 
     def __init__(self, game: IGame) -> None:
         """
@@ -25,7 +25,6 @@ class GameOrchestrator(IGameOrchestrator):
         :param IGame game: The created game to be executed.
         :rtype: None.
         """
-        self.clear = lambda: system('clear')
         self.game = game
         self.actions = {}
         self.init_actions()
@@ -125,20 +124,58 @@ class GameOrchestrator(IGameOrchestrator):
         pass
 
     def check_iterated_side_effects(self, player: IPlayer) -> None:
-        iterated_side_effects = [x for x in
-                                 filter(lambda effect: effect.occurrence == 'iterated', player.side_effects)]
-
-        for side_effect in iterated_side_effects:
+        if self.bulk_side_effects:
+            return
+        for side_effect in player.side_effects.get_by_occurrence('iterated'):
             self.communicator.informer.event('side-effect')
             self.communicator.informer.iterated_side_effect_apply(player.name, side_effect)
+        was_alive = player.is_alive()
         player.compute_iterated_side_effects()
+        if was_alive and not player.is_alive():
+            self.communicator.informer.died_from_side_effects(player, self.get_side_effects_killer(player))
 
     def check_side_effect_duration(self, player: IPlayer) -> None:
+        if self.bulk_side_effects:
+            return
         ended_side_effects = player.compute_side_effect_duration()
         if len(ended_side_effects) > 0:
             for side_effect in ended_side_effects:
                 self.communicator.informer.side_effect_ended(player.name, side_effect)
 
+    def check_side_effects_in_bulk(self) -> None:
+        """
+        When the side effects are computed in bulk, at the end of each turn, the side effects of all the players are
+        applied and ticked at once, by the game. The killers are looked up before, while the side effects that may
+        kill are still on the players.
+
+        :rtype: None.
+        """
+        alive_players = self.game.get_all_alive_players()
+        killers = {}
+        for player in alive_players:
+            for side_effect in player.side_effects.get_by_occurrence('iterated'):
+                self.communicator.informer.iterated_side_effect_apply(player.name, side_effect)
+            killers[player] = self.get_side_effects_killer(player)
+        for player, side_effect in self.game.compute_side_effects_in_bulk():
+            self.communicator.informer.side_effect_ended(player.name, side_effect)
+        for player in alive_players:
+            if not player.is_alive():
+                self.communicator.informer.died_from_side_effects(player, killers[player])
+
+    def get_side_effects_killer(self, player: IPlayer) -> Optional[IPlayer]:
+        """
+        Get who gets the kill when a player dies from iterated side effects, the caster of the first one that
+        damages the player's life, unless the player cast it on himself.
+
+        :param IPlayer player: The player that died.
+        :rtype: Optional[IPlayer]
+        """
+        for side_effect in player.side_effects.get_by_occurrence('iterated'):
+            if side_effect.effect_type == 'debuff' and side_effect.attribute == 'health_points' and \
+                    side_effect.caster is not None and side_effect.caster is not player:
+                return side_effect.caster
+        return None
+
 
 class DeathMatchOrchestrator(GameOrchestrator):
 
@@ -164,12 +201,12 @@ class DeathMatchOrchestrator(GameOrchestrator):
             # player turn, and continue from there, if it's a new game, it will only game the first turn, which is the
             # first and the only element of the turns dictionary.
             turn_list = [list(self.game.turns.copy().keys())[-1]]
-            self.clear()
+            self.communicator.informer.clear()
             self.communicator.informer.line_separator()
             self.communicator.informer.force_loading(3, 'Starting game', ['bold'])
 
             for turn in turn_list:
-                self.clear()
+                self.communicator.informer.clear()
                 self.communicator.informer.new_turn(turn)
 
                 if not len(self.turn_remaining_players) > 0:
@@ -191,20 +228,26 @@ class DeathMatchOrchestrator(GameOrchestrator):
                     if isinstance(player, IControlledPlayer):
                         self.controlled_decisioning(player)
                     else:
-                        self.communicator.informer.force_loading(random.randint(2, 4))
+                        self.communicator.informer.force_loading(self.game.rng.randint(2, 4))
                         self.bot_decisioning(player)
                     self.turn_remaining_players.remove(player)
 
+                if self.bulk_side_effects:
+                    self.check_side_effects_in_bulk()
                 alive_players = self.game.get_all_alive_players()
                 if len(alive_players) < 2:
-                    self.clear()
-                    self.communicator.informer.player_won(alive_players[0].name)
+                    self.communicator.informer.clear()
+                    # Side effects computed in bulk may kill the last players at the same time, leaving no winner.
+                    if len(alive_players) == 1:
+                        self.communicator.informer.player_won(alive_players[0].name)
+                    break
+                if self.max_turns is not None and turn >= self.max_turns:
                     break
 
                 self.game.calculate_turn_order()
                 turn_list.append(turn + 1)
         except Exception as err:
-            print(err)
+            self.communicator.informer.unexpected_error(err)
 
     def bot_decisioning(self, player: IPlayer) -> None:
         """
@@ -218,8 +261,7 @@ class DeathMatchOrchestrator(GameOrchestrator):
             self.bot_controller.decide(player)
 
         except Exception as err:
-            print(err)
-            print(Fore.RED + 'System shutdown with unexpected error')
+            self.communicator.informer.unexpected_error(err)
 
         self.check_side_effect_duration(player)
         self.check_player_level_up(player)
@@ -429,7 +471,7 @@ class DeathMatchOrchestrator(GameOrchestrator):
         if selected_skill.kind == 'recover' or selected_skill.kind == 'buff':
             possible_foes = [player]
         if selected_skill.kind == 'trap':
-            self.game.game_map.add_trap_to_map(player.position, selected_skill.side_effects)
+            self.game.game_map.add_trap_to_map(player.position, selected_skill.side_effects, player)
             return
         if not selected_skill.applies_caster_only:
             possible_foes.extend(self.get_attack_possibilities(selected_skill.ranged, player, remaining_players))
@@ -451,7 +493,7 @@ class DeathMatchOrchestrator(GameOrchestrator):
         dice_result = self.game.roll_the_dice()
         self.communicator.informer.dice_result(player.name, dice_result, 'skill', self.game.dice_sides)
         dice_result_normalized = dice_result / self.game.dice_sides
-        selected_skill.execute(player, foes, dice_result_normalized)
+        selected_skill.execute(player, foes, dice_result_normalized, self.game.rng)
         return
 
     def item(self, player: IPlayer) -> Optional[bool]:
@@ -497,7 +539,7 @@ class DeathMatchOrchestrator(GameOrchestrator):
         if previous_equipment is not None:
             player.remove_side_effects(previous_equipment.side_effects)
         player.equipment.equip(equipment_item)
-        player.side_effects.extend(equipment_item.side_effects)
+        player.add_side_effects(equipment_item.side_effects)
         return
 
     def check(self, player: IPlayer) -> Optional[bool]:
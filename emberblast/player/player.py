@@ -1,8 +1,8 @@
 import math
-from typing import Union, List, Dict
+from typing import Union, List, Dict, Tuple
 
 from emberblast.conf import get_logger
-from emberblast.effect import SideEffect
+from emberblast.effect import SideEffect, SideEffectContainer
 from emberblast.interface import IPlayer, IItem, IHealingItem, IRecoveryItem, IBag, IJob, IRace, IEquipment, ISideEffect
 from emberblast.skill import get_player_available_skills
 
@@ -33,8 +33,11 @@ class Player(IPlayer):
         self.will = 2
         self.level = 1
         self.experience = 0
-        self.side_effects = []
+        self.side_effects = SideEffectContainer()
+        self._attribute_bonuses: Dict[Tuple[str, str], int] = {}
+        self._attribute_bonuses_key: Tuple[int, int] = None
         self.skills = []
+        self._skills_key = None
         self._alive = True
         self.position = ''
         self._hidden = False
@@ -221,12 +224,17 @@ class Player(IPlayer):
 
         :rtype: None
         """
-        for i in range(len(self.side_effects)):
-            existing_side_effect = self.side_effects[i]
-            if existing_side_effect.name == new_side_effect.name:
-                self.side_effects[i] = new_side_effect
-                return
-        self.side_effects.append(new_side_effect)
+        self.side_effects.add(new_side_effect)
+
+    def add_side_effects(self, side_effects: List[ISideEffect]) -> None:
+        """
+        Method for adding all the side effects of an equipment to the player.
+
+        :param List[ISideEffect] side_effects: side effects to be added.
+        :rtype: None
+        """
+        for side_effect in side_effects:
+            self.side_effects.append(side_effect)
 
     def use_item(self, item: IItem) -> None:
         """
@@ -239,9 +247,9 @@ class Player(IPlayer):
             self.heal(item.attribute, item.base)
         elif isinstance(item, IRecoveryItem):
             status = item.status
-            found_side_effect = filter(lambda side_effect: status == side_effect.name, self.side_effects)
-            if found_side_effect:
-                self.side_effects.remove(next(found_side_effect))
+            found_side_effect = self.side_effects.get(status)
+            if found_side_effect is not None:
+                self.side_effects.remove(found_side_effect)
 
     def get_attribute_real_value(self, attribute: str, usage: str = 'all') -> int:
         """
@@ -258,17 +266,37 @@ class Player(IPlayer):
                 result = self.get_defense_value(attribute)
             else:
                 result = self.__getattribute__(attribute)
-            for effect in self.side_effects:
-                if effect.attribute == attribute and effect.occurrence == 'constant':
-                    result = result + effect.base
-
-            result = result + self.equipment.get_attribute_addition(attribute, usage)
-            return result
+            return result + self.get_attribute_bonus(attribute, usage)
         except:
             logger = get_logger()
             logger.warn(f'Attribute: {attribute} does not exist, provide a valid one')
             return 0
 
+    def get_attribute_bonus(self, attribute: str, usage: str = 'all') -> int:
+        """
+        Get how much the constant side effects and the equipments add to an attribute. Those only change when a
+        side effect is added or removed, or when the equipment changes, so the bonuses are kept until then, and
+        computing the real value of an attribute doesn't need to go through all of them every time.
+
+        :param str attribute: Attribute to be computed.
+        :param str usage: If it will get melee, ranged or all equipments.
+        :rtype: int
+        """
+        bonuses_key = (self.side_effects.version, self.equipment.version)
+        if bonuses_key != self._attribute_bonuses_key:
+            self._attribute_bonuses = {}
+            self._attribute_bonuses_key = bonuses_key
+
+        bonus = self._attribute_bonuses.get((attribute, usage))
+        if bonus is None:
+            bonus = 0
+            for effect in self.side_effects.get_by_occurrence('constant'):
+                if effect.attribute == attribute:
+                    bonus = bonus + effect.base
+            bonus = bonus + self.equipment.get_attribute_addition(attribute, usage)
+            self._attribute_bonuses[(attribute, usage)] = bonus
+        return bonus
+
     def remove_side_effects(self, side_effects: List[ISideEffect]) -> None:
         """
         Method for helping removing a list of side effects from player.
@@ -277,8 +305,7 @@ class Player(IPlayer):
         :rtype: None
         """
         for side_effect in side_effects:
-            if side_effect in self.side_effects:
-                self.side_effects.remove(side_effect)
+            self.side_effects.remove(side_effect)
 
     def compute_iterated_side_effects(self) -> None:
         """
@@ -287,10 +314,7 @@ class Player(IPlayer):
 
         :rtype: None
         """
-        iterated_side_effects = [x for x in
-                                 filter(lambda effect: effect.occurrence == 'iterated', self.side_effects)]
-
-        for side_effect in iterated_side_effects:
+        for side_effect in self.side_effects.get_by_occurrence('iterated'):
             if side_effect.effect_type == 'buff':
                 self.heal(side_effect.attribute, side_effect.base)
             elif side_effect.effect_type == 'debuff':
@@ -307,13 +331,9 @@ class Player(IPlayer):
 
         :rtype: None
         """
-        ended_side_effects = []
-        for side_effect in self.side_effects:
-            side_effect.duration = side_effect.duration - 1
-            if side_effect.duration <= 0:
-                ended_side_effects.append(side_effect)
-                self.side_effects.remove(side_effect)
-                self.equipment.remove_side_effect(side_effect)
+        ended_side_effects = self.side_effects.tick()
+        for side_effect in ended_side_effects:
+            self.equipment.remove_side_effect(side_effect)
         return ended_side_effects
 
     def refresh_skills_list(self) -> None:
@@ -321,7 +341,14 @@ class Player(IPlayer):
         Depending on player's level, new skills can be revealed, this method checks if the player has new skills
         to learn, and ideally should be executed in the beginning of the game of when the player levels up.
 
+        The available skills only depend on the level and the mana, so they are only searched again when one of
+        them has changed since the last refresh.
+
         :rtype: None
         """
+        skills_key = (self.level, self.mana)
+        if skills_key == self._skills_key:
+            return
+        self._skills_key = skills_key
         available_skills = get_player_available_skills(self)
         self.skills = available_skills
@@ -0,0 +1,4 @@
+from .simulation import run_headless_game, get_game_result, DEFAULT_MAX_TURNS
+from .batch import run_simulation_batch, format_batch_report
+
+__all__ = ['run_headless_game', 'get_game_result', 'DEFAULT_MAX_TURNS', 'run_simulation_batch', 'format_batch_report']
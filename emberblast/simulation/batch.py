@@ -0,0 +1,129 @@
+import os
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import List, Optional, Dict
+
+from emberblast.interface import IBatchResult, IGroupStatistics
+from .simulation import run_headless_game, DEFAULT_MAX_TURNS
+
+# Number of games each worker runs before sending its partial statistics back.
+DEFAULT_CHUNK_SIZE = 50
+
+
+def run_games_chunk(seeds: List[int], bots_number: int, map_size: Optional[int], max_turns: int) -> Dict[str, Counter]:
+    """
+    Run one headless game for each seed, and count the statistics of all of them, so only the counters have to be
+    sent back to the main process.
+
+    :param List[int] seeds: The seed of each game.
+    :param int bots_number: The number of bots of each game.
+    :param int map_size: The size of the map of each game.
+    :param int max_turns: The maximum number of turns of each game.
+    :rtype: Dict[str, Counter]
+    """
+    counters = {key: Counter() for key in ['totals', 'job_games', 'job_wins', 'job_kills', 'race_games', 'race_wins',
+                                           'race_kills']}
+    for seed in seeds:
+        result = run_headless_game(bots_number, map_size, max_turns, seed)
+        counters['totals']['games'] += 1
+        counters['totals']['turns'] += result.get('turns')
+        if result.get('winner') is None:
+            counters['totals']['draws'] += 1
+        if len(result.get('errors')) > 0:
+            counters['totals']['errors'] += 1
+        for player in result.get('players'):
+            won = player.get('alive') and result.get('winner') == player.get('name')
+            for group, name in [('job', player.get('job')), ('race', player.get('race'))]:
+                counters[group + '_games'][name] += 1
+                counters[group + '_wins'][name] += 1 if won else 0
+                counters[group + '_kills'][name] += player.get('kills')
+    return counters
+
+
+def get_group_statistics(games: Counter, wins: Counter, kills: Counter) -> Dict[str, IGroupStatistics]:
+    """
+    Compute the win rate and the average kills of each job or race, from its counters.
+
+    :param Counter games: Number of times each job/race played.
+    :param Counter wins: Number of times each job/race won.
+    :param Counter kills: Number of kills of each job/race.
+    :rtype: Dict[str, IGroupStatistics]
+    """
+    return {
+        name: {
+            'games': games[name],
+            'wins': wins[name],
+            'kills': kills[name],
+            'win_rate': wins[name] / games[name],
+            'average_kills': kills[name] / games[name]
+        } for name in sorted(games)
+    }
+
+
+def run_simulation_batch(games: int, bots_number: int = 4, map_size: Optional[int] = None,
+                         max_turns: int = DEFAULT_MAX_TURNS, workers: Optional[int] = None, seed: int = 0,
+                         chunk_size: int = DEFAULT_CHUNK_SIZE) -> IBatchResult:
+    """
+    Run many headless games, spread over a pool of processes, one for each CPU core by default, and aggregate their
+    results. The game of index i is always seeded with seed + i, so a batch gives the same result regardless of the
+    number of workers.
+
+    :param int games: The number of games to run.
+    :param int bots_number: The number of bots of each game.
+    :param int map_size: The size of the map of each game.
+    :param int max_turns: The maximum number of turns of each game.
+    :param int workers: The number of processes, by default the number of CPUs.
+    :param int seed: The seed of the first game.
+    :param int chunk_size: The number of games sent to a worker at once.
+    :rtype: IBatchResult
+    """
+    seeds = list(range(seed, seed + games))
+    chunks = [seeds[i:i + chunk_size] for i in range(0, games, chunk_size)]
+    workers = workers or os.cpu_count() or 1
+    counters = {}
+
+    def merge(partial_counters: Dict[str, Counter]) -> None:
+        for key, counter in partial_counters.items():
+            counters.setdefault(key, Counter()).update(counter)
+
+    if workers == 1:
+        for chunk in chunks:
+            merge(run_games_chunk(chunk, bots_number, map_size, max_turns))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(run_games_chunk, chunk, bots_number, map_size, max_turns) for chunk in chunks]
+            for future in as_completed(futures):
+                merge(future.result())
+
+    totals = counters.get('totals', Counter())
+    return {
+        'games': totals['games'],
+        'draws': totals['draws'],
+        'errors': totals['errors'],
+        'average_turns': totals['turns'] / totals['games'] if totals['games'] else 0,
+        'jobs': get_group_statistics(counters.get('job_games', Counter()), counters.get('job_wins', Counter()),
+                                     counters.get('job_kills', Counter())),
+        'races': get_group_statistics(counters.get('race_games', Counter()), counters.get('race_wins', Counter()),
+                                      counters.get('race_kills', Counter()))
+    }
+
+
+def format_batch_report(result: IBatchResult) -> str:
+    """
+    Format the aggregated result of a batch as a plain text summary.
+
+    :param IBatchResult result: The result of run_simulation_batch.
+    :rtype: str
+    """
+    summary = 'Games: {games}, draws: {draws}, with errors: {errors}, average turns: {turns:.1f}'
+    lines = [summary.format(games=result.get('games'), draws=result.get('draws'), errors=result.get('errors'),
+                            turns=result.get('average_turns'))]
+    for title, groups in [('Job', result.get('jobs')), ('Race', result.get('races'))]:
+        lines.append('')
+        lines.append('{:12}{:>8}{:>8}{:>10}{:>10}'.format(title, 'Games', 'Wins', 'Win rate', 'Kills/g'))
+        for name, statistics in sorted(groups.items(), key=lambda item: item[1].get('win_rate'), reverse=True):
+            lines.append('{:12}{:>8}{:>8}{:>10.1%}{:>10.2f}'.format(name, statistics.get('games'),
+                                                                    statistics.get('wins'),
+                                                                    statistics.get('win_rate'),
+                                                                    statistics.get('average_kills')))
+    return '\n'.join(lines)
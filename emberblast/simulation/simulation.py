@@ -0,0 +1,75 @@
+import random
+from typing import Optional
+
+from emberblast.communicator import CommunicatorHeadless, get_communicator, set_communicator
+from emberblast.conf import get_configuration
+from emberblast.game import GameFactory, bot_factory
+from emberblast.interface import IGame, IGameResult
+from emberblast.communicator.communicator_headless import InformerHeadless
+from emberblast.utils import GAME_SECTION
+
+# Bots may get stuck avoiding each other forever, so headless games are stopped after this number of turns.
+DEFAULT_MAX_TURNS = 200
+
+
+def run_headless_game(bots_number: int = 4, map_size: Optional[int] = None, max_turns: int = DEFAULT_MAX_TURNS,
+                      seed: Optional[int] = None, bulk_side_effects: bool = False) -> IGameResult:
+    """
+    Run a Deathmatch game only with bots, without any terminal interaction, loading animations or output, and
+    return its result. While the game runs, the headless communicator replaces the current one, which is restored at
+    the end. All the randomness of the game, from the bots to the map, comes from a generator created from the seed,
+    so the same seed always plays the same game.
+
+    :param int bots_number: The number of bots that will play.
+    :param int map_size: The size of the map, by default it's the same as a game created in the terminal.
+    :param int max_turns: The maximum number of turns, after that the game ends without a winner.
+    :param int seed: The seed of the game, by default a random one.
+    :param bool bulk_side_effects: Compute the side effects of all the bots at once, at the end of each turn.
+    :rtype: IGameResult
+    """
+    previous_communicator = get_communicator()
+    communicator = CommunicatorHeadless()
+    set_communicator(communicator)
+    rng = random.Random(seed)
+    try:
+        players = bot_factory(bots_number, rng)
+        if map_size is None:
+            map_size = get_configuration(GAME_SECTION).get('map_size', bots_number + 4)
+        orchestrator = GameFactory().create_deathmatch(players, map_size, rng)
+        orchestrator.max_turns = max_turns
+        orchestrator.bulk_side_effects = bulk_side_effects
+        orchestrator.execute_game()
+    finally:
+        set_communicator(previous_communicator)
+
+    return get_game_result(orchestrator.game, communicator.informer)
+
+
+def get_game_result(game: IGame, informer: InformerHeadless) -> IGameResult:
+    """
+    Build the result of a finished game, with the statistics that were kept by the headless informer. The kills of
+    a player include the ones by the side effects they cast, like poison, and the errors are the unexpected errors
+    raised along the game, like a bot failing to decide, which are recorded instead of printed.
+
+    :param IGame game: The finished game.
+    :param InformerHeadless informer: The informer used along the game.
+    :rtype: IGameResult
+    """
+    return {
+        'winner': informer.winner,
+        'turns': informer.turns,
+        'errors': list(informer.errors),
+        'players': [
+            {
+                'name': player.name,
+                'job': player.job.get_name(),
+                'race': player.race.get_name(),
+                'alive': player.is_alive(),
+                'level': player.level,
+                'life': player.life,
+                'damage_dealt': informer.damage_dealt.get(player, 0),
+                'damage_taken': informer.damage_taken.get(player, 0),
+                'kills': informer.kills.get(player, 0)
+            } for player in game.get_all_players()
+        ]
+    }
@@ -1,3 +1,4 @@
-from .skill import Skill, get_player_available_skills, get_instantiated_skill, Steal
+from .skill import Skill, SkillIndex, get_player_available_skills, get_instantiated_skill, get_skill_index, Steal
 
-__all__ = ['Skill', 'get_player_available_skills', 'get_instantiated_skill', 'Steal']
+__all__ = ['Skill', 'SkillIndex', 'get_player_available_skills', 'get_instantiated_skill', 'get_skill_index',
+           'Steal']
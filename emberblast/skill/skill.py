@@ -1,7 +1,9 @@
+import bisect
+import functools
 import math
 import random
 import sys
-from typing import Dict, List
+from typing import Dict, List, Tuple
 
 from emberblast.communicator import communicator_injector
 from emberblast.conf import get_configuration
@@ -82,7 +84,8 @@ class Skill(ISkill):
         return math.ceil(
             self.base + dice_norm_result * player.get_attribute_real_value('intelligence'))
 
-    def execute(self, player: IPlayer, foes: List[IPlayer], dice_norm_result: float) -> None:
+    def execute(self, player: IPlayer, foes: List[IPlayer], dice_norm_result: float,
+                rng: random.Random = None) -> None:
         kill = False
         successful_skill = False
         player.spend_mana(self.cost)
@@ -102,16 +105,17 @@ class Skill(ISkill):
                 recover_result = self.calculate_recover(player, dice_norm_result)
                 foe.heal('health_points', recover_result)
                 self.communicator.informer.heal(player, foe, recover_result)
+            # Each player gets its own instances of the side effects of the skill, counting their own durations.
             for side_effect in self.side_effects:
                 if successful_skill:
-                    foe.add_side_effect(side_effect)
+                    foe.add_side_effect(side_effect.new_instance(player))
                     self.communicator.informer.add_side_effect(foe.name, side_effect)
             for side_effect in self.punishment_side_effects:
-                player.add_side_effect(side_effect)
+                player.add_side_effect(side_effect.new_instance(player))
                 self.communicator.informer.add_side_effect(player.name, side_effect)
             if not foe.is_alive():
                 kill = True
-            print('\n')
+            self.communicator.informer.new_line()
         self.check_experience(player, successful_skill, kill)
 
     def check_experience(self, player: IPlayer, successful_skill: bool, killed: bool) -> None:
@@ -206,6 +210,62 @@ def get_instantiated_skill(skill_dict: Dict) -> ISkill:
     return custom_skill
 
 
+class SkillIndex:
+
+    def __init__(self, skill_dicts: Dict[str, Dict]) -> None:
+        """
+        Constructor of SkillIndex, grouping the skills of each job by level requirement. For each level
+        requirement of a job, all the skills unlocked until that level are kept sorted by cost, so the skills a player
+        is eligible to are found with two binary searches, instead of going through all the skills.
+
+        :param Dict[str, Dict] skill_dicts: The skills from the skills.yaml file.
+        :rtype: None
+        """
+        self.levels: Dict[str, List[int]] = {}
+        self.unlocked_skills: Dict[str, List[Tuple[List[int], List[Tuple[int, str]]]]] = {}
+
+        job_skills: Dict[str, List[Tuple[int, int, int, str]]] = {}
+        for order, (key, value) in enumerate(skill_dicts.items()):
+            job_skills.setdefault(value.get('job'), []).append(
+                (value.get('level_requirement'), value.get('cost'), order, key))
+
+        for job, skills in job_skills.items():
+            self.levels[job] = sorted({level_requirement for level_requirement, _, _, _ in skills})
+            self.unlocked_skills[job] = []
+            for level in self.levels[job]:
+                unlocked = sorted((cost, order, key) for level_requirement, cost, order, key in skills
+                                  if level_requirement <= level)
+                self.unlocked_skills[job].append(([cost for cost, _, _ in unlocked],
+                                                  [(order, key) for _, order, key in unlocked]))
+
+    def get_available_skills(self, job: str, level: int, mana: int) -> List[str]:
+        """
+        Get the names of the skills of a job, unlocked for a level, and that cost less than the mana, in the same order
+        they are declared in skills.yaml.
+
+        :param str job: The name of the job.
+        :param int level: The level of the player.
+        :param int mana: The remaining mana of the player.
+        :rtype: List[str].
+        """
+        level_position = bisect.bisect_right(self.levels.get(job, []), level) - 1
+        if level_position < 0:
+            return []
+        costs, skills = self.unlocked_skills[job][level_position]
+        return [key for _, key in sorted(skills[:bisect.bisect_left(costs, mana)])]
+
+
+@functools.lru_cache(maxsize=None)
+def get_skill_index() -> SkillIndex:
+    """
+    Get the SkillIndex of the skills.yaml file, shared by all the players, who look up their available skills in
+    it whenever their level or mana changes.
+
+    :rtype: SkillIndex
+    """
+    return SkillIndex(get_configuration(SKILLS_SECTION))
+
+
 def get_player_available_skills(player: IPlayer) -> List[ISkill]:
     """
     Skills can be unlocked/revealed for players depending their levels and jobs, this method compare the current
@@ -216,14 +276,8 @@ def get_player_available_skills(player: IPlayer) -> List[ISkill]:
     :rtype: List[ISkill].
     """
     skill_dicts = get_configuration(SKILLS_SECTION)
-    available_skills: List[ISkill] = []
-
-    for key, value in skill_dicts.items():
-        if player.job.get_name() == value.get('job') and player.level >= value.get(
-                'level_requirement') and player.mana > value.get('cost'):
-            available_skills.append(get_instantiated_skill({key: value}))
-
-    return available_skills
+    return [get_instantiated_skill({key: skill_dicts.get(key)}) for key in
+            get_skill_index().get_available_skills(player.job.get_name(), player.level, player.mana)]
 
 
 """
@@ -249,12 +303,15 @@ class Steal(Skill):
         super().__init__(name, description, base, cost, kind, level_requirement, ranged, area, job,
                          base_attribute, side_effects, applies_caster_only, punishment_side_effects)
 
-    def execute(self, player: IPlayer, foes: List[IPlayer], dice_norm_result: float) -> None:
+    def execute(self, player: IPlayer, foes: List[IPlayer], dice_norm_result: float,
+                rng: random.Random = None) -> None:
+        if rng is None:
+            rng = random.Random()
         successful_steal = False
         foe = foes[0]
         items = foe.bag.items
         if len(items) > 0:
-            stolen_item = random.choice(items)
+            stolen_item = rng.choice(items)
             foe.bag.remove_item(stolen_item)
             player.bag.add_item(stolen_item)
             self.communicator.informer.player_stole_item(player.name, foe.name, stolen_item.name, stolen_item.tier)
@@ -272,7 +329,8 @@ class Leech(Skill):
         super().__init__(name, description, base, cost, kind, level_requirement, ranged, area, job, base_attribute,
                          side_effects, applies_caster_only, punishment_side_effects)
 
-    def execute(self, player: IPlayer, foes: List[IPlayer], dice_norm_result: float) -> None:
+    def execute(self, player: IPlayer, foes: List[IPlayer], dice_norm_result: float,
+                rng: random.Random = None) -> None:
         successful_skill = False
         kill = False
 
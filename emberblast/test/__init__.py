@@ -0,0 +1,10 @@
+import atexit
+import os
+import shutil
+import tempfile
+
+# The configuration snapshot is saved in the user cache directory as soon as the configuration is loaded, so the
+# tests point it to a temporary directory, before any of the game modules are imported.
+TEST_CACHE_DIRECTORY = tempfile.mkdtemp(prefix='emberblast-tests-')
+os.environ['XDG_CACHE_HOME'] = TEST_CACHE_DIRECTORY
+atexit.register(shutil.rmtree, TEST_CACHE_DIRECTORY, True)
@@ -0,0 +1,92 @@
+import random
+import timeit
+
+import numpy as np
+
+from .test import BaseTestCase, manual_test
+from .test_main import get_import_times
+from emberblast.game import bot_factory, DeathMatch
+from emberblast.map import Graph, Map, MapFactory
+from emberblast.utils import generate_random_adjacent_matrix
+
+# Benchmarks are meant to be run manually, printing the measured timings, for comparing the performance of the
+# algorithms before and after changes.
+
+
+def print_benchmark(title: str, results: dict) -> None:
+    print('\n{title}'.format(title=title))
+    for key, value in results.items():
+        print('\t{key}: {value:.2f} us'.format(key=key, value=value * 1e6))
+
+
+@manual_test
+class TestModuleBenchmark(BaseTestCase):
+    def test_range_query_benchmark(self) -> None:
+        size = 25
+        graph = Graph(size=size)
+        graph.init_graph([[1] * size for _ in range(size)])
+        center = 'M12'
+        results = {}
+
+        number = 20
+        # The range queries are timed without the range cache, which would only measure the cache hits.
+        for radius in range(1, 21):
+            elapsed = timeit.timeit(lambda: graph.compute_range_distances(center, radius), number=number)
+            results['radius {radius}'.format(radius=radius)] = elapsed / number
+        results['full Dijkstra'] = timeit.timeit(lambda: graph.get_shortest_path(center), number=number) / number
+
+        print_benchmark('compute_range_distances on a {size}x{size} map'.format(size=size), results)
+        # Radius 20 reaches the whole map, the bounded Dijkstra visits each vertex once, so it can't cost much more
+        # than a full Dijkstra, while the old recursive search grew exponentially with the radius.
+        self.assertLess(results['radius 20'], results['full Dijkstra'] * 2)
+
+    def test_graph_build_benchmark(self) -> None:
+        results = {}
+
+        for size in [25, 100, 250, 500]:
+            matrix = generate_random_adjacent_matrix(size)
+            graph = Graph(size=size)
+            number = 3
+            elapsed = timeit.timeit(lambda: graph.init_graph(matrix), number=number)
+            results['{size}x{size}'.format(size=size)] = elapsed / number
+
+        print_benchmark('init_graph', results)
+        self.assertLess(results['500x500'], 1)
+
+    def test_distribute_random_items_benchmark(self) -> None:
+        results = {}
+
+        for size in [50, 100, 200]:
+            new_map = Map(name='benchmark', map_type='benchmark', size=size, rng=random.Random(0))
+            new_map.graph.init_graph([[1] * size for _ in range(size)])
+            elapsed = timeit.timeit(new_map.distribute_random_items, number=1)
+            results['{size}x{size}'.format(size=size)] = elapsed
+
+        print_benchmark('distribute_random_items', results)
+        # Placing the items is linear, so 16 times the tiles shouldn't take much more than 16 times longer.
+        self.assertLess(results['200x200'], results['50x50'] * 16 * 3)
+
+    def test_startup_import_time_benchmark(self) -> None:
+        import_times = get_import_times('emberblast.__main__')
+        slowest = sorted((name for name in import_times if name.startswith('emberblast')),
+                         key=import_times.get, reverse=True)[:10]
+        results = {name: import_times[name] / 1e6 for name in slowest}
+
+        print_benchmark('Cumulative import time', results)
+        self.assertLess(import_times['emberblast.__main__'], 2e6)
+
+    def test_weighted_boolean_benchmark(self) -> None:
+        game = DeathMatch(bot_factory(2), MapFactory().create_map(5), random.Random(0))
+        numpy_rng = np.random.default_rng(0)
+        number = 20000
+        results = {
+            'numpy choice': timeit.timeit(lambda: numpy_rng.choice([True, False], 1, p=[0.4, 0.6])[0],
+                                          number=number) / number,
+            'weighted_boolean': timeit.timeit(lambda: game.weighted_boolean(0.4), number=number) / number,
+            'weighted_booleans (per outcome)': timeit.timeit(lambda: game.weighted_booleans([0.4] * 1000),
+                                                             number=number // 1000) / number,
+            'chose_probability': timeit.timeit(lambda: game.chose_probability([0.1]), number=number) / number,
+        }
+
+        print_benchmark('Weighted coin flip', results)
+        self.assertLess(results['weighted_boolean'], results['numpy choice'])
@@ -1,6 +1,15 @@
+import os
+import tempfile
 from typing import Any
+from unittest.mock import patch
+
+from cerberus import Validator
+
 from .test import BaseTestCase
 from emberblast.conf import get_configuration
+from emberblast.conf.schema import game_section_configuration_schema
+from emberblast.conf.conf import Configuration, SNAPSHOT_ATTRIBUTES, get_configuration_fingerprint, \
+    is_snapshot_fingerprint_valid, get_configuration_snapshot_path
 
 
 # This is a decorator to be used in all the another tests that
@@ -15,6 +24,14 @@ def get_mock_conf_section(section: str) -> Any:
 
 
 class TestModuleConf(BaseTestCase):
+    def setUp(self) -> None:
+        cache_directory = tempfile.TemporaryDirectory()
+        self.addCleanup(cache_directory.cleanup)
+        self.cache_directory = cache_directory.name
+        environment_patch = patch.dict(os.environ, {'XDG_CACHE_HOME': self.cache_directory})
+        environment_patch.start()
+        self.addCleanup(environment_patch.stop)
+
     def test_conf(self):
         # this test is self explanatory, as the game configuration class itself, already does a lot of
         # validations on all the required files, params and environment variables, the only test to be done it's
@@ -22,3 +39,45 @@ class TestModuleConf(BaseTestCase):
         # its constructor
         configuration_object = get_configuration('')
         self.assertIsNotNone(configuration_object)
+
+    def test_configuration_snapshot(self):
+        configuration_object = get_configuration('')
+        configuration_object.save_configuration_snapshot()
+        self.assertTrue(get_configuration_snapshot_path().startswith(self.cache_directory))
+        self.assertTrue(os.path.isfile(get_configuration_snapshot_path()))
+
+        with patch('emberblast.conf.conf.yaml.load', side_effect=AssertionError('The yaml files were parsed')):
+            snapshot_configuration = Configuration(None)
+        for attribute in SNAPSHOT_ATTRIBUTES:
+            self.assertEqual(getattr(snapshot_configuration, attribute), getattr(configuration_object, attribute))
+
+    def test_configuration_snapshot_write_failure(self):
+        configuration_object = get_configuration('')
+        # A file where the cache directory should be, so it can't be created.
+        blocked_path = os.path.join(self.cache_directory, 'blocked')
+        open(blocked_path, 'w').close()
+        with patch.dict(os.environ, {'XDG_CACHE_HOME': blocked_path}), \
+                patch.object(configuration_object, '_logger') as logger:
+            configuration_object.save_configuration_snapshot()
+            self.assertFalse(configuration_object.load_configuration_snapshot())
+        logger.warning.assert_called_once()
+
+    def test_configuration_fingerprint(self):
+        fingerprint = get_configuration_fingerprint()
+        self.assertTrue(is_snapshot_fingerprint_valid(fingerprint))
+
+        path = list(fingerprint.keys())[0]
+        touched_fingerprint = {**fingerprint, path: {**fingerprint[path], 'mtime': 0}}
+        self.assertTrue(is_snapshot_fingerprint_valid(touched_fingerprint))
+
+        changed_fingerprint = {**fingerprint, path: {**fingerprint[path], 'mtime': 0, 'hash': ''}}
+        self.assertFalse(is_snapshot_fingerprint_valid(changed_fingerprint))
+        self.assertFalse(is_snapshot_fingerprint_valid({}))
+        self.assertTrue(any(path.endswith('conf.py') for path in fingerprint))
+
+    def test_map_size_schema(self):
+        schema = {'map_size': game_section_configuration_schema['map_size']}
+        validator = Validator(schema)
+        self.assertTrue(validator.validate({'map_size': 12}))
+        self.assertFalse(validator.validate({'map_size': 12.5}))
+        self.assertFalse(validator.validate({'map_size': 501}))
@@ -0,0 +1,69 @@
+import pickle
+
+from emberblast.test.test import BaseTestCase
+from emberblast.effect import SideEffect, SideEffectContainer
+
+
+class TestModuleSideEffectContainer(BaseTestCase):
+
+    def test_add_replaces_by_name(self) -> None:
+        container = SideEffectContainer()
+        first_poison = SideEffect('poison', 'debuff', 'health_points', 2, 4, 'iterated')
+        second_poison = SideEffect('poison', 'debuff', 'health_points', 3, 2, 'iterated')
+        container.add(first_poison)
+        container.add(second_poison)
+
+        self.assertEqual(len(container), 1)
+        self.assertIs(container.get('poison'), second_poison)
+        self.assertNotIn(first_poison, container)
+        self.assertEqual(first_poison.duration, 4)
+        self.assertIsNone(container.get('regen'))
+
+    def test_append_keeps_duplicates(self) -> None:
+        container = SideEffectContainer()
+        first_protect = SideEffect('protect', 'buff', 'armour', 2, 3, 'constant')
+        second_protect = SideEffect('protect', 'buff', 'armour', 2, 3, 'constant')
+        container.append(first_protect)
+        container.append(second_protect)
+        container.append(second_protect)
+
+        self.assertEqual(len(container), 2)
+        self.assertEqual(container.get_by_occurrence('constant'), [first_protect, second_protect])
+        self.assertEqual(container.get_by_occurrence('iterated'), [])
+
+        container.remove(first_protect)
+        self.assertIs(container.get('protect'), second_protect)
+
+    def test_tick(self) -> None:
+        container = SideEffectContainer()
+        poison = SideEffect('poison', 'debuff', 'health_points', 2, 1, 'iterated')
+        protect = SideEffect('protect', 'buff', 'armour', 2, 3, 'constant')
+        container.add(poison)
+        container.add(protect)
+        version = container.version
+
+        self.assertEqual(container.tick(), [poison])
+        self.assertEqual(poison.duration, 0)
+        self.assertIsNone(poison.owner)
+        self.assertGreater(container.version, version)
+        self.assertEqual(protect.duration, 2)
+
+        protect.duration = 1
+        self.assertEqual(container.tick(), [protect])
+        self.assertEqual(len(container), 0)
+        self.assertEqual(container.tick(), [])
+
+    def test_pickle(self) -> None:
+        container = SideEffectContainer()
+        poison = SideEffect('poison', 'debuff', 'health_points', 2, 1, 'iterated')
+        protect = SideEffect('protect', 'buff', 'armour', 2, 3, 'constant')
+        container.add(poison)
+        container.add(protect)
+        container.tick()
+
+        loaded_protect, loaded_container = pickle.loads(pickle.dumps([protect, container]))
+        self.assertIs(loaded_protect.owner, loaded_container)
+        self.assertEqual(loaded_protect.duration, 2)
+        self.assertIs(loaded_container.get('protect'), loaded_protect)
+        self.assertEqual(loaded_container.tick(), [])
+        self.assertEqual(loaded_container.tick(), [loaded_protect])
@@ -1,8 +1,11 @@
+import random
 from typing import Callable
 
 from .test import BaseTestCase, manual_test
 from .test_map import mock_map
-from emberblast.game import bot_factory, DeathMatch
+from emberblast.effect import SideEffect
+from emberblast.game import bot_factory, DeathMatch, PlayerStateStore
+from emberblast.map import MapFactory
 from emberblast.orchestrator import DeathMatchOrchestrator
 
 
@@ -26,3 +29,70 @@ class TestModuleGame(BaseTestCase):
     def test_bots_automated_game(self) -> None:
         game_orchestrator = DeathMatchOrchestrator(self.mock_game)
         game_orchestrator.execute_game()
+
+
+class TestModuleGameProbability(BaseTestCase):
+    def test_weighted_boolean_distribution(self) -> None:
+        game = DeathMatch(bot_factory(2), MapFactory().create_map(5), random.Random(7))
+        draws = 20000
+
+        self.assertTrue(all(game.weighted_boolean(1.5) for _ in range(100)))
+        self.assertFalse(any(game.weighted_boolean(0) for _ in range(100)))
+        self.assertAlmostEqual(sum(game.weighted_boolean(0.3) for _ in range(draws)) / draws, 0.3, delta=0.02)
+        self.assertAlmostEqual(sum(game.weighted_booleans([0.7] * draws)) / draws, 0.7, delta=0.02)
+
+    def test_weighted_boolean_seeded(self) -> None:
+        probabilities = [0.1, 0.5, 0.9] * 10
+        first = DeathMatch(bot_factory(2), MapFactory().create_map(5), random.Random(3))
+        second = DeathMatch(bot_factory(2), MapFactory().create_map(5), random.Random(3))
+
+        self.assertEqual(first.weighted_booleans(probabilities), second.weighted_booleans(probabilities))
+        self.assertEqual(first.chose_probability([0.2]), second.chose_probability([0.2]))
+
+
+class TestModulePlayerState(BaseTestCase):
+    def test_player_state_store_step(self) -> None:
+        first_player, second_player = bot_factory(2)
+        first_player.add_side_effect(SideEffect('poison', 'debuff', 'health_points', 3, 2, 'iterated'))
+        first_player.add_side_effect(SideEffect('protect', 'buff', 'armour', 2, 1, 'constant'))
+        second_player.add_side_effect(SideEffect('regen', 'buff', 'magic_points', 4, 3, 'iterated'))
+        second_player.spend_mana(2)
+        life = first_player.life
+
+        store = PlayerStateStore([first_player, second_player])
+        ended_side_effects = store.step()
+        store.sync()
+
+        self.assertEqual([side_effect.name for _, side_effect in ended_side_effects], ['protect'])
+        self.assertEqual(first_player.life, life - 3)
+        self.assertEqual(second_player.mana, second_player.magic_points)
+        self.assertEqual([side_effect.name for side_effect in first_player.side_effects], ['poison'])
+        self.assertEqual(first_player.side_effects.get('poison').duration, 1)
+
+    def test_player_state_store_deaths(self) -> None:
+        first_player, second_player = bot_factory(2)
+        first_player.life = 2
+        first_player.add_side_effect(SideEffect('poison', 'debuff', 'health_points', 3, 2, 'iterated'))
+
+        store = PlayerStateStore([first_player, second_player])
+        store.apply_iterated_side_effects()
+        self.assertEqual(store.check_deaths(), [0])
+        self.assertEqual(store.check_deaths(), [])
+        store.sync()
+        self.assertFalse(first_player.is_alive())
+        self.assertTrue(second_player.is_alive())
+
+    def test_player_state_store_order(self) -> None:
+        first_player, second_player = bot_factory(2)
+        first_player.add_side_effect(SideEffect('regen', 'buff', 'health_points', 2, 3, 'iterated'))
+        first_player.add_side_effect(SideEffect('poison', 'debuff', 'health_points', 2, 3, 'iterated'))
+        second_player.life = 2
+        second_player.add_side_effect(SideEffect('poison', 'debuff', 'health_points', 2, 3, 'iterated'))
+        second_player.add_side_effect(SideEffect('regen', 'buff', 'health_points', 2, 3, 'iterated'))
+
+        store = PlayerStateStore([first_player, second_player])
+        store.step()
+        store.sync()
+        self.assertEqual(first_player.life, first_player.health_points - 2)
+        self.assertEqual(second_player.life, 2)
+        self.assertFalse(second_player.is_alive())
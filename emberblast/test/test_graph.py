@@ -0,0 +1,63 @@
+import heapq
+import math
+import random
+from typing import Dict, List, Tuple
+
+from .test import BaseTestCase
+from emberblast.map import Graph
+from emberblast.utils import generate_random_adjacent_matrix, convert_coordinates_to_position
+
+
+def get_reference_range_distances(matrix: List[List[int]], row: int, column: int,
+                                  reach: float) -> Dict[str, float]:
+    """
+    Plain Dijkstra straight from the matrix, with the same edge weights of the map, without any of the structures of
+    Graph, to check the range queries against.
+    """
+    size = len(matrix)
+    distances: Dict[Tuple[int, int], float] = {(row, column): 0}
+    unsettled_nodes = [(0, (row, column))]
+    settled_nodes = set()
+    while unsettled_nodes:
+        current_distance, (current_row, current_column) = heapq.heappop(unsettled_nodes)
+        if (current_row, current_column) in settled_nodes:
+            continue
+        settled_nodes.add((current_row, current_column))
+        for row_offset in (-1, 0, 1):
+            for column_offset in (-1, 0, 1):
+                neighbour_row, neighbour_column = current_row + row_offset, current_column + column_offset
+                if (row_offset, column_offset) == (0, 0) or not (0 <= neighbour_row < size and
+                                                                 0 <= neighbour_column < size):
+                    continue
+                if matrix[neighbour_row][neighbour_column] != 1:
+                    continue
+                weight = 1.414 if row_offset != 0 and column_offset != 0 else 1
+                computed_distance = current_distance + weight
+                if computed_distance <= reach and \
+                        computed_distance < distances.get((neighbour_row, neighbour_column), math.inf):
+                    distances[(neighbour_row, neighbour_column)] = computed_distance
+                    heapq.heappush(unsettled_nodes, (computed_distance, (neighbour_row, neighbour_column)))
+    return {convert_coordinates_to_position(node_row, node_column): distance
+            for (node_row, node_column), distance in distances.items()}
+
+
+class TestModuleGraph(BaseTestCase):
+
+    def test_available_nodes_in_range(self) -> None:
+        size = 15
+        matrix = generate_random_adjacent_matrix(size, rng=random.Random(7))
+        graph = Graph(size=size)
+        graph.init_graph(matrix)
+        sources = [(row, column) for row in range(size) for column in range(size) if matrix[row][column] == 1]
+
+        for row, column in random.Random(7).sample(sources, 10):
+            position = convert_coordinates_to_position(row, column)
+            for radius in [1, 2, 3, 5, 8, 20]:
+                expected = get_reference_range_distances(matrix, row, column, radius)
+                distances = graph.compute_range_distances(position, radius)
+                self.assertEqual(distances.keys(), expected.keys())
+                for node, distance in expected.items():
+                    self.assertAlmostEqual(distances[node], distance, places=4)
+
+                expected.pop(position)
+                self.assertEqual(sorted(graph.get_available_nodes_in_range(position, radius)), sorted(expected))
@@ -1,7 +1,11 @@
+import pickle
+import random
 from typing import Callable
 
 from .test import BaseTestCase
-from emberblast.item import get_random_item, Bag
+from emberblast.conf import get_configuration
+from emberblast.item import get_random_item, get_item_catalog, Bag
+from emberblast.utils import ITEMS_SECTION
 from emberblast.interface import IItem, IHealingItem, IEquipmentItem, IRecoveryItem
 
 
@@ -83,3 +87,57 @@ class TestModuleItem(BaseTestCase):
 
         self.assertTrue(self.bag.has_item_type(is_usable=True))
         self.assertTrue(self.bag.has_item_type(is_equipment=True))
+
+    def test_item_catalog(self) -> None:
+        catalog = get_item_catalog()
+        self.assertIs(catalog, get_item_catalog())
+        self.assertEqual(sum(len(constructors) for constructors in catalog.constructors.values()),
+                         len(get_configuration(ITEMS_SECTION)))
+
+        first_item = catalog.get_random_item('legendary', 'equipment', random.Random(1))
+        second_item = catalog.get_random_item('legendary', 'equipment', random.Random(1))
+        self.assertEqual(first_item.name, second_item.name)
+        self.assertIsNot(first_item, second_item)
+        self.assertEqual(first_item.tier, 'legendary')
+        for first_side_effect, second_side_effect in zip(first_item.side_effects, second_item.side_effects):
+            self.assertIsNot(first_side_effect, second_side_effect)
+
+    def test_item_templates(self) -> None:
+        first_item = get_random_item('legendary', 'equipment', random.Random(2))
+        second_item = get_random_item('legendary', 'equipment', random.Random(2))
+        self.assertIs(first_item.template, second_item.template)
+        self.assertFalse(hasattr(first_item, '__dict__'))
+        self.assertFalse(hasattr(first_item.template, '__dict__'))
+        with self.assertRaises(AttributeError):
+            first_item.template.base = 100
+
+        for first_side_effect, second_side_effect in zip(first_item.side_effects, second_item.side_effects):
+            self.assertIs(first_side_effect.template, second_side_effect.template)
+            self.assertFalse(hasattr(first_side_effect, '__dict__'))
+            first_side_effect.duration = 0
+            self.assertEqual(second_side_effect.duration, second_side_effect.template.duration)
+
+        loaded_item = pickle.loads(pickle.dumps(first_item))
+        self.assertEqual(loaded_item.name, first_item.name)
+        self.assertEqual(len(loaded_item.side_effects), len(first_item.side_effects))
+
+    def test_bag_item_types(self) -> None:
+        bag = Bag()
+        healing_item = get_random_item(tier='common', item_type='healing')
+        equipment_item = get_random_item(tier='legendary', item_type='equipment')
+        self.assertFalse(bag.has_item_type(is_usable=True))
+        self.assertFalse(bag.has_item_type(is_equipment=True))
+
+        bag.add_item(healing_item)
+        bag.add_item(equipment_item)
+        bag.add_item(healing_item)
+        self.assertEqual(bag.get_usable_items(), [healing_item, healing_item])
+        self.assertEqual(bag.get_equipments(), [equipment_item])
+        self.assertAlmostEqual(bag.weight, 2 * healing_item.weight + equipment_item.weight)
+
+        bag.remove_item(equipment_item)
+        self.assertFalse(bag.has_item_type(is_equipment=True))
+        self.assertTrue(bag.has_item_type(is_usable=True))
+        with self.assertRaises(ValueError):
+            bag.remove_item(equipment_item)
+        self.assertAlmostEqual(bag.weight, 2 * healing_item.weight)
@@ -0,0 +1,50 @@
+import io
+import subprocess
+import sys
+from contextlib import redirect_stderr
+from typing import Dict
+
+from .test import BaseTestCase
+from emberblast.__main__ import parse_arguments
+
+# Modules that are only needed by specific features, and must not slow down the startup of the game.
+LAZY_MODULES = ['numpy']
+
+
+def get_import_times(module: str) -> Dict[str, int]:
+    """
+    Import a module in a fresh interpreter with -X importtime, returning the cumulative import time in microseconds
+    of each one of the modules loaded by it.
+
+    :param str module: The module to be imported.
+    :rtype: Dict[str, int].
+    """
+    process = subprocess.run([sys.executable, '-X', 'importtime', '-c', 'import {module}'.format(module=module)],
+                             capture_output=True, text=True, check=True)
+    import_times = {}
+    for line in process.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line.split('|')
+        import_times[name.strip()] = int(cumulative)
+    return import_times
+
+
+class TestModuleMain(BaseTestCase):
+    def test_startup_lazy_imports(self) -> None:
+        import_times = get_import_times('emberblast.__main__')
+
+        self.assertIn('emberblast.__main__', import_times)
+        for module in LAZY_MODULES:
+            self.assertNotIn(module, import_times)
+
+    def test_parse_arguments(self) -> None:
+        arguments = parse_arguments(['--headless', '--bots', '3', '--games', '2'])
+        self.assertEqual((arguments.bots, arguments.games, arguments.workers), (3, 2, None))
+        self.assertFalse(parse_arguments([]).headless)
+
+        for invalid_arguments in [['--headless', '--bots', '1'], ['--headless', '--games', '0'],
+                                  ['--headless', '--workers', '-1'], ['--headless', '--bots', '10', '--map-size', '3'],
+                                  ['--games', '3'], ['--seed', '1']]:
+            with redirect_stderr(io.StringIO()), self.assertRaises(SystemExit):
+                parse_arguments(invalid_arguments)
@@ -3,7 +3,9 @@ import random
 from typing import Callable
 
 from .test import BaseTestCase
-from emberblast.map import Map, Graph
+from emberblast.game import bot_factory
+from emberblast.map import Map, Graph, MapFactory
+from emberblast.map.generator import generate_connected_matrix, get_matrix_islands, connect_matrix_islands
 from emberblast.utils import convert_number_to_letter
 
 
@@ -87,3 +89,152 @@ class TestModuleMap(BaseTestCase):
         destinations = random.sample([x for x in key_list if x != source.vertex_id], 3)
 
         average = self.mock_map.graph.get_average_distance_source_destinations(source.vertex_id, destinations)
+
+    def test_shortest_path_known_distances(self) -> None:
+        graph = Graph()
+        graph.init_graph([[1, 1, 1], [0, 0, 1], [1, 1, 1]])
+        distances = graph.get_shortest_path('A0')
+
+        self.assertEqual(distances['A0'], 0)
+        self.assertEqual(distances['A2'], 2)
+        self.assertAlmostEqual(distances['B2'], 2.414)
+        self.assertAlmostEqual(distances['C1'], 3.828)
+        self.assertAlmostEqual(distances['C0'], 4.828)
+
+    def test_graph_adjacency_arrays(self) -> None:
+        graph = Graph()
+        graph.init_graph([[1, 1, 1], [0, 0, 1], [1, 1, 1]])
+        vertex = graph.graph_dict['A2']
+
+        self.assertEqual(vertex.index, 2)
+        self.assertFalse(hasattr(vertex, '__dict__'))
+        self.assertEqual({(edge.destination, edge.weight) for edge in vertex.edges}, {('A1', 1), ('B2', 1)})
+        self.assertEqual(graph.graph_dict['B0'].edges, [])
+        self.assertEqual(len(graph.adjacency_offsets), graph.size * graph.size + 1)
+        self.assertEqual(graph.get_number_of_walkable_nodes(), 7)
+
+    def test_graph_multi_letter_rows(self) -> None:
+        size = 60
+        graph = Graph(size=size)
+        graph.init_graph([[1] * size for _ in range(size)])
+
+        self.assertEqual(len(graph.graph_dict), size * size)
+        vertex = graph.graph_dict['AB10']
+        self.assertEqual(vertex.position, {'row': 'AB', 'column': 10})
+        self.assertIn('AC11', [edge.destination for edge in vertex.edges])
+        self.assertEqual(graph.get_shortest_path('A0', 'BH0')['BH0'], size - 1)
+
+    def test_shortest_distance_single_target(self) -> None:
+        walkable_nodes = list(self.mock_map.graph.get_walkable_nodes().keys())
+        source = walkable_nodes[0]
+        distances = self.mock_map.graph.get_shortest_path(source)
+
+        for destination in walkable_nodes:
+            self.assertAlmostEqual(
+                self.mock_map.graph.get_shortest_distance_between_positions(source, destination),
+                distances[destination], places=4)
+
+    def test_distance_rows(self) -> None:
+        graph = self.mock_map.graph
+        vertex_index = graph.get_vertex_index()
+
+        for source in vertex_index:
+            distance_row = graph.get_distance_row(source)
+            self.assertEqual(distance_row.shape, (len(vertex_index),))
+            self.assertIs(distance_row, graph.get_distance_row(source))
+            distances = graph.get_shortest_path(source)
+            for destination, destination_index in vertex_index.items():
+                self.assertAlmostEqual(float(distance_row[destination_index]), distances[destination], places=4)
+        self.assertEqual(len(graph.distance_rows_cache), len(vertex_index))
+
+    def test_distance_rows_reset_on_init(self) -> None:
+        graph = Graph()
+        graph.init_graph([[1, 1], [1, 1]])
+        self.assertAlmostEqual(graph.get_shortest_distance_between_positions('A0', 'B1'), 1.414, places=4)
+
+        graph.init_graph([[1, 1, 1], [0, 0, 1], [1, 1, 1]])
+        self.assertEqual(len(graph.get_vertex_index()), 7)
+        self.assertAlmostEqual(graph.get_shortest_distance_between_positions('A0', 'C0'), 4.828, places=4)
+
+    def test_range_cache(self) -> None:
+        graph = Graph()
+        graph.init_graph([[1, 1, 1], [1, 1, 1], [1, 1, 1]])
+
+        first_result = graph.get_available_nodes_in_range('B1', 1)
+        first_result.append('B1')
+        second_result = graph.get_available_nodes_in_range('B1', 1)
+        self.assertNotIn('B1', second_result)
+        self.assertEqual(graph.range_cache.misses, 1)
+        self.assertEqual(graph.range_cache.hits, 1)
+        self.assertTrue(graph.is_target_in_range('B1', 1, 'A1'))
+        self.assertEqual(graph.range_cache.hits, 2)
+
+        graph.init_graph([[1, 0, 1], [0, 1, 0], [1, 0, 1]])
+        self.assertEqual(len(graph.range_cache), 0)
+        self.assertEqual(graph.get_available_nodes_in_range('B1', 1), [])
+
+    def test_connected_components(self) -> None:
+        graph = self.mock_defective_map.graph
+        labels = graph.get_connected_components()
+
+        self.assertEqual(graph.get_number_of_islands(), 2)
+        self.assertEqual(labels['A0'], labels['A1'])
+        self.assertNotEqual(labels['A0'], labels['A3'])
+        self.assertCountEqual(graph.get_largest_component(), ['A3', 'B3', 'C3'])
+
+    def test_create_map_single_island(self) -> None:
+        new_map = MapFactory().create_map(6)
+        self.assertEqual(new_map.graph.get_number_of_islands(), 1)
+        self.assertFalse(new_map.graph.is_graph_defective())
+
+    def test_generate_connected_matrix(self) -> None:
+        for density in [0.1, 0.4, 0.75, 1]:
+            size = random.randint(1, 20)
+            matrix = generate_connected_matrix(size, density)
+            self.assertEqual(len(matrix), size)
+            self.assertEqual(len(get_matrix_islands(matrix)), 1)
+
+            graph = Graph()
+            graph.init_graph(matrix)
+            self.assertEqual(graph.get_number_of_islands(), 1)
+
+    def test_connect_matrix_islands(self) -> None:
+        matrix = [[1, 1, 0, 1], [0, 0, 0, 1], [0, 0, 0, 1], [1, 0, 0, 0]]
+        connect_matrix_islands(matrix)
+        self.assertEqual(len(get_matrix_islands(matrix)), 1)
+        # Existing walkable tiles are never removed
+        self.assertTrue(matrix[0][0] == matrix[0][1] == matrix[0][3] == matrix[3][0] == 1)
+
+    def test_distribute_random_items(self) -> None:
+        size = 30
+        new_map = Map(name='test_map', map_type='test', size=size, rng=random.Random(0))
+        new_map.graph.init_graph([[1] * size for _ in range(size)])
+        new_map.distribute_random_items()
+
+        walkable_nodes = new_map.graph.get_walkable_nodes()
+        self.assertTrue(all(position in walkable_nodes for position in new_map.items))
+        self.assertTrue(all(len(items) == 1 for items in new_map.items.values()))
+        self.assertAlmostEqual(len(new_map.items), len(walkable_nodes) / 2, delta=2)
+
+    def test_player_initial_positions(self) -> None:
+        new_map = Map(name='test_map', map_type='test', size=3, rng=random.Random(0))
+        new_map.graph.init_graph([[1, 1, 1], [0, 0, 1], [1, 0, 1]])
+        players = bot_factory(6)
+        new_map.define_player_initial_position_random(players)
+
+        positions = [player.position for player in players]
+        self.assertCountEqual(positions, new_map.graph.get_walkable_nodes().keys())
+        self.assertRaises(ValueError, new_map.define_player_initial_position_random, bot_factory(7))
+
+    def test_player_initial_positions_spread(self) -> None:
+        size = 9
+        new_map = Map(name='test_map', map_type='test', size=size, rng=random.Random(0))
+        new_map.graph.init_graph([[1] * size for _ in range(size)])
+        players = bot_factory(4)
+        new_map.define_player_initial_position_random(players, spread=True)
+
+        positions = [player.position for player in players]
+        minimum_distance = min(new_map.graph.get_shortest_distance_between_positions(source, destination)
+                               for source in positions for destination in positions if source != destination)
+        self.assertEqual(len(set(positions)), 4)
+        self.assertGreaterEqual(minimum_distance, size / 2)
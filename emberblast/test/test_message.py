@@ -1,7 +1,12 @@
-from emberblast.test.test import manual_test, CommunicatorTestCase
+import threading
+import time
+from unittest.mock import patch
+
+from emberblast.test.test import manual_test, BaseTestCase, CommunicatorTestCase
 from .test_player import mock_player
 from .test_map import mock_map
 from emberblast.communicator import communicator_injector
+from emberblast.communicator.informer_cmd import InformerCMD
 
 
 @manual_test
@@ -17,3 +22,21 @@ class TestModuleMessage(CommunicatorTestCase):
 
     def test_print_plain_matrix(self) -> None:
         pass
+
+
+class TestModuleLoading(BaseTestCase):
+    def test_force_loading_thread(self) -> None:
+        threads = threading.active_count()
+        start = time.perf_counter()
+        with patch('emberblast.communicator.informer_cmd.get_configuration', return_value={'turn_pacing': 0.5}):
+            InformerCMD().force_loading(0.2)
+
+        self.assertGreaterEqual(time.perf_counter() - start, 0.1)
+        self.assertEqual(threading.active_count(), threads)
+
+    def test_force_loading_disabled(self) -> None:
+        start = time.perf_counter()
+        with patch('emberblast.communicator.informer_cmd.get_configuration', return_value={'turn_pacing': 0}):
+            InformerCMD().force_loading(10)
+
+        self.assertLess(time.perf_counter() - start, 1)
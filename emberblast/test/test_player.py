@@ -4,7 +4,7 @@ from typing import Dict, Callable
 from emberblast.player import dynamic_races_classes, dynamic_jobs_classes, ControlledPlayer
 from .test import BaseTestCase
 from .test_item import mock_healing_item
-from emberblast.item import Bag, Equipment
+from emberblast.item import Bag, Equipment, EquipmentItem
 from emberblast.effect import SideEffect
 
 
@@ -92,3 +92,29 @@ class TestModulePlayer(BaseTestCase):
         self.mock_player.add_side_effect(side_effect_1)
         self.mock_player.add_side_effect(side_effect_2)
         self.assertEqual(len(self.mock_player.side_effects), 1)
+
+    def test_attribute_real_value_cache(self) -> None:
+        player = ControlledPlayer(name='cache player', job=self.mock_player.job, race=self.mock_player.race, bag=Bag(),
+                                  equipment=Equipment())
+        strength = player.strength
+        self.assertEqual(player.get_attribute_real_value('strength'), strength)
+
+        player.add_side_effect(SideEffect('rage', 'buff', 'strength', 3, 2, 'constant'))
+        self.assertEqual(player.get_attribute_real_value('strength'), strength + 3)
+
+        sword = EquipmentItem('sword', 'common', '', 1, 'strength', 5, [], 'weapon', 'all')
+        player.equipment.equip(sword)
+        self.assertEqual(player.get_attribute_real_value('strength'), strength + 8)
+        self.assertEqual(player.get_attribute_real_value('strength', 'melee'), strength + 3)
+
+        player.strength = player.strength + 1
+        self.assertEqual(player.get_attribute_real_value('strength'), strength + 9)
+
+        ended_side_effects = []
+        while len(ended_side_effects) == 0:
+            ended_side_effects = player.compute_side_effect_duration()
+        player.equipment.remove_equipment('weapon')
+        self.assertEqual(player.get_attribute_real_value('strength'), strength + 1)
+
+        player.set_defense_mode(True)
+        self.assertEqual(player.get_attribute_real_value('armour'), player.armour * 2)
@@ -0,0 +1,139 @@
+import io
+import random
+from contextlib import redirect_stdout
+from typing import Dict, List, Tuple
+from unittest.mock import patch
+
+from .test import BaseTestCase
+from emberblast.bot import BotDecisioning
+from emberblast.communicator import get_communicator, CommunicatorHeadless
+from emberblast.effect import SideEffect
+from emberblast.game import GameFactory, bot_factory
+from emberblast.exception import HeadlessModeError
+from emberblast.simulation import run_headless_game, run_simulation_batch, format_batch_report
+
+
+def play_side_effects_game(seed: int, bulk_side_effects: bool) -> Tuple[List[Tuple], Dict[str, int], int]:
+    """
+    Play a seeded game where the bots start with random side effects, but never act, so the side effects are the
+    only thing that changes the players, returning the final state of each player, their kills and the turns.
+
+    :param int seed: The seed of the game and of its side effects.
+    :param bool bulk_side_effects: Compute the side effects of all the bots at once, at the end of each turn.
+    :rtype: Tuple[List[Tuple], Dict[str, int], int]
+    """
+    rng = random.Random(seed)
+    players = bot_factory(6, rng)
+    orchestrator = GameFactory().create_deathmatch(players, 10, rng)
+    communicator = CommunicatorHeadless()
+    orchestrator.communicator = communicator
+    orchestrator.max_turns = 12
+    orchestrator.bulk_side_effects = bulk_side_effects
+
+    side_effects_rng = random.Random(seed)
+    for player in players:
+        player.life = side_effects_rng.randint(1, player.health_points)
+        player.mana = side_effects_rng.randint(0, player.magic_points)
+        for _ in range(side_effects_rng.randint(1, 6)):
+            side_effect = SideEffect(side_effects_rng.choice(['poison', 'regen', 'drain', 'focus', 'guard']),
+                                     side_effects_rng.choice(['buff', 'debuff']),
+                                     side_effects_rng.choice(['health_points', 'health_points', 'magic_points',
+                                                              'armour']),
+                                     side_effects_rng.randint(0, 6), side_effects_rng.randint(1, 5),
+                                     side_effects_rng.choice(['iterated', 'iterated', 'constant']))
+            player.add_side_effect(side_effect.new_instance(side_effects_rng.choice(players)))
+
+    with patch.object(BotDecisioning, 'decide'):
+        orchestrator.execute_game()
+
+    states = [(player.name, player.life, player.mana, player.is_alive(),
+               [(side_effect.name, side_effect.duration) for side_effect in player.side_effects])
+              for player in players]
+    kills = {player.name: kills for player, kills in communicator.informer.kills.items()}
+    return states, kills, communicator.informer.turns
+
+
+class TestModuleSimulation(BaseTestCase):
+    def test_headless_game(self) -> None:
+        communicator = get_communicator()
+        result = run_headless_game(bots_number=3, map_size=6, max_turns=50)
+
+        self.assertIs(get_communicator(), communicator)
+        self.assertEqual(len(result.get('players')), 3)
+        self.assertGreater(result.get('turns'), 0)
+        self.assertLessEqual(result.get('turns'), 50)
+        alive_players = [player for player in result.get('players') if player.get('alive')]
+        if result.get('winner') is not None:
+            self.assertEqual([player.get('name') for player in alive_players], [result.get('winner')])
+        dead_players = len(result.get('players')) - len(alive_players)
+        self.assertLessEqual(sum(player.get('kills') for player in result.get('players')), dead_players)
+
+    def test_headless_game_bulk_side_effects(self) -> None:
+        result = run_headless_game(bots_number=4, map_size=8, max_turns=50, seed=3, bulk_side_effects=True)
+
+        self.assertEqual(len(result.get('players')), 4)
+        self.assertLessEqual(result.get('turns'), 50)
+
+    def test_headless_questioner(self) -> None:
+        communicator = CommunicatorHeadless()
+        self.assertRaises(HeadlessModeError, communicator.questioner.ask_where_to_move, ['A0'])
+
+    def test_simulation_batch(self) -> None:
+        result = run_simulation_batch(6, bots_number=3, map_size=6, max_turns=30, workers=1, chunk_size=4)
+
+        self.assertEqual(result.get('games'), 6)
+        self.assertEqual(sum(statistics.get('games') for statistics in result.get('jobs').values()), 18)
+        self.assertEqual(sum(statistics.get('wins') for statistics in result.get('races').values()),
+                         6 - result.get('draws'))
+        self.assertEqual(result, run_simulation_batch(6, bots_number=3, map_size=6, max_turns=30, workers=2,
+                                                      chunk_size=4))
+        self.assertIn('Win rate', format_batch_report(result))
+
+    def test_headless_game_seed(self) -> None:
+        first_result = run_headless_game(bots_number=4, map_size=8, max_turns=40, seed=7)
+        second_result = run_headless_game(bots_number=4, map_size=8, max_turns=40, seed=7)
+
+        self.assertEqual(first_result, second_result)
+
+    def test_headless_game_errors(self) -> None:
+        output = io.StringIO()
+        with patch.object(BotDecisioning, 'decide', side_effect=StopIteration), redirect_stdout(output):
+            result = run_headless_game(bots_number=3, map_size=6, max_turns=2, seed=1)
+
+        self.assertEqual(output.getvalue(), '')
+        self.assertGreater(len(result.get('errors')), 0)
+        self.assertTrue(all(error.startswith('StopIteration') for error in result.get('errors')))
+        self.assertEqual(run_headless_game(bots_number=3, map_size=6, max_turns=2, seed=1).get('errors'), [])
+
+    def test_side_effects_kill_credit(self) -> None:
+        communicator = CommunicatorHeadless()
+        first_player, second_player = bot_factory(2)
+        orchestrator = GameFactory().create_deathmatch([first_player, second_player], 6)
+        orchestrator.communicator = communicator
+        poison = SideEffect('poison', 'debuff', 'health_points', 5, 2, 'iterated').new_instance(first_player)
+        second_player.add_side_effect(poison)
+        second_player.life = 3
+
+        orchestrator.check_iterated_side_effects(second_player)
+        self.assertFalse(second_player.is_alive())
+        self.assertEqual(communicator.informer.kills, {first_player: 1})
+
+    def test_bulk_side_effects_kill_credit(self) -> None:
+        communicator = CommunicatorHeadless()
+        first_player, second_player = bot_factory(2)
+        orchestrator = GameFactory().create_deathmatch([first_player, second_player], 6)
+        orchestrator.communicator = communicator
+        orchestrator.bulk_side_effects = True
+        poison = SideEffect('poison', 'debuff', 'health_points', 5, 1, 'iterated').new_instance(first_player)
+        second_player.add_side_effect(poison)
+        second_player.life = 3
+
+        orchestrator.check_side_effects_in_bulk()
+        self.assertFalse(second_player.is_alive())
+        self.assertNotIn(poison, second_player.side_effects)
+        self.assertEqual(communicator.informer.kills, {first_player: 1})
+
+    def test_bulk_side_effects_parity(self) -> None:
+        for seed in range(20):
+            self.assertEqual(play_side_effects_game(seed, bulk_side_effects=False),
+                             play_side_effects_game(seed, bulk_side_effects=True))
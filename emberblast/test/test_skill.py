@@ -1,6 +1,8 @@
 from emberblast.test.test import BaseTestCase
 from .test_player import mock_player
-from emberblast.skill import get_player_available_skills, get_instantiated_skill, Steal
+from emberblast.conf import get_configuration
+from emberblast.skill import get_player_available_skills, get_instantiated_skill, get_skill_index, Steal
+from emberblast.utils import SKILLS_SECTION
 from ..interface import ISkill
 
 
@@ -12,6 +14,31 @@ class TestModuleSkill(BaseTestCase):
         if len(result) > 0:
             assert isinstance(result[0], ISkill)
 
+    def test_skill_index(self) -> None:
+        skill_dicts = get_configuration(SKILLS_SECTION)
+        skill_index = get_skill_index()
+        jobs = {value.get('job') for value in skill_dicts.values()}
+
+        for job in jobs:
+            for level in range(0, 6):
+                for mana in range(0, 12):
+                    expected = [key for key, value in skill_dicts.items() if value.get('job') == job and
+                                level >= value.get('level_requirement') and mana > value.get('cost')]
+                    self.assertEqual(skill_index.get_available_skills(job, level, mana), expected)
+        self.assertEqual(skill_index.get_available_skills('Unknown', 10, 100), [])
+
+    def test_refresh_skills_list(self) -> None:
+        self.mock_player.refresh_skills_list()
+        skills = self.mock_player.skills
+        self.mock_player.refresh_skills_list()
+        self.assertIs(self.mock_player.skills, skills)
+
+        mana = self.mock_player.mana
+        self.mock_player.mana = 0
+        self.mock_player.refresh_skills_list()
+        self.assertEqual(self.mock_player.skills, [])
+        self.mock_player.mana = mana
+
     def test_get_instantiated_skill(self) -> None:
         skill = {
             "Steal": {
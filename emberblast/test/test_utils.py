@@ -3,7 +3,8 @@ from .test import BaseTestCase
 from typing import Dict
 
 from emberblast.utils import generate_random_adjacent_matrix, generate_visited_default_matrix, find_key_recursively, \
-    convert_letter_to_number, convert_number_to_letter, deep_get
+    convert_letter_to_number, convert_number_to_letter, deep_get, LRUCache, \
+    convert_coordinates_to_position
 from emberblast.utils.name_generator import generate_name
 
 
@@ -68,15 +69,42 @@ class TestModuleUtils(BaseTestCase):
         self.assertEqual(convert_letter_to_number('R'), 17)
         self.assertEqual(convert_letter_to_number('W'), 22)
         self.assertEqual(convert_letter_to_number('Y'), 24)
+        self.assertEqual(convert_letter_to_number('AA'), 26)
+        self.assertEqual(convert_letter_to_number('AZ'), 51)
+        self.assertEqual(convert_letter_to_number('SF'), 499)
 
     def test_convert_number_to_letter(self) -> None:
         self.assertEqual(convert_number_to_letter(0), 'A')
         self.assertEqual(convert_number_to_letter(1), 'B')
         self.assertEqual(convert_number_to_letter(17), 'R')
         self.assertEqual(convert_number_to_letter(25), 'Z')
+        self.assertEqual(convert_number_to_letter(26), 'AA')
+        self.assertEqual(convert_number_to_letter(52), 'BA')
+        self.assertEqual(convert_number_to_letter(702), 'AAA')
+
+        for number in range(1000):
+            self.assertEqual(convert_letter_to_number(convert_number_to_letter(number)), number)
+
+    def test_convert_coordinates_to_position(self) -> None:
+        self.assertEqual(convert_coordinates_to_position(0, 3), 'A3')
+        self.assertEqual(convert_coordinates_to_position(27, 10), 'AB10')
 
     def test_generate_name(self) -> None:
         generated_name = generate_name()
         self.assertGreater(len(generated_name), 0)
         # making sure the random generated name has a first and a last name
         self.assertGreater(len(generated_name.split(' ')), 1)
+
+    def test_lru_cache(self) -> None:
+        cache = LRUCache(max_size=2)
+        cache.put('a', 1)
+        cache.put('b', 2)
+        self.assertEqual(cache.get('a'), 1)
+        cache.put('c', 3)
+        # 'b' was the least recently used entry, so it's the one discarded
+        self.assertIsNone(cache.get('b'))
+        self.assertEqual(cache.get('c'), 3)
+        self.assertEqual(cache.hits, 2)
+        self.assertEqual(cache.misses, 1)
+        cache.clear()
+        self.assertEqual(len(cache), 0)
@@ -1,5 +1,7 @@
 from .utils import get_project_root, generate_random_adjacent_matrix, generate_visited_default_matrix, singleton
 from .utils import deep_get, find_key_recursively, convert_letter_to_number, convert_number_to_letter, is_square_matrix
+from .utils import convert_coordinates_to_position, intern_string
+from .lru_cache import LRUCache
 from .constants import ROOT_DIR, GAME_SECTION, JOBS_SECTION, RACES_SECTION, LEVEL_UP_INCREMENT, PASS_ACTION_NAME
 from .constants import SIDE_EFFECTS_SECTION, ITEMS_SECTION, ITEMS_PROBABILITIES_SECTION, SKILLS_SECTION, DELAYED_ACTIONS
 
@@ -7,4 +9,4 @@ __all__ = ['get_project_root', 'generate_random_adjacent_matrix', 'generate_visi
            'deep_get', 'find_key_recursively', 'is_square_matrix', 'ROOT_DIR', 'GAME_SECTION', 'JOBS_SECTION',
            'RACES_SECTION', 'LEVEL_UP_INCREMENT', 'PASS_ACTION_NAME', 'SIDE_EFFECTS_SECTION', 'ITEMS_SECTION',
            'convert_letter_to_number', 'convert_number_to_letter', 'ITEMS_PROBABILITIES_SECTION', 'SKILLS_SECTION',
-           'DELAYED_ACTIONS', 'singleton']
+           'DELAYED_ACTIONS', 'singleton', 'LRUCache', 'convert_coordinates_to_position', 'intern_string']
@@ -0,0 +1,56 @@
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+
+class LRUCache(object):
+    def __init__(self, max_size: int = 1024) -> None:
+        """
+        Constructor of a least recently used cache, when the cache is full, the entry that wasn't accessed for the
+        longest time is discarded. It also counts hits and misses, to measure how effective the cache is.
+
+        :param int max_size: Maximum number of entries kept in the cache.
+        :rtype: None
+        """
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """
+        Get the value of a key, or None if it isn't cached.
+
+        :param Hashable key: The key to look for.
+        :rtype: Optional[Any]
+        """
+        value = self._entries.get(key)
+        if value is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._entries.move_to_end(key)
+        return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """
+        Add a value to the cache, discarding the least recently used entry if the cache is full.
+
+        :param Hashable key: The key of the value.
+        :param Any value: The value to be cached.
+        :rtype: None
+        """
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """
+        Remove all the entries from the cache.
+
+        :rtype: None
+        """
+        self._entries.clear()
@@ -1,8 +1,9 @@
 import random
+import sys
 from functools import reduce
 
 from pathlib import Path
-from typing import List, Dict, Any, Callable
+from typing import List, Dict, Any, Callable, Optional
 
 
 def singleton(class_) -> Callable:
@@ -33,17 +34,21 @@ def get_project_root() -> Path:
     return Path(__file__).parent.parent
 
 
-def generate_random_adjacent_matrix(size: int) -> List[List[int]]:
+def generate_random_adjacent_matrix(size: int, density: float = 0.75,
+                                    rng: random.Random = None) -> List[List[int]]:
     """
     This function generates a squared adjacent matrix, with different proportions for
     1 and 0 vertexes. As it's a square matrix, it means that the numbers of columns are always the
     same numbers of the rows.
 
     :param int size: The size of the matrix, for example 4, will generate a 4x4 matrix.
+    :param float density: The probability of each vertex being 1(walkable).
+    :param random.Random rng: The random generator to use.
     :rtype: List[List[int]]
     """
-    choices = [0] * 25 + [1] * 75
-    return [[random.choice(choices) for x in range(size)] for y in range(size)]
+    if rng is None:
+        rng = random.Random()
+    return [[1 if rng.random() < density else 0 for x in range(size)] for y in range(size)]
 
 
 def is_square_matrix(matrix: List[List[int]]) -> bool:
@@ -89,29 +94,63 @@ def find_key_recursively(obj: Dict, key: str) -> Any:
 
 def convert_letter_to_number(letter: str) -> int:
     """
-    This function receives a string representing a letter of the alphabet, and convert it to
-    its respective number in ascending order, for example:
-    A - 1
-    B - 2
-    C - 3
-    D - 4
+    This function receives a string representing the letters of a row, and convert it to
+    its respective number in ascending order, starting from zero, where after Z it goes to AA,
+    like the columns of a spreadsheet, for example:
+    A - 0
+    B - 1
+    Z - 25
+    AA - 26
+    AB - 27
 
-    :param str letter: The letter to be converted.
+    :param str letter: The letters to be converted.
     :rtype: int
     """
-    return [ord(char) - 96 for char in letter.lower()][0] - 1
+    number = 0
+    for char in letter.upper():
+        number = number * 26 + (ord(char) - ord('A') + 1)
+    return number - 1
 
 
 def convert_number_to_letter(number: int) -> str:
     """
-    This function receives a number, and converts it to its respective alphabet letter in ascending order,
-    for example:
-    1 - A
-    2 - B
-    3 - C
-    4 - D
+    This function receives a number, and converts it to its respective alphabet letters in ascending order,
+    starting from zero, where after Z it goes to AA, like the columns of a spreadsheet, for example:
+    0 - A
+    1 - B
+    25 - Z
+    26 - AA
+    27 - AB
 
     :param int number: The number to be converted.
     :rtype: str
     """
-    return chr(ord('@') + number + 1)
+    letters = ''
+    number += 1
+    while number > 0:
+        number, remainder = divmod(number - 1, 26)
+        letters = chr(ord('A') + remainder) + letters
+    return letters
+
+
+def convert_coordinates_to_position(row: int, column: int) -> str:
+    """
+    Build the position of a map tile, with the letters of the row followed by the column, for example
+    row 0 and column 3 is "A3", and row 27 and column 10 is "AB10".
+
+    :param int row: The row of the tile.
+    :param int column: The column of the tile.
+    :rtype: str
+    """
+    return convert_number_to_letter(row) + str(column)
+
+
+def intern_string(value: Optional[str]) -> Optional[str]:
+    """
+    Intern a string from the configuration. The templates of the items and side effects repeat the same few names,
+    tiers and attributes, so they all share one string object for each of them, instead of a copy in each template.
+
+    :param Optional[str] value: The string, that may be missing.
+    :rtype: Optional[str]
+    """
+    return sys.intern(value) if isinstance(value, str) else value